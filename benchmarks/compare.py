@@ -0,0 +1,46 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _load(path: Path) -> dict:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data.get("results", data)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    ap.add_argument("baseline", type=Path)
+    ap.add_argument("current", type=Path)
+    ap.add_argument("--threshold", type=float, default=10.0,
+                    help="fail if a median is this many percent slower than the baseline")
+    args = ap.parse_args()
+
+    base, cur = _load(args.baseline), _load(args.current)
+    regressions = []
+    print(f"{'benchmark':<24} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    for name in sorted(set(base) | set(cur)):
+        if name not in base or name not in cur:
+            print(f"{name:<24} {'—' if name not in base else base[name]['median_ms']:>12} "
+                  f"{'—' if name not in cur else cur[name]['median_ms']:>12} {'':>9}")
+            continue
+        b, c = base[name]["median_ms"], cur[name]["median_ms"]
+        change = (c - b) / b * 100 if b else 0.0
+        flag = ""
+        if change > args.threshold:
+            regressions.append(name)
+            flag = "  slower"
+        elif change < -args.threshold:
+            flag = "  faster"
+        print(f"{name:<24} {b:>12.3f} {c:>12.3f} {change:>+8.1f}%{flag}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold}%: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import datetime
+import hashlib
+import json
+import os
+import random
+import socket
+import struct
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TEXTURE_DIRS = ("textures/common", "textures/jedi", "models/players/{skin}", "gfx/2d",
+                "models/weapons2/saber")
+MODEL_EXTS   = (".glm", ".md3", ".skin")
+SOUND_DIRS   = ("sound/chars/{skin}", "sound/weapons")
+WORDS        = ("jedi", "saber", "duel", "bespin", "kyle", "tavion", "reborn", "desann",
+                "ns_streets", "yavin", "artus", "doom", "pit", "skin", "hud", "font")
+CATEGORIES   = ("Skins", "Maps", "Sabers", "HUD", "Sounds", "Models", "Misc")
+
+
+def tga_bytes(w: int, h: int, seed: int) -> bytes:
+    header = struct.pack("<BBBHHBHHHHBB", 0, 0, 2, 0, 0, 0, 0, 0, w, h, 24, 0x20)
+    rnd = random.Random(seed)
+    row = bytes(rnd.getrandbits(8) for _ in range(w * 3))
+    return header + row * h
+
+
+def make_pk3(path: Path, members: int, rnd: random.Random, preview: bool) -> None:
+    skin = rnd.choice(WORDS)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        if preview:
+            z.writestr(f"levelshots/{skin}.tga", tga_bytes(64, 48, rnd.random()))
+        for i in range(members):
+            kind = rnd.random()
+            if kind < 0.55:
+                name = f"{rnd.choice(TEXTURE_DIRS).format(skin=skin)}/tex_{i}.tga"
+                data = tga_bytes(8, 8, i)
+            elif kind < 0.75:
+                name = f"models/players/{skin}/part_{i}{rnd.choice(MODEL_EXTS)}"
+                data = os.urandom(rnd.randint(64, 512))
+            elif kind < 0.9:
+                name = f"{rnd.choice(SOUND_DIRS).format(skin=skin)}/snd_{i}.wav"
+                data = os.urandom(rnd.randint(128, 1024))
+            else:
+                name = f"shaders/{skin}_{i}.shader"
+                data = f"textures/{skin}/x\n{{\n\tmap $lightmap\n}}\n".encode()
+            z.writestr(name, data)
+
+
+def make_mod_folder(root: Path, count: int, members: int = 40, disabled: float = 0.25,
+                    preview: float = 0.5, seed: int = 1) -> Path:
+    rnd = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    off = root / "_disabled"
+    off.mkdir(exist_ok=True)
+    for i in range(count):
+        name = f"{rnd.choice(WORDS)}_{rnd.choice(WORDS)}_{i:05d}.pk3"
+        target = off if rnd.random() < disabled else root
+        make_pk3(target / name, members, rnd, rnd.random() < preview)
+    return root
+
+
+def make_catalog(count: int, base_url: str = "http://127.0.0.1", seed: int = 1) -> list[dict]:
+    rnd = random.Random(seed)
+    start = datetime.date(2005, 1, 1)
+    mods = []
+    for i in range(count):
+        name = f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS).title()} {i}"
+        mods.append({
+            "name":         name,
+            "author":       f"{rnd.choice(WORDS)}{rnd.randint(1, 99)}",
+            "uploader":     rnd.choice(WORDS),
+            "category":     rnd.choice(CATEGORIES),
+            "size":         f"{rnd.uniform(0.1, 80):.2f} MB",
+            "date":         (start + datetime.timedelta(days=rnd.randint(0, 7000))).strftime("%d.%m.%Y"),
+            "description":  " ".join(rnd.choice(WORDS) for _ in range(30)),
+            "download_url": f"{base_url}/files/mod_{i:05d}.pk3",
+        })
+    return mods
+
+
+def status_reply(players: int, seed: int = 1) -> bytes:
+    rnd = random.Random(seed)
+    lines = ["map: ffa_bespin", "num score ping name            lastmsg address               qport rate",
+             "--- ----- ---- --------------- ------- --------------------- ----- -----"]
+    for n in range(players):
+        name = "".join(f"^{rnd.randint(0, 7)}{rnd.choice(WORDS)}" for _ in range(3))
+        lines.append(f"{n:3d} {rnd.randint(0, 300):5d} {rnd.randint(5, 200):4d} {name}^7 "
+                     f"{rnd.randint(0, 99):7d} 10.0.{n // 255}.{n % 255}:29070 {n:5d} 25000")
+    return b"\xff\xff\xff\xffprint\n" + "\n".join(lines).encode() + b"\n"
+
+
+class CatalogServer:
+    def __init__(self, catalog_size: int = 2000, payload_bytes: int = 8 * 1_048_576):
+        self.payload = os.urandom(payload_bytes)
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self.catalog = json.dumps(make_catalog(catalog_size, self.url)).encode()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/api.php"):
+                    body = server.catalog
+                    ctype = "application/json"
+                elif self.path.startswith("/files/"):
+                    body = server.payload
+                    ctype = "application/octet-stream"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "CatalogServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class ReleaseServer:
+    def __init__(self, version: str, assets: dict[str, bytes]):
+        self.version = version
+        self.assets = dict(assets)
+        self.requests: list[str] = []
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self.version_url = f"{self.url}/version.txt"
+        self.releases_url = f"{self.url}/releases/latest"
+
+    def release(self) -> dict:
+        return {
+            "tag_name": f"v{self.version}",
+            "assets": [{
+                "name":                 name,
+                "size":                 len(data),
+                "sha256":               hashlib.sha256(data).hexdigest(),
+                "browser_download_url": f"{self.url}/download/{name}",
+            } for name, data in self.assets.items()],
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(self.path)
+                status, headers = 200, {}
+                if self.path == "/version.txt":
+                    body = f"{server.version}\n".encode()
+                    ctype = "text/plain"
+                elif self.path == "/releases/latest":
+                    body = json.dumps(server.release()).encode()
+                    ctype = "application/json"
+                    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        status, body = 304, b""
+                elif self.path.startswith("/download/") and self.path[10:] in server.assets:
+                    body = server.assets[self.path[10:]]
+                    ctype = "application/octet-stream"
+                    rng = self.headers.get("Range", "")
+                    if rng.startswith("bytes="):
+                        start = int(rng[6:].split("-")[0])
+                        if start >= len(body):
+                            self.send_error(416)
+                            return
+                        headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+                        status, body = 206, body[start:]
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "ReleaseServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class RconStandIn:
+    def __init__(self, password: str = "bench", players: int = 32):
+        self.password = password
+        self.reply = status_reply(players)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        self._stop = threading.Event()
+
+    def _serve(self) -> None:
+        self._sock.settimeout(0.2)
+        prefix = b"\xff\xff\xff\xffrcon " + self.password.encode() + b" "
+        while not self._stop.is_set():
+            try:
+                data, addr = self._sock.recvfrom(65535)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            if data.startswith(prefix):
+                self._sock.sendto(self.reply, addr)
+            else:
+                self._sock.sendto(b"\xff\xff\xff\xffprint\nBad rconpassword.\n", addr)
+
+    def __enter__(self) -> "RconStandIn":
+        threading.Thread(target=self._serve, daemon=True).start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._stop.set()
+        self._sock.close()
@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import monolith; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+WINDOW_SNIPPET = (
+    "import time; t = time.perf_counter(); import monolith; "
+    "app = monolith.MonolithApp(); app.update(); "
+    "print((time.perf_counter() - t) * 1000); app.destroy()"
+)
+
+
+def _has_display() -> bool:
+    return os.name == "nt" or sys.platform == "darwin" or bool(os.environ.get("DISPLAY"))
+
+
+def _measure(snippet: str, runs: int, env: dict) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", snippet], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def _summary(samples: list[float]) -> dict:
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms":    round(min(samples), 2),
+        "max_ms":    round(max(samples), 2),
+        "runs":      [round(s, 2) for s in samples],
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Measure Monolith cold-start time.")
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--max-import-ms", type=float, default=None,
+                    help="fail if the median import time exceeds this")
+    ap.add_argument("--max-window-ms", type=float, default=None,
+                    help="fail if the median time to first window exceeds this")
+    ap.add_argument("--json", type=Path, default=None, help="write results to this file")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, XDG_CONFIG_HOME=tmp, APPDATA=tmp, PYTHONDONTWRITEBYTECODE="1")
+        results = {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "import": _summary(_measure(IMPORT_SNIPPET, args.runs, env)),
+        }
+        if _has_display():
+            results["window"] = _summary(_measure(WINDOW_SNIPPET, args.runs, env))
+
+    text = json.dumps(results, indent=4)
+    print(text)
+    if args.json:
+        args.json.write_text(text, encoding="utf-8")
+
+    failed = False
+    for key, limit in (("import", args.max_import_ms), ("window", args.max_window_ms)):
+        if limit is not None and key in results and results[key]["median_ms"] > limit:
+            print(f"{key} median {results[key]['median_ms']} ms exceeds {limit} ms",
+                  file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
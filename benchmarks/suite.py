@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SEARCH_TERMS = ("jedi", "saber_duel", "00", "zzz")
+
+
+def _time(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    return samples
+
+
+def _summary(samples: list[float], **extra) -> dict:
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms":    round(min(samples), 3),
+        "max_ms":    round(max(samples), 3),
+        "runs":      len(samples),
+        **extra,
+    }
+
+
+def run(args: argparse.Namespace, work: Path) -> dict:
+    import monolith_core as core
+    from benchmarks.fixtures import (
+        CatalogServer, RconStandIn, ReleaseServer, make_mod_folder, status_reply,
+    )
+
+    selected = set(args.only or ())
+
+    def want(name: str) -> bool:
+        return not selected or name in selected
+
+    results: dict[str, dict] = {}
+    t = time.perf_counter()
+    folder = make_mod_folder(work / "base", args.mods, args.members, seed=args.seed)
+    setup_ms = (time.perf_counter() - t) * 1000
+    repo = core.ModRepository(folder)
+    mods = repo.list_mods()
+
+    if want("list_mods"):
+        results["list_mods"] = _summary(_time(repo.list_mods, args.repeat), mods=len(mods))
+    if want("search"):
+        results["search"] = _summary(_time(
+            lambda: [repo.list_mods(term) for term in SEARCH_TERMS], args.repeat),
+            terms=len(SEARCH_TERMS))
+    if want("pick_preview"):
+        sample = mods[:args.previews]
+        results["pick_preview"] = _summary(_time(
+            lambda: [repo.get_preview_image(m) for m in sample], args.repeat),
+            mods=len(sample))
+    if want("export_manifest"):
+        dest = work / "manifest.json"
+
+        def _cold():
+            core.HASH_CACHE = core.HashCache(work / f"hash_cache_{time.perf_counter_ns()}.json")
+            repo.export_manifest(dest)
+        results["export_manifest_cold"] = _summary(_time(_cold, args.repeat), mods=len(mods))
+        results["export_manifest_warm"] = _summary(
+            _time(lambda: repo.export_manifest(dest), args.repeat), mods=len(mods))
+
+    with CatalogServer(args.catalog, args.download_mb * 1_048_576) as server:
+        catalog = core.fetch_catalog(url=f"{server.url}/api.php")
+        if want("catalog_fetch"):
+            results["catalog_fetch"] = _summary(_time(
+                lambda: core.fetch_catalog(url=f"{server.url}/api.php"), args.repeat),
+                entries=len(catalog))
+        if want("apply_filter"):
+            results["apply_filter"] = _summary(_time(
+                lambda: [core.filter_catalog(catalog, term) for term in ("",) + SEARCH_TERMS],
+                args.repeat), entries=len(catalog))
+        if want("download"):
+            dest = work / "download.pk3"
+            samples = _time(lambda: core.download_file(f"{server.url}/files/x.pk3", dest),
+                            args.repeat)
+            mb_s = args.download_mb / (statistics.median(samples) / 1000)
+            results["download"] = _summary(samples, megabytes=args.download_mb,
+                                           mb_per_s=round(mb_s, 1))
+
+    if want("delta_update"):
+        rnd = random.Random(args.seed)
+        old = work / "Monolith-old"
+        old.write_bytes(rnd.randbytes(args.download_mb * 1_048_576))
+        new_b = bytearray(old.read_bytes())
+        for _ in range(64):
+            at = rnd.randrange(len(new_b))
+            new_b[at:at + 256] = rnd.randbytes(256)
+        new = work / "Monolith-new"
+        new.write_bytes(new_b)
+        name = core.delta_asset_name("Monolith-linux.tar.gz", core.APP_VERSION)
+        patch = work / name
+        stats = core.make_patch(old, new, patch)
+        with ReleaseServer("99.0.0", {name: patch.read_bytes()}) as server:
+            asset = server.release()["assets"][0]
+
+            def _delta():
+                got = work / "delta.part.mpatch"
+                core.download_file(asset["browser_download_url"], got)
+                core.apply_patch(old, got, work / "Monolith-patched")
+            samples = _time(_delta, args.repeat)
+        results["delta_update"] = _summary(samples, megabytes=args.download_mb,
+                                           patch_bytes=stats["size"])
+
+    if want("rcon_rtt"):
+        with RconStandIn(players=args.players) as standin, \
+                core.RconSession("127.0.0.1", standin.port, standin.password) as session:
+            def _round_trip():
+                session.send("status")
+                session.recv()
+            samples = _time(_round_trip, args.repeat * 20)
+        results["rcon_rtt"] = _summary(samples, players=args.players)
+    if want("parse_rcon_colored"):
+        reply = status_reply(args.players).decode("utf-8", "ignore")
+        results["parse_rcon_colored"] = _summary(
+            _time(lambda: core.parse_rcon_colored(reply), args.repeat * 20),
+            bytes=len(reply))
+
+    return {
+        "version":  core.APP_VERSION,
+        "python":   sys.version.split()[0],
+        "platform": sys.platform,
+        "cpus":     os.cpu_count(),
+        "params": {
+            "mods": args.mods, "members": args.members, "catalog": args.catalog,
+            "download_mb": args.download_mb, "players": args.players,
+            "repeat": args.repeat, "seed": args.seed,
+        },
+        "setup_ms": round(setup_ms, 1),
+        "results":  results,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark Monolith hot paths on synthetic data.")
+    ap.add_argument("--mods", type=int, default=2000, help="PK3s in the synthetic base folder")
+    ap.add_argument("--members", type=int, default=40, help="entries per synthetic PK3")
+    ap.add_argument("--previews", type=int, default=100, help="mods to extract previews from")
+    ap.add_argument("--catalog", type=int, default=2000, help="entries in the synthetic catalog")
+    ap.add_argument("--download-mb", type=int, default=16)
+    ap.add_argument("--players", type=int, default=32, help="rows in the RCON status reply")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--only", nargs="*", metavar="NAME", help="run only these benchmarks")
+    ap.add_argument("--json", type=Path, default=None, help="write results to this file")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CONFIG_HOME"] = os.environ["APPDATA"] = str(Path(tmp) / "config")
+        results = run(args, Path(tmp))
+
+    text = json.dumps(results, indent=4)
+    print(text)
+    if args.json:
+        args.json.write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
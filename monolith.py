@@ -1,44 +1,57 @@
-import pil_config
+from __future__ import annotations
+
+import sys
+
+if __name__ == "__main__":
+    # Frozen builds re-enter here for repack worker processes.
+    from multiprocessing import freeze_support
+    freeze_support()
+    if len(sys.argv) > 1:
+        # Headless mode: never import tkinter when a CLI command is given.
+        from monolith_cli import main
+        sys.exit(main())
 
 import base64
-import configparser
 import ctypes
 from ctypes import wintypes
 import datetime
-import hashlib
 import io
-import json
 import logging
 import os
 import queue
 import re
+import secrets
 import shutil
-import socket
-import stat
 import subprocess
-import sys
-import threading
 import time
-from dataclasses import dataclass, field, asdict
-from enum import Enum
+from collections import deque
+from concurrent.futures import Future
 from threading import Timer
 from typing import Callable
 import zipfile
-import tarfile
 from pathlib import Path
 
 from tkinter import filedialog, ttk
 import tkinter as tk
 import customtkinter as ctk
-import requests
-from PIL import Image
-
 
-try:
-    from _version import __version__ as APP_VERSION
-except ImportError:
-    _version_file = Path(__file__).parent / "version.txt"
-    APP_VERSION = _version_file.read_text().strip() if _version_file.exists() else "0.0.0"
+from monolith_core import (
+    APP_VERSION, CONFIG_DIR, MACRO_DIR, RCON_LOG_DIR, flush_settings, save_rcon_servers,
+    JK2_COLORS, RCON_CMD_COLOR, RCON_MACRO_DELAY, LOG_EVENT_LIMIT, PROC_HISTORY_LIMIT,
+    Mod, Profile, AppConfig, ModRepository, BatchError, CatalogError, fetch_catalog,
+    filter_catalog, download_file,
+    RconSession, load_rcon_script, run_rcon_macro, parse_rcon_colored, load_rcon_servers,
+    LogTailer, ProcessSupervisor, InstanceManager,
+    _build_launch_params, _load_pil, _sha256, _version_tuple, _fmt_bytes, _fmt_duration,
+    _strip_colors, _find_qconsole_log, _parse_cpu_list, _safe_extract_tar, _safe_extract_zip,
+    match_mods, is_bundle, BUNDLE_SUFFIXES, DuplicateGroup, Footprint,
+    REPACK_LEVEL, RepackResult, BAKE_NAME, TELEMETRY,
+    TaskRunner, Task, CancelToken, Cancelled, current_task, TASK_SHUTDOWN_TIMEOUT, HASH_CACHE,
+    apply_patch, delta_asset_name, VERSION_URL, RELEASES_URL, UPDATE_DIR,
+    UPDATE_CHECK_INTERVAL, UPDATE_CHECK_DELAY, UPDATE_IDLE_RETRY,
+    fetch_asset, fetch_release, prune_updates, release_version,
+)
+from monolith_api import ApiError, ApiServer
 
 
 def _get_x11_dpi_scaling() -> float | None:
@@ -53,7 +66,7 @@ def _get_x11_dpi_scaling() -> float | None:
     return None
 
 
-def get_dpi_scaling() -> float:
+def _env_dpi_scaling() -> float | None:
     for var in ["GDK_SCALE", "QT_SCALE_FACTOR", "ELM_SCALE"]:
         val = os.environ.get(var)
         if val:
@@ -61,6 +74,12 @@ def get_dpi_scaling() -> float:
                 return max(0.5, min(float(val), 3.0))
             except ValueError:
                 continue
+    return None
+
+def get_dpi_scaling() -> float:
+    env = _env_dpi_scaling()
+    if env is not None:
+        return env
 
     scaling = 1.0
 
@@ -98,59 +117,6 @@ def get_dpi_scaling() -> float:
 
     return max(0.5, min(scaling, 3.0))
 
-def _platform_config_dir(app_name: str) -> Path:
-    if sys.platform.startswith("linux"):
-        base = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
-        return base / app_name
-    elif sys.platform == "darwin":
-        return Path.home() / "Library" / "Application Support" / app_name
-    elif os.name == "nt":
-        appdata = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
-        return Path(appdata) / app_name
-    return Path.home() / f".{app_name.lower()}"
-
-def _get_config_dir() -> Path:
-    old = _platform_config_dir("JK2ModManager")
-    new = _platform_config_dir("monolith")
-    if old.exists() and old.is_dir():
-        new.mkdir(parents=True, exist_ok=True)
-        for fname in ["config.json", "servers.ini", "error.log"]:
-            src = old / fname
-            if src.exists():
-                shutil.copy2(src, new / fname)
-        shutil.rmtree(old, ignore_errors=True)
-    else:
-        new.mkdir(parents=True, exist_ok=True)
-    return new
-
-CONFIG_DIR      = _get_config_dir()
-CONFIG_FILE     = CONFIG_DIR / "config.json"
-RCON_CONFIG_FILE = CONFIG_DIR / "servers.ini"
-LOG_FILE        = CONFIG_DIR / "error.log"
-
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
-DISABLED_DIR_NAME = "_disabled"
-
-PROTECTED_ASSETS: frozenset[str] = frozenset(
-    {f"assets{i}.pk3" for i in range(7)}
-    | {"assetsmv.pk3", "assetsmv2.pk3"}
-    | {"jk2pro-assets.pk3", "jk2pro-bins.pk3"}
-    | {"nwh-assets.pk3", "nwh-bins.pk3"}
-)
-
-JK2_COLORS: dict[str, str] = {
-    "0": "#383838", "1": "#ff4444", "2": "#44ff44", "3": "#ffff44",
-    "4": "#4488ff", "5": "#44ffff", "6": "#ff44ff", "7": "#ffffff",
-    "8": "#383838",
-}
-RCON_DEFAULT_COLOR = "#ffffff"
-RCON_CMD_COLOR     = "#00d4ff"
-
 C = {
     "bg":           "#0d0d1a",
     "surface":      "#12122a",
@@ -169,301 +135,53 @@ C = {
 }
 
 FONT_MONO = "Courier"
-
-class ModStatus(Enum):
-    ENABLED  = "✔"
-    DISABLED = "✘"
-
-@dataclass
-class Mod:
-    path: Path
-    status: ModStatus
-
-    @property
-    def name(self) -> str:
-        return self.path.name
-
-    @property
-    def size_bytes(self) -> int:
-        try:
-            return self.path.stat().st_size
-        except OSError:
-            return 0
-
-    @property
-    def size_str(self) -> str:
-        b = self.size_bytes
-        if b >= 1_048_576:
-            return f"{b / 1_048_576:.2f} MB"
-        if b >= 1024:
-            return f"{b / 1024:.1f} KB"
-        return f"{b} B"
-
-    @property
-    def is_enabled(self) -> bool:
-        return self.status == ModStatus.ENABLED
-
-@dataclass
-class Profile:
-    name:          str
-    mod_folder:    str = ""
-    game_exe:      str = ""
-    devmode:       bool = False
-    logfile:       bool = False
-    custom_params: str = ""
-
-    def to_dict(self) -> dict:
-        return asdict(self)
-
-    @staticmethod
-    def from_dict(name: str, d: dict) -> "Profile":
-        return Profile(
-            name=name,
-            mod_folder=d.get("mod_folder", ""),
-            game_exe=d.get("game_exe", ""),
-            devmode=d.get("devmode", False),
-            logfile=d.get("logfile", False),
-            custom_params=d.get("custom_params", ""),
-        )
-
-@dataclass
-class AppConfig:
-    profiles:       dict[str, Profile] = field(default_factory=dict)
-    active_profile: str = "Default"
-    geometry:       str = "1100x720"
-
-    def to_dict(self) -> dict:
-        return {
-            "profiles": {n: p.to_dict() for n, p in self.profiles.items()},
-            "active_profile": self.active_profile,
-            "geometry": self.geometry,
-        }
-
-    @staticmethod
-    def load() -> "AppConfig":
-        try:
-            if CONFIG_FILE.exists():
-                raw = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-                profiles = {
-                    n: Profile.from_dict(n, d)
-                    for n, d in raw.get("profiles", {}).items()
-                }
-                if not profiles:
-                    profiles = {"Default": Profile(name="Default")}
-                return AppConfig(
-                    profiles=profiles,
-                    active_profile=raw.get("active_profile", "Default"),
-                    geometry=raw.get("geometry", "1100x720"),
-                )
-        except Exception as e:
-            logging.error(f"Config load failed: {e}")
-        return AppConfig(profiles={"Default": Profile(name="Default")})
-
-    def save(self) -> None:
-        try:
-            CONFIG_FILE.write_text(
-                json.dumps(self.to_dict(), indent=4), encoding="utf-8"
-            )
-        except Exception as e:
-            logging.error(f"Config save failed: {e}")
-
-class ModRepository:
-    def __init__(self, folder: Path):
-        self.folder = folder
-        self._disabled_dir = folder / DISABLED_DIR_NAME
-        self._disabled_dir.mkdir(parents=True, exist_ok=True)
-
-    def list_mods(self, search: str = "") -> list[Mod]:
-        mods: list[Mod] = []
-        s = search.lower()
-
-        def _scan(base: Path, status: ModStatus) -> None:
-            if not base.exists():
-                return
-            try:
-                for f in base.iterdir():
-                    if not f.is_file():
-                        continue
-                    if f.suffix.lower() != ".pk3":
-                        continue
-                    if f.name in PROTECTED_ASSETS:
-                        continue
-                    if s and s not in f.name.lower():
-                        continue
-                    mods.append(Mod(path=f, status=status))
-            except Exception as e:
-                logging.error(f"Scan error in {base}: {e}")
-
-        _scan(self.folder, ModStatus.ENABLED)
-        _scan(self._disabled_dir, ModStatus.DISABLED)
-        mods.sort(key=lambda m: m.name.lower())
-        return mods
-
-    def toggle(self, mod: Mod, force: str | None = None) -> bool:
-        if force == "enable" and mod.is_enabled:
-            return False
-        if force == "disable" and not mod.is_enabled:
-            return False
-        target = self.folder if not mod.is_enabled else self._disabled_dir
-        dest = target / mod.name
-        try:
-            target.mkdir(parents=True, exist_ok=True)
-            if os.name != "nt":
-                mod.path.chmod(mod.path.stat().st_mode | stat.S_IWUSR)
-            mod.path.rename(dest)
-            return True
-        except Exception as e:
-            logging.error(f"Toggle failed for {mod.name}: {e}")
-            return False
-
-    def install(self, src: Path, overwrite: bool = False) -> bool:
-        dest = self.folder / src.name
-        if dest.exists() and not overwrite:
-            return False
-        try:
-            shutil.copy2(src, dest)
-            return True
-        except Exception as e:
-            logging.error(f"Install failed for {src.name}: {e}")
-            return False
-
-    def delete(self, mod: Mod) -> bool:
-        try:
-            mod.path.unlink()
-            return True
-        except Exception as e:
-            logging.error(f"Delete failed for {mod.name}: {e}")
-            return False
-
-    def rename(self, mod: Mod, new_name: str) -> bool:
-        try:
-            mod.path.rename(mod.path.parent / new_name)
-            return True
-        except Exception as e:
-            logging.error(f"Rename failed: {e}")
-            return False
-
-    def export_manifest(self, dest_path: Path) -> int:
-        mods = self.list_mods()
-        records = []
-        for i, mod in enumerate(mods, 1):
+UI_TICK_MS = 33
+NOTIFY_MAX = 4
+NOTIFY_TIMEOUT_MS = {"info": 5000, "error": 12000}
+
+class UiDispatcher:
+    def __init__(self, root: tk.Misc, tick_ms: int = UI_TICK_MS):
+        self.root = root
+        self.tick_ms = tick_ms
+        self._queue: queue.Queue = queue.Queue()
+        self._job: str | None = None
+
+    def call(self, fn: Callable, *args) -> None:
+        self._queue.put((None, fn, args))
+
+    def latest(self, key: str, fn: Callable, *args) -> None:
+        self._queue.put((key, fn, args))
+
+    def start(self) -> None:
+        self._job = self.root.after(self.tick_ms, self._drain)
+
+    def stop(self) -> None:
+        if self._job:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _drain(self) -> None:
+        batch: list[tuple[Callable, tuple] | None] = []
+        slots: dict[str, int] = {}
+        for _ in range(self._queue.qsize()):
             try:
-                st = mod.path.stat()
-                records.append({
-                    "name":          mod.name,
-                    "status":        mod.status.value,
-                    "load_order":    i,
-                    "size_mb":       round(st.st_size / 1_048_576, 4),
-                    "path":          str(mod.path),
-                    "sha256":        _sha256(mod.path),
-                    "last_modified": datetime.datetime.fromtimestamp(st.st_mtime)
-                                     .strftime("%Y-%m-%d %H:%M:%S"),
-                })
-            except Exception as e:
-                logging.error(f"Manifest error for {mod.name}: {e}")
-        dest_path.write_text(json.dumps(records, indent=4), encoding="utf-8")
-        return len(records)
-
-    def get_preview_image(self, mod: Mod) -> Image.Image | None:
-        try:
-            with zipfile.ZipFile(mod.path, "r") as z:
-                return _pick_preview(z)
-        except Exception as e:
-            logging.debug(f"Preview extraction failed for {mod.name}: {e}")
-            return None
-
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    try:
-        with open(path, "rb") as f:
-            while chunk := f.read(65536):
-                h.update(chunk)
-        return h.hexdigest()
-    except Exception as e:
-        logging.error(f"SHA256 failed for {path}: {e}")
-        return "ERROR"
-
-def _version_tuple(v: str) -> tuple[int, int, int]:
-    try:
-        parts = v.replace("v", "").split(".")
-        while len(parts) < 3:
-            parts.append("0")
-        return tuple(map(int, parts[:3]))
-    except ValueError:
-        return (0, 0, 0)
-
-def _pick_preview(z: zipfile.ZipFile) -> Image.Image | None:
-    IMG_EXT = {".jpg", ".jpeg", ".png", ".tga"}
-    FOLDER_SCORES = {
-        "levelshots/": 10000, "models/players/": 400,
-        "models/weapons2/": 300, "gfx/menus/": 100, "gfx/ui/": 50,
-    }
-    TRASH_KW = {"eye", "mouth", "face", "hand", "torso", "arm", "leg",
-                "hips", "cap", "_glow", "_spec", "_norm", "_reflect"}
-
-    best_name, best_score = None, -99999
-    for name in z.namelist():
-        lo = name.lower()
-        if name.endswith("/") or "__macosx" in lo or "thumbs.db" in lo:
-            continue
-        stem, ext = os.path.splitext(os.path.basename(lo))
-        if ext not in IMG_EXT:
-            continue
-        score = 1
-        for folder, w in FOLDER_SCORES.items():
-            if folder in lo:
-                score += w
+                key, fn, args = self._queue.get_nowait()
+            except queue.Empty:
                 break
-        if stem == "preview":           score += 1600
-        elif stem == "icon_default":    score += 1500
-        elif stem == "levelshot":       score += 1000
-        elif stem.startswith("map_"):   score += 400
-        if any(k in lo for k in ("icon_blue", "icon_red", "_blue", "_red", "/team/")):
-            score -= 800
-        if any(k in stem for k in TRASH_KW):
-            score -= 15000
-        if ext in (".jpg", ".jpeg", ".png", ".tga"):
-            score += 10
-        if score > best_score:
-            best_score, best_name = score, name
-
-    if not best_name:
-        return None
-    with z.open(best_name) as fh:
-        data = io.BytesIO(fh.read())
-        img = Image.open(data)
-        img.load()
-        if img.mode not in ("RGB", "RGBA"):
-            img = img.convert("RGBA" if "A" in img.mode else "RGB")
-        return img
-
-def parse_rcon_colored(raw: str) -> list[tuple[str, str]]:
-    if raw.startswith("\xff\xff\xff\xff"):
-        raw = raw[4:]
-    if raw.startswith("print\n"):
-        raw = raw[6:]
-    lines = [ln.rstrip() for ln in raw.split("\n") if ln.strip()]
-    joined = "\n".join(lines)
-    if not joined:
-        return []
-    segments: list[tuple[str, str]] = []
-    color = RCON_DEFAULT_COLOR
-    buf = ""
-    i = 0
-    while i < len(joined):
-        ch = joined[i]
-        if ch == "^" and i + 1 < len(joined) and joined[i + 1] in JK2_COLORS:
-            if buf:
-                segments.append((buf, color))
-                buf = ""
-            color = JK2_COLORS[joined[i + 1]]
-            i += 2
-        else:
-            buf += ch
-            i += 1
-    if buf:
-        segments.append((buf, color))
-    return segments
+            if key is not None:
+                if key in slots:
+                    batch[slots[key]] = None
+                slots[key] = len(batch)
+            batch.append((fn, args))
+        for item in batch:
+            if item is None:
+                continue
+            fn, args = item
+            try:
+                fn(*args)
+            except Exception:
+                logging.exception("UI update failed")
+        self._job = self.root.after(self.tick_ms, self._drain)
 
 def _center_on_parent(dialog: ctk.CTkToplevel, parent: ctk.CTk,
                        w: int, h: int) -> None:
@@ -496,6 +214,43 @@ class _BaseDialog(ctk.CTkToplevel):
             command=cmd,
         )
 
+class Notifier(ctk.CTkFrame):
+    def __init__(self, parent: ctk.CTk):
+        super().__init__(parent, fg_color="transparent")
+        self._pending: deque[tuple[str, str]] = deque()
+        self._shown: list[ctk.CTkFrame] = []
+
+    def push(self, message: str, level: str = "error") -> None:
+        self._pending.append((message, level))
+        self._pump()
+
+    def _pump(self) -> None:
+        while self._pending and len(self._shown) < NOTIFY_MAX:
+            message, level = self._pending.popleft()
+            toast = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8, border_width=1,
+                                 border_color=C["danger"] if level == "error" else C["primary"])
+            ctk.CTkLabel(toast, text=message, font=ctk.CTkFont(size=11), text_color=C["text"],
+                         wraplength=300, justify="left", anchor="w"
+                         ).pack(side="left", fill="x", expand=True, padx=(12, 4), pady=8)
+            ctk.CTkButton(toast, text="×", width=24, height=24,
+                          fg_color="transparent", hover_color=C["border"],
+                          command=lambda t=toast: self._dismiss(t)
+                          ).pack(side="right", anchor="n", padx=(0, 6), pady=6)
+            toast.pack(side="bottom", fill="x", pady=(6, 0))
+            self._shown.append(toast)
+            self.after(NOTIFY_TIMEOUT_MS[level], lambda t=toast: self._dismiss(t))
+        if self._shown:
+            self.place(relx=1.0, rely=1.0, x=-20, y=-20, anchor="se")
+            self.lift()
+        else:
+            self.place_forget()
+
+    def _dismiss(self, toast: ctk.CTkFrame) -> None:
+        if toast in self._shown:
+            self._shown.remove(toast)
+            toast.destroy()
+            self._pump()
+
 class InfoDialog(_BaseDialog):
     def __init__(self, parent: ctk.CTk, message: str):
         super().__init__(parent)
@@ -574,6 +329,43 @@ class InputDialog(_BaseDialog):
             self.grab_release()
         self.destroy()
 
+class RepackDialog(_BaseDialog):
+    def __init__(self, parent: ctk.CTk, count: int):
+        super().__init__(parent, w=420, h=200)
+        self.options: tuple[int, bool] | None = None
+        ctk.CTkLabel(self, text=f"Repack {count} mod(s)", font=ctk.CTkFont(size=12),
+                     text_color=C["text"]).pack(padx=20, pady=(20, 6), anchor="w")
+        row = ctk.CTkFrame(self, fg_color="transparent")
+        row.pack(fill="x", padx=20)
+        ctk.CTkLabel(row, text="Compression level", font=ctk.CTkFont(size=12),
+                     text_color=C["text_dim"]).pack(side="left")
+        self._level = ctk.StringVar(value=str(REPACK_LEVEL))
+        ctk.CTkOptionMenu(row, variable=self._level, values=[str(i) for i in range(1, 10)],
+                          width=70, fg_color=C["bg"], button_color=C["border"],
+                          font=ctk.CTkFont(size=12)).pack(side="right")
+        self._rle = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(self, text="RLE-compress uncompressed TGA textures",
+                        variable=self._rle, font=ctk.CTkFont(size=12),
+                        checkbox_height=16, checkbox_width=16,
+                        fg_color=C["primary"], hover_color=C["accent"]
+                        ).pack(padx=20, pady=(10, 0), anchor="w")
+        btns = ctk.CTkFrame(self, fg_color="transparent")
+        btns.pack(pady=(14, 16), anchor="e", padx=20)
+        self._btn(btns, "Cancel", self._close, C["border"], C["scrollbar"]).pack(side="left", padx=4)
+        self._btn(btns, "Repack", self._ok,    C["accent"], C["primary"]).pack(side="left", padx=4)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self.bind("<Return>", lambda _: self._ok())
+        self.bind("<Escape>", lambda _: self._close())
+
+    def _ok(self) -> None:
+        self.options = (int(self._level.get()), self._rle.get())
+        self._close()
+
+    def _close(self) -> None:
+        if self.grab_status():
+            self.grab_release()
+        self.destroy()
+
 class UpdateDialog(ctk.CTkToplevel):
     def __init__(self, parent: ctk.CTk, release_data: dict):
         super().__init__(parent)
@@ -664,6 +456,8 @@ class ModManagerTab(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._mod_index: dict[str, Mod] = {}
+        self._footprints: dict[Path, Footprint] = {}
+        self._sort: tuple[str, bool] = ("name", False)
         self._search_timer: Timer | None = None
         self._build_ui()
 
@@ -702,6 +496,18 @@ class ModManagerTab(ctk.CTkFrame):
                       fg_color=C["bg"], hover_color=C["border"],
                       font=ctk.CTkFont(size=12), corner_radius=6,
                       command=self._export).pack(side="right")
+        ctk.CTkButton(bar, text="Load Order", width=100,
+                      fg_color=C["bg"], hover_color=C["border"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self.open_load_order).pack(side="right", padx=(0, 8))
+        ctk.CTkButton(bar, text="Repack All", width=100,
+                      fg_color=C["bg"], hover_color=C["border"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=lambda: self.repack_mods(all_mods=True)).pack(side="right", padx=(0, 8))
+        ctk.CTkButton(bar, text="Duplicates", width=100,
+                      fg_color=C["bg"], hover_color=C["border"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._find_duplicates).pack(side="right", padx=(0, 8))
 
         split = ctk.CTkFrame(self, fg_color="transparent")
         split.pack(fill="both", expand=True, pady=(0, 8))
@@ -721,7 +527,7 @@ class ModManagerTab(ctk.CTkFrame):
 
         self._tree = ttk.Treeview(
             list_panel,
-            columns=("status", "size", "name"),
+            columns=("status", "size", "unpacked", "ratio", "name"),
             show="headings",
             selectmode="extended",
             yscrollcommand=self._scrollbar.set,
@@ -729,12 +535,15 @@ class ModManagerTab(ctk.CTkFrame):
         self._scrollbar.config(command=self._tree.yview)
         self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
 
-        self._tree.heading("status", text="State",  anchor="w")
-        self._tree.heading("size",   text="Size",   anchor="w")
-        self._tree.heading("name",   text="Filename (Load Order)", anchor="w")
-        self._tree.column("status", width=90,  stretch=tk.NO, anchor="w")
-        self._tree.column("size",   width=90,  stretch=tk.NO, anchor="w")
-        self._tree.column("name",   width=400, stretch=tk.YES, anchor="w")
+        for col, txt in [("status", "State"), ("size", "Size"), ("unpacked", "Unpacked"),
+                         ("ratio", "Packed"), ("name", "Filename (Load Order)")]:
+            self._tree.heading(col, text=txt, anchor="w",
+                               command=lambda c=col: self._sort_by(c))
+        self._tree.column("status",   width=90,  stretch=tk.NO, anchor="w")
+        self._tree.column("size",     width=90,  stretch=tk.NO, anchor="w")
+        self._tree.column("unpacked", width=90,  stretch=tk.NO, anchor="w")
+        self._tree.column("ratio",    width=70,  stretch=tk.NO, anchor="w")
+        self._tree.column("name",     width=400, stretch=tk.YES, anchor="w")
 
         self._tree.tag_configure("enabled",  foreground=C["success"])
         self._tree.tag_configure("disabled", foreground=C["danger"])
@@ -781,6 +590,8 @@ class ModManagerTab(ctk.CTkFrame):
         _btn("Enable",           lambda: self.toggle_selected("enable"),  C["success"], "#6a2c70").pack(side="left", padx=(0, 6))
         _btn("Disable",          lambda: self.toggle_selected("disable"), C["warning"], "#fa714b").pack(side="left", padx=(0, 6))
         _btn("⟳ Refresh", self.refresh, C["bg"], C["border"], 90).pack(side="right")
+        _btn("Unbake",    self.unbake_mods, C["bg"], C["border"], 80).pack(side="right", padx=(0, 6))
+        _btn("Bake",      self.bake_mods,   C["bg"], C["border"], 80).pack(side="right", padx=(0, 6))
 
         self._status_var = ctk.StringVar(value="Ready")
         ctk.CTkLabel(self, textvariable=self._status_var, anchor="w",
@@ -794,6 +605,7 @@ class ModManagerTab(ctk.CTkFrame):
                              relief="flat", borderwidth=0)
         self._ctx.add_command(label="Toggle State",  command=self.toggle_selected)
         self._ctx.add_command(label="Rename File",   command=self._rename_dialog)
+        self._ctx.add_command(label="Repack…",       command=self.repack_mods)
         self._ctx.add_separator()
         self._ctx.add_command(label="Delete File",   command=self.delete_selected)
 
@@ -810,20 +622,64 @@ class ModManagerTab(ctk.CTkFrame):
         mods = repo.list_mods(self._search_var.get())
         self._populate(mods)
         self._update_status_bar(mods)
+        self.app.tasks.submit("Measuring mods", self._load_footprints, repo, mods)
 
     def _clear(self) -> None:
         self._tree.delete(*self._tree.get_children())
         self._mod_index.clear()
 
     def _populate(self, mods: list[Mod]) -> None:
-        self._clear()
-        for mod in mods:
-            tag = "enabled" if mod.is_enabled else "disabled"
-            iid = str(id(mod))
-            self._mod_index[iid] = mod
-            self._tree.insert("", "end", iid=iid,
-                              values=(mod.status.value.upper(), mod.size_str, mod.name),
-                              tags=(tag,))
+        with TELEMETRY.span("mods.populate", rows=len(mods)):
+            self._clear()
+            for mod in mods:
+                tag = "enabled" if mod.is_enabled else "disabled"
+                iid = str(id(mod))
+                self._mod_index[iid] = mod
+                self._tree.insert("", "end", iid=iid, values=self._row_values(mod), tags=(tag,))
+            if self._sort != ("name", False):
+                self._apply_sort()
+
+    def _row_values(self, mod: Mod) -> tuple:
+        fp = self._footprints.get(mod.path)
+        return (mod.status.value.upper(), mod.size_str,
+                _fmt_bytes(fp.uncompressed) if fp else "…",
+                f"{fp.ratio:.0%}" if fp else "…", mod.name)
+
+    def _load_footprints(self, repo: ModRepository, mods: list[Mod]) -> None:
+        fps = repo.footprints(mods, current_task().token)
+        self.app.ui.call(lambda: self._apply_footprints(fps))
+
+    def _apply_footprints(self, fps: dict[Path, Footprint]) -> None:
+        self._footprints.update(fps)
+        for iid, mod in self._mod_index.items():
+            if mod.path in fps and self._tree.exists(iid):
+                self._tree.item(iid, values=self._row_values(mod))
+        if self._sort[0] in ("unpacked", "ratio"):
+            self._apply_sort()
+
+    def _sort_by(self, col: str) -> None:
+        key, desc = self._sort
+        self._sort = (col, not desc if key == col else col in ("size", "unpacked"))
+        self._apply_sort()
+
+    def _apply_sort(self) -> None:
+        col, desc = self._sort
+        def _key(iid: str):
+            mod = self._mod_index[iid]
+            fp = self._footprints.get(mod.path)
+            if col == "status":
+                return (not mod.is_enabled, mod.name.lower())
+            if col == "size":
+                return mod.size_bytes
+            if col == "unpacked":
+                return fp.uncompressed if fp else -1
+            if col == "ratio":
+                return fp.ratio if fp else 2.0
+            return mod.name.lower()
+        rows = sorted((i for i in self._tree.get_children() if i in self._mod_index),
+                      key=_key, reverse=desc)
+        for n, iid in enumerate(rows):
+            self._tree.move(iid, "", n)
 
     def _update_status_bar(self, mods: list[Mod]) -> None:
         enabled  = sum(1 for m in mods if m.is_enabled)
@@ -841,7 +697,7 @@ class ModManagerTab(ctk.CTkFrame):
     def _on_search_changed(self, *_) -> None:
         if self._search_timer:
             self._search_timer.cancel()
-        self._search_timer = Timer(0.35, lambda: self.after(0, self.refresh))
+        self._search_timer = Timer(0.35, lambda: self.app.ui.call(self.refresh))
         self._search_timer.start()
 
     def _on_select(self, _event) -> None:
@@ -850,26 +706,30 @@ class ModManagerTab(ctk.CTkFrame):
             return
         mod = mods[0]
         self._info_name.configure(text=mod.name)
-        self._info_meta.configure(text=mod.size_str)
-        threading.Thread(target=self._load_preview, args=(mod,), daemon=True).start()
+        fp = self._footprints.get(mod.path)
+        self._info_meta.configure(text=f"{mod.size_str} on disk\n{fp.summary()}" if fp
+                                  else mod.size_str)
+        width = max(self._preview_box.winfo_width() - 16, 120)
+        self.app.tasks.submit("Loading preview", self._load_preview, mod, width)
 
-    def _load_preview(self, mod: Mod) -> None:
+    def _load_preview(self, mod: Mod, w: int) -> None:
         repo = self.app.repo
         if not repo:
             return
         img = repo.get_preview_image(mod)
         if img:
-            w = max(self._preview_box.winfo_width() - 16, 120)
             ratio = w / img.width
             h = int(img.height * ratio)
-            img = img.resize((w, h), Image.Resampling.LANCZOS)
-            cimg = ctk.CTkImage(light_image=img, dark_image=img, size=(w, h))
-            self.after(0, lambda ci=cimg: (
-                self._preview_label.configure(image=ci, text=""),
-                setattr(self._preview_label, "_img_ref", ci),
-            ))
-        else:
-            self.after(0, lambda: self._preview_label.configure(image=None, text="No preview"))
+            img = img.resize((w, h), _load_pil().Resampling.LANCZOS)
+        self.app.ui.latest("mods.preview", self._show_preview, img)
+
+    def _show_preview(self, img) -> None:
+        if img is None:
+            self._preview_label.configure(image=None, text="No preview")
+            return
+        cimg = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        self._preview_label.configure(image=cimg, text="")
+        self._preview_label._img_ref = cimg
 
     def _show_context_menu(self, event) -> None:
         iid = self._tree.identify_row(event.y)
@@ -906,33 +766,62 @@ class ModManagerTab(ctk.CTkFrame):
         if not repo:
             return self.app.show_error("Select a base folder first.")
         files = list(filedialog.askopenfilenames(
-            parent=self.app, title="Select PK3 files",
-            filetypes=[("PK3 files", "*.pk3")]))
+            parent=self.app, title="Select PK3 files or mod packages",
+            filetypes=[("Mods", " ".join(["*.pk3"] + [f"*{x}" for x in BUNDLE_SUFFIXES])),
+                       ("PK3 files", "*.pk3")]))
         if not files:
             return
-        confirmed: list[Path] = []
-        for f in (Path(p) for p in files):
-            if (repo.folder / f.name).exists():
-                dlg = YesNoDialog(self.app, f"'{f.name}' already exists. Overwrite?")
-                self.app.wait_window(dlg)
-                if not dlg.result:
-                    continue
-            confirmed.append(f)
-        if not confirmed:
-            return
+        bundles = [Path(p) for p in files if is_bundle(Path(p))]
+        plain = [Path(p) for p in files if not is_bundle(Path(p))]
+        conflicts = [f for f in plain if (repo.folder / f.name).exists()]
+        fresh = [f for f in plain if f not in conflicts]
+        if fresh or bundles:
+            self._run_install(repo, fresh, bundles)
+        if conflicts:
+            ConflictsWindow(self.app, repo, conflicts,
+                            lambda plan: self._resolve_conflicts(repo, plan))
+
+    def _resolve_conflicts(self, repo: ModRepository, plan: dict[Path, str]) -> None:
+        overwrite = [src for src, action in plan.items() if action == "overwrite"]
+        renamed: dict[Path, str] = {}
+        taken: set[str] = set()
+        for src in (src for src, action in plan.items() if action == "rename"):
+            renamed[src] = repo.free_name(src.name, taken)
+            taken.add(renamed[src].lower())
+        if overwrite or renamed:
+            self._run_install(repo, overwrite + list(renamed), [], renamed)
+
+    def _run_install(self, repo: ModRepository, files: list[Path], bundles: list[Path],
+                     dest_names: dict[Path, str] | None = None) -> None:
         self.app.set_busy(True)
+        last = [0.0]
+        task: Task | None = None
+        def _progress(n: int, total: int) -> None:
+            task.progress(n, total)
+            now = time.monotonic()
+            if n == total or now - last[0] >= 0.1:
+                last[0] = now
+                self.app.ui.latest("mods.status", self._status_var.set, f"Installing… {n}/{total}")
         def _worker():
-            ok = err = 0
-            for i, f in enumerate(confirmed, 1):
-                n, total = i, len(confirmed)
-                self.after(0, lambda n=n, t=total:
-                    self._status_var.set(f"Installing… {n}/{t}"))
-                if repo.install(f):
-                    ok += 1
-                else:
-                    err += 1
-            self.after(0, lambda: self.app.finish_op(f"Installed {ok} mod(s). {err} error(s)."))
-        threading.Thread(target=_worker, daemon=True).start()
+            nonlocal task
+            task = current_task()
+            token = task.token
+            results = repo.install_many(files, overwrite=True, on_progress=_progress,
+                                        cancel=token, dest_names=dest_names)
+            for b in bundles:
+                if token.cancelled:
+                    break
+                self.app.ui.call(lambda b=b: self._status_var.set(f"Unpacking {b.name}…"))
+                results.update(_import_bundle(repo, b, token))
+            failed = {name: err for name, err in results.items() if err}
+            ok = len(results) - len(failed)
+            self.app.ui.call(lambda: self.app.finish_op(
+                f"Installed {ok} mod(s). {len(failed)} error(s)."))
+            if failed:
+                lines = "\n".join(f"{n}: {e}" for n, e in list(failed.items())[:10])
+                self.app.ui.call(lambda: self.app.notify(f"Some files were not installed:\n{lines}"))
+        self.app.tasks.submit(f"Installing {len(files) + len(bundles)} file(s)", _worker,
+                              on_exit=self.app.clear_busy)
 
     def delete_selected(self) -> None:
         mods = self._selected_mods()
@@ -946,8 +835,8 @@ class ModManagerTab(ctk.CTkFrame):
         self.app.set_busy(True)
         def _worker():
             count = sum(1 for m in mods if repo and repo.delete(m))
-            self.after(0, lambda: self.app.finish_op(f"Deleted {count} file(s)."))
-        threading.Thread(target=_worker, daemon=True).start()
+            self.app.ui.call(lambda: self.app.finish_op(f"Deleted {count} file(s)."))
+        self.app.tasks.submit(f"Deleting {len(mods)} file(s)", _worker, on_exit=self.app.clear_busy)
 
     def toggle_selected(self, force: str | None = None) -> None:
         mods = self._selected_mods()
@@ -956,10 +845,34 @@ class ModManagerTab(ctk.CTkFrame):
         repo = self.app.repo
         if not repo:
             return
-        failed = sum(1 for m in mods if not repo.toggle(m, force))
-        self.refresh()
-        if failed:
-            self.app.show_error(f"{failed} mod(s) could not be toggled.")
+        self.app.set_busy(True)
+        self._status_var.set(f"Updating {len(mods)} mod(s)…")
+        def _worker():
+            try:
+                delta = repo.toggle_many(mods, force)
+            except BatchError as e:
+                msg = str(e)
+                self.app.ui.call(lambda: (self.app.set_busy(False), self.refresh(),
+                                       self.app.notify(f"Toggle failed: {msg}")))
+                return
+            self.app.ui.call(lambda: self._apply_delta(delta))
+        self.app.tasks.submit(f"Updating {len(mods)} mod(s)", _worker, on_exit=self.app.clear_busy)
+
+    def _apply_delta(self, delta: list[tuple[Mod, Mod]]) -> None:
+        by_path = {old.path: new for old, new in delta}
+        for iid, mod in list(self._mod_index.items()):
+            new = by_path.get(mod.path)
+            if new is None or not self._tree.exists(iid):
+                continue
+            self._mod_index[iid] = new
+            if mod.path in self._footprints:
+                self._footprints[new.path] = self._footprints[mod.path]
+            self._tree.item(iid, values=self._row_values(new),
+                            tags=("enabled" if new.is_enabled else "disabled",))
+        self._update_status_bar(list(self._mod_index.values()))
+        self.app.set_busy(False)
+        if delta:
+            self.app.publish("mods.changed", {"changed": [new.name for _, new in delta]})
 
     def _rename_dialog(self) -> None:
         mods = self._selected_mods()
@@ -992,23 +905,145 @@ class ModManagerTab(ctk.CTkFrame):
         self._status_var.set("Exporting…")
         def _worker():
             try:
-                count = repo.export_manifest(Path(dest))
-                self.after(0, lambda: self.app.finish_op(f"Exported {count} mods to {dest}"))
+                count = repo.export_manifest(Path(dest), cancel=current_task().token)
+                self.app.ui.call(lambda: self.app.finish_op(f"Exported {count} mods to {dest}"))
+            except Cancelled:
+                self.app.ui.call(lambda: self.app.finish_op("Export cancelled."))
             except Exception as e:
-                self.after(0, lambda: self.app.show_error(f"Export failed: {e}"))
-                self.after(0, lambda: self.app.set_busy(False))
-        threading.Thread(target=_worker, daemon=True).start()
+                msg = str(e)
+                self.app.ui.call(lambda: self.app.notify(f"Export failed: {msg}"))
+                self.app.ui.call(lambda: self.app.set_busy(False))
+        self.app.tasks.submit("Exporting mod list", _worker, on_exit=self.app.clear_busy)
 
-class DownloadTab(ctk.CTkFrame):
-    _API_URL = "https://jk2t.ddns.net/modmanager/api.php"
+    def repack_mods(self, all_mods: bool = False) -> None:
+        repo = self.app.repo
+        if not repo:
+            return self.app.show_error("Select a base folder first.")
+        mods = repo.list_mods() if all_mods else self._selected_mods()
+        if not mods:
+            return
+        if self.app.instances.running():
+            return self.app.show_error("Close the game before repacking mods.")
+        dlg = RepackDialog(self.app, len(mods))
+        self.app.wait_window(dlg)
+        if not dlg.options:
+            return
+        level, rle = dlg.options
+        self.app.set_busy(True)
+        self._status_var.set(f"Repacking {len(mods)} mod(s)…")
+        def _progress(n: int, total: int) -> None:
+            current_task().progress(n, total)
+            self.app.ui.latest("mods.status", self._status_var.set, f"Repacking… {n}/{total}")
+        def _worker():
+            if len(mods) == 1:
+                try:
+                    results = [repo.repack(mods[0], level, rle, cancel=current_task().token)]
+                except Exception as e:
+                    results = [RepackResult(mods[0].name, 0, 0, error=str(e))]
+            else:
+                results = repo.repack_many(mods, level, rle, on_progress=_progress,
+                                           cancel=current_task().token)
+            saved = sum(r.saved for r in results if not r.error)
+            failed = [f"{r.name}: {r.error}" for r in results if r.error]
+            dropped = sum(len(r.dropped) for r in results)
+            self.app.ui.call(lambda: self.app.finish_op(
+                f"Repacked {len(results) - len(failed)} mod(s), saved {_fmt_bytes(saved)}, "
+                f"removed {dropped} junk file(s)."))
+            if failed:
+                self.app.ui.call(lambda: self.app.notify("Repack failed:\n" + "\n".join(failed[:10])))
+        self.app.tasks.submit(f"Repacking {len(mods)} mod(s)", _worker, pool="cpu",
+                              on_exit=self.app.clear_busy)
+
+    def open_load_order(self) -> None:
+        repo = self.app.repo
+        if not repo:
+            return self.app.show_error("Select a base folder first.")
+        LoadOrderWindow(self.app, [m for m in repo.list_mods() if m.is_enabled])
+
+    def bake_mods(self) -> None:
+        repo = self.app.repo
+        if not repo:
+            return self.app.show_error("Select a base folder first.")
+        if self.app.instances.running():
+            return self.app.show_error("Close the game before baking mods.")
+        sources = repo.bake_sources()
+        if not sources:
+            return self.app.show_info("There are no enabled mods to bake.")
+        dlg = YesNoDialog(self.app, f"Merge {len(sources)} mod(s) into {BAKE_NAME}? "
+                                    "The originals are moved to _disabled.")
+        self.app.wait_window(dlg)
+        if not dlg.result:
+            return
+        self._run_bake(repo.bake, self._describe_bake)
+
+    def _describe_bake(self, res: tuple[bool, int, list[str]]) -> str:
+        rebuilt, count, skipped = res
+        if skipped:
+            self.app.notify(f"Left {len(skipped)} unreadable mod(s) loose:\n"
+                            + "\n".join(skipped[:10]))
+        return f"Baked {count} mod(s) into {BAKE_NAME}." if rebuilt else "Bake is up to date."
+
+    def unbake_mods(self) -> None:
+        repo = self.app.repo
+        if not repo:
+            return
+        if not repo.bake_manifest():
+            return self.app.show_info("Nothing is baked in this folder.")
+        if self.app.instances.running():
+            return self.app.show_error("Close the game before unbaking mods.")
+        self._run_bake(repo.unbake, lambda n: f"Restored {n} mod(s) from the bake.")
+
+    def _run_bake(self, op: Callable, describe: Callable) -> None:
+        self.app.set_busy(True)
+        self._status_var.set("Working…")
+        def _worker():
+            try:
+                res = op()
+            except Exception as e:
+                msg = str(e)
+                self.app.ui.call(lambda: (self.app.set_busy(False), self.refresh(),
+                                       self.app.notify(f"Bake failed: {msg}")))
+                return
+            self.app.ui.call(lambda: self.app.finish_op(describe(res)))
+        self.app.tasks.submit("Baking mods", _worker, pool="cpu", on_exit=self.app.clear_busy)
+
+    def _find_duplicates(self) -> None:
+        repo = self.app.repo
+        if not repo:
+            return self.app.show_error("Select a base folder first.")
+        self.app.set_busy(True)
+        self._status_var.set("Scanning for duplicates…")
+        def _worker():
+            try:
+                groups = repo.find_duplicates(cancel=current_task().token)
+            except Cancelled:
+                return
+            except Exception as e:
+                msg = str(e)
+                self.app.ui.call(lambda: (self.app.set_busy(False),
+                                       self.app.notify(f"Duplicate scan failed: {msg}")))
+                return
+            self.app.ui.call(lambda: self._show_duplicates(groups))
+        self.app.tasks.submit("Scanning for duplicates", _worker, pool="cpu",
+                              on_exit=self.app.clear_busy)
 
+    def _show_duplicates(self, groups: list[DuplicateGroup]) -> None:
+        self.app.set_busy(False)
+        self._update_status_bar(list(self._mod_index.values()))
+        if not groups:
+            return self.app.show_info("No duplicate mods found.")
+        DuplicatesWindow(self.app, groups)
+
+class DownloadTab(ctk.CTkFrame):
     def __init__(self, parent, app: "MonolithApp"):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._cache: list[dict] = []
         self._search_timer: Timer | None = None
         self._active_downloads: set[str] = set()
+        self._downloads: dict[str, dict] = {}
         self._build_ui()
+        self.fetch()
 
     def _build_ui(self) -> None:
         top = ctk.CTkFrame(self, fg_color="transparent")
@@ -1116,88 +1151,37 @@ class DownloadTab(ctk.CTkFrame):
                       command=self.download_selected).pack(side="right")
 
     def fetch(self) -> None:
-        threading.Thread(target=self._fetch_worker, daemon=True).start()
+        self.app.tasks.submit("Fetching catalog", self._fetch_worker, pool="net")
 
     def _fetch_worker(self) -> None:
         try:
-            headers = {"User-Agent": f"Monolith-App-Client/{APP_VERSION}"}
-            resp = requests.get(self._API_URL, headers=headers, timeout=8)
-            resp.raise_for_status() 
-            self._cache = resp.json()
-
-        except requests.exceptions.HTTPError as e:
-            status = e.response.status_code
-            
-            if status == 503:
-                try:
-                    msg = e.response.json().get("message", "Server maintenance.")
-                except:
-                    msg = "Server is temporarily unavailable for maintenance."
-                self.after(0, lambda m=msg: self.app.show_error(m))
-
-            elif status == 426:
-                try:
-                    msg = e.response.json().get("message", "Update available.")
-                except:
-                    msg = "Your app version is outdated. Please update."
-                self.after(0, lambda m=msg: self.app.show_error(m))
-
-            else:
-                self.after(0, lambda: self.app.show_error(f"Server Error ({status})"))
-            
-            self._cache = []
-
-        except Exception as e:
-            error_msg = str(e)
-            self.after(0, lambda msg=error_msg: self.app.show_error(f"Fetch failed: {msg}"))
+            self._cache = fetch_catalog()
+        except CatalogError as e:
+            msg = str(e)
+            self.app.ui.call(lambda m=msg: self.app.notify(m))
             self._cache = []
-        
-        self.after(0, self._apply_filter)
+        self.app.ui.call(self._apply_filter)
 
     def _apply_filter(self) -> None:
-        term = self._search_var.get().lower()
-        
-        def _parse_date(m: dict):
-            raw = m.get("date", "")
-            for fmt in ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y"):
-                try:
-                    return datetime.datetime.strptime(raw, fmt)
-                except ValueError:
-                    continue
-            return datetime.datetime.min
-
-        if term:
-            def score(m: dict) -> int:
-                s = 0
-                if term in m.get("name",     "").lower(): s += 4
-                if term in m.get("category", "").lower(): s += 3
-                if term in m.get("author",   "").lower(): s += 2
-                if term in m.get("uploader", "").lower(): s += 1
-                return s
-            mods = sorted(
-                [m for m in self._cache if score(m) > 0],
-                key=lambda m: (-score(m), m.get("name", "").lower())
-            )
-        else:
-            mods = sorted(self._cache, key=_parse_date, reverse=True)
-        self._populate(mods)
+        self._populate(filter_catalog(self._cache, self._search_var.get()))
 
     def _populate(self, mods: list[dict]) -> None:
-        self._tree.delete(*self._tree.get_children())
-        for mod in mods:
-            self._tree.insert("", "end", iid=mod["download_url"], values=(
-                mod.get("name",     "?"),
-                mod.get("author",   "—"),
-                mod.get("category", "—"),
-                mod.get("size",     "—"),
-                mod.get("date",     "—"),
-            ))
+        with TELEMETRY.span("catalog.populate", rows=len(mods)):
+            self._tree.delete(*self._tree.get_children())
+            for mod in mods:
+                self._tree.insert("", "end", iid=mod["download_url"], values=(
+                    mod.get("name",     "?"),
+                    mod.get("author",   "—"),
+                    mod.get("category", "—"),
+                    mod.get("size",     "—"),
+                    mod.get("date",     "—"),
+                ))
         self._count_lbl.configure(text=f"{len(mods)} mod(s)")
 
     def _on_search_changed(self, *_) -> None:
         if self._search_timer:
             self._search_timer.cancel()
-        self._search_timer = Timer(0.35, lambda: self.after(0, self._apply_filter))
+        self._search_timer = Timer(0.35, lambda: self.app.ui.call(self._apply_filter))
         self._search_timer.start()
 
     def _on_select(self, _event) -> None:
@@ -1219,26 +1203,32 @@ class DownloadTab(ctk.CTkFrame):
         self._detail_meta.configure(text="\n".join(meta_lines))
         preview_url = mod.get("preview_image")
         if preview_url:
-            threading.Thread(target=self._load_preview,
-                             args=(preview_url,), daemon=True).start()
+            width = max(self._prev_box.winfo_width() - 10, 120)
+            self.app.tasks.submit("Loading preview", self._load_preview, preview_url, width,
+                                  pool="net")
         else:
             self._prev_lbl.configure(image=None, text="No preview")
 
-    def _load_preview(self, url: str) -> None:
+    def _load_preview(self, url: str, w: int) -> None:
+        import requests
         try:
+            Image = _load_pil()
             resp = requests.get(url, timeout=6)
             resp.raise_for_status()
             img = Image.open(io.BytesIO(resp.content))
-            w = max(self._prev_box.winfo_width() - 10, 120)
             h = int(img.height * (w / img.width))
             img = img.resize((w, h), Image.Resampling.LANCZOS)
-            cimg = ctk.CTkImage(light_image=img, dark_image=img, size=(w, h))
-            self.after(0, lambda ci=cimg: (
-                self._prev_lbl.configure(image=ci, text=""),
-                setattr(self._prev_lbl, "_img_ref", ci),
-            ))
         except Exception:
-            self.after(0, lambda: self._prev_lbl.configure(image=None, text="Preview error"))
+            img = None
+        self.app.ui.latest("catalog.preview", self._show_preview, img)
+
+    def _show_preview(self, img) -> None:
+        if img is None:
+            self._prev_lbl.configure(image=None, text="Preview error")
+            return
+        cimg = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        self._prev_lbl.configure(image=cimg, text="")
+        self._prev_lbl._img_ref = cimg
 
     def download_selected(self) -> None:
         if not self.app.repo:
@@ -1246,12 +1236,26 @@ class DownloadTab(ctk.CTkFrame):
         sel = self._tree.selection()
         if not sel:
             return self.app.show_error("Select at least one mod to download.")
-        for url in sel:
+        self.start_downloads({url: self._tree.item(url, "values")[0] for url in sel})
+
+    def start_downloads(self, items: dict[str, str]) -> list[str]:
+        started = []
+        for url, mod_name in items.items():
             if url not in self._active_downloads:
                 self._active_downloads.add(url)
-                mod_name = self._tree.item(url, "values")[0]
-                threading.Thread(target=self._download_worker,
-                                 args=(url, mod_name), daemon=True).start()
+                self._downloads[url] = {"url": url, "name": mod_name, "done": 0, "total": 0}
+                started.append(url)
+                self.app.tasks.submit(f"Downloading {mod_name}", self._download_worker,
+                                      url, mod_name, pool="net",
+                                      on_exit=lambda u=url: self._download_ended(u))
+        return started
+
+    def _download_ended(self, url: str) -> None:
+        self._active_downloads.discard(url)
+        self._downloads.pop(url, None)
+
+    def download_state(self) -> list[dict]:
+        return [dict(d) for d in self._downloads.values()]
 
     def _download_worker(self, url: str, name: str) -> None:
         repo = self.app.repo
@@ -1259,44 +1263,61 @@ class DownloadTab(ctk.CTkFrame):
             return
         filename = url.split("/")[-1]
         dest = repo.folder / filename
+        expected = next((m.get("sha256") for m in self._cache if m.get("download_url") == url), None)
+        state = self._downloads[url]
+        task = current_task()
+        last_pct = -1
+
+        def _progress(done: int, total: int) -> None:
+            nonlocal last_pct
+            state["done"], state["total"] = done, total
+            task.progress(done, total)
+            if total:
+                p = done / total
+                pct = int(p * 100)
+                self.app.ui.latest("download.progress", lambda p=p, pct=pct: (
+                    self._progress.set(p),
+                    self._progress_lbl.configure(text=f"{pct}%"),
+                ))
+                if pct != last_pct:
+                    last_pct = pct
+                    self.app.publish("download.progress", dict(state, percent=pct))
         try:
-            resp = requests.get(url, stream=True, timeout=15)
-            resp.raise_for_status()
-            total = int(resp.headers.get("content-length", 0))
-            done  = 0
-            with open(dest, "wb") as fh:
-                for chunk in resp.iter_content(chunk_size=65536):
-                    fh.write(chunk)
-                    done += len(chunk)
-                    if total:
-                        p = done / total
-                        pct = int(p * 100)
-                        self.after(0, lambda p=p, pct=pct: (
-                            self._progress.set(p),
-                            self._progress_lbl.configure(text=f"{pct}%"),
-                        ))
-            self.after(0, lambda: self.app.finish_op(f"Downloaded {name}."))
-        except Exception as e:
-            if dest.exists():
+            digest = download_file(url, dest, _progress, cancel=task.token, sha256=expected)
+            state["sha256"] = digest
+            if is_bundle(dest):
+                results = _import_bundle(repo, dest, task.token)
                 dest.unlink(missing_ok=True)
-            self.after(0, lambda: self.app.show_error(f"Download failed: {e}"))
+                installed = [n for n, err in results.items() if err is None]
+                state["installed"] = installed
+                note = f"Downloaded {name}: installed {len(installed)} PK3(s)."
+            else:
+                HASH_CACHE.put(dest, digest)
+                HASH_CACHE.save()
+                note = f"Downloaded {name}."
+            self.app.publish("download.done", dict(state, path=str(dest)))
+            self.app.ui.call(lambda: self.app.finish_op(note))
+        except Cancelled:
+            self.app.publish("download.failed", dict(state, error="cancelled"))
+        except Exception as e:
+            msg = str(e)
+            self.app.publish("download.failed", dict(state, error=msg))
+            self.app.ui.call(lambda: self.app.notify(f"Download failed: {msg}"))
         finally:
-            self._active_downloads.discard(url)
-            self.after(0, lambda: (
+            self.app.ui.call(lambda: (
                 self._progress.set(0),
                 self._progress_lbl.configure(text=""),
             ))
 
+_SERVER_NAME_BAD = re.compile(r"[^\w\-\.]")
+
 class RconTab(ctk.CTkFrame):
     def __init__(self, parent, app: "MonolithApp"):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._history: list[str] = []
         self._history_idx = -1
-        self._rcon_cfg = configparser.ConfigParser()
-        if not RCON_CONFIG_FILE.exists():
-            RCON_CONFIG_FILE.write_text("")
-        self._rcon_cfg.read(RCON_CONFIG_FILE)
+        self._rcon_cfg = load_rcon_servers()
         self._build_ui()
         self._load_servers()
 
@@ -1345,6 +1366,25 @@ class RconTab(ctk.CTkFrame):
                           font=ctk.CTkFont(size=11), corner_radius=6
                           ).pack(side="left", padx=(0, 6))
 
+        for txt, cmd in [
+            ("Save Macro", self._save_macro),
+            ("Run Macro",  self._run_macro),
+        ]:
+            ctk.CTkButton(btn_row, text=txt, width=90, command=cmd,
+                          fg_color=C["bg"], hover_color=C["border"],
+                          font=ctk.CTkFont(size=11), corner_radius=6
+                          ).pack(side="right", padx=(6, 0))
+
+        self._delay_entry = ctk.CTkEntry(btn_row, width=56,
+                                         font=ctk.CTkFont(size=12),
+                                         fg_color=C["bg"], border_color=C["border"],
+                                         corner_radius=6)
+        self._delay_entry.insert(0, str(RCON_MACRO_DELAY))
+        self._delay_entry.pack(side="right")
+        ctk.CTkLabel(btn_row, text="Delay (s)",
+                     font=ctk.CTkFont(size=11, weight="bold"),
+                     text_color=C["text_dim"]).pack(side="right", padx=(0, 4))
+
         self._output = CTkMonoTextbox(self, fg_color=C["bg"], corner_radius=8,
                                       font=ctk.CTkFont(size=15, family=FONT_MONO))
         self._output.grid(row=1, column=0, sticky="nsew", pady=(0, 8))
@@ -1374,7 +1414,6 @@ class RconTab(ctk.CTkFrame):
                       command=self._send).grid(row=0, column=1)
 
     def _load_servers(self) -> None:
-        self._rcon_cfg.read(RCON_CONFIG_FILE)
         self._server_combo.configure(values=self._rcon_cfg.sections())
 
     def _load_server_creds(self, name: str) -> None:
@@ -1392,6 +1431,8 @@ class RconTab(ctk.CTkFrame):
                 entry.insert(0, sec.get(key, ""))
             else:
                 entry.insert(0, name)
+        self._delay_entry.delete(0, tk.END)
+        self._delay_entry.insert(0, sec.get("macro_delay", str(RCON_MACRO_DELAY)))
 
     def _save_server(self) -> None:
         name = self._name_entry.get().strip()
@@ -1400,11 +1441,11 @@ class RconTab(ctk.CTkFrame):
         pw   = self._pass_entry.get()
         if not (name and ip and port):
             return self.app.show_error("Name, IP, and port are required.")
-        if not re.match(r'^[\w\-\.]+$', name):
+        if _SERVER_NAME_BAD.search(name):
             return self.app.show_error("Server name contains invalid characters.")
-        self._rcon_cfg[name] = {"ip": ip, "port": port, "password": pw}
-        with open(RCON_CONFIG_FILE, "w") as f:
-            self._rcon_cfg.write(f)
+        self._rcon_cfg[name] = {"ip": ip, "port": port, "password": pw,
+                                "macro_delay": str(self._macro_delay())}
+        save_rcon_servers(self._rcon_cfg)
         self._load_servers()
         self.app.show_info(f"Server '{name}' saved.")
 
@@ -1417,8 +1458,7 @@ class RconTab(ctk.CTkFrame):
         if not dlg.result:
             return
         self._rcon_cfg.remove_section(name)
-        with open(RCON_CONFIG_FILE, "w") as f:
-            self._rcon_cfg.write(f)
+        save_rcon_servers(self._rcon_cfg)
         self._load_servers()
 
     def _clear_output(self) -> None:
@@ -1438,25 +1478,79 @@ class RconTab(ctk.CTkFrame):
             self._history.append(cmd)
             self._history_idx = -1
         self._cmd_entry.delete(0, tk.END)
-        threading.Thread(target=self._worker,
-                         args=(ip, port, pw, cmd), daemon=True).start()
+        self.app.tasks.submit("RCON command", self._worker, ip, port, pw, cmd, pool="net")
 
     def _worker(self, ip: str, port: str, pw: str, cmd: str) -> None:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(5)
         try:
-            sock.sendto(
-                b"\xff\xff\xff\xffrcon %s %s\n" % (pw.encode(), cmd.encode()),
-                (ip, int(port)),
-            )
-            data, _ = sock.recvfrom(4096)
+            with RconSession(ip, int(port), pw) as session:
+                session.send(cmd)
+                data = session.recv()
             segs = parse_rcon_colored(data.decode("utf-8", "ignore"))
-            self.after(0, lambda s=segs, c=cmd: self._insert_colored(s, cmd_prefix=f">>> {c}"))
+            self.app.ui.call(lambda s=segs, c=cmd: self._insert_colored(s, cmd_prefix=f">>> {c}"))
         except Exception as e:
             msg = str(e)
-            self.after(0, lambda m=msg: self._insert_error(m))
-        finally:
-            sock.close()
+            self.app.ui.call(lambda m=msg: self._insert_error(m))
+
+    def _macro_delay(self) -> float:
+        try:
+            return max(0.0, float(self._delay_entry.get().strip()))
+        except ValueError:
+            return RCON_MACRO_DELAY
+
+    def _save_macro(self) -> None:
+        if not self._history:
+            return self.app.show_error("No commands in history to save.")
+        MACRO_DIR.mkdir(parents=True, exist_ok=True)
+        dest = filedialog.asksaveasfilename(
+            parent=self.app, title="Save Macro", initialdir=str(MACRO_DIR),
+            defaultextension=".cfg", filetypes=[("RCON script", "*.cfg *.txt")])
+        if not dest:
+            return
+        try:
+            Path(dest).write_text("\n".join(self._history) + "\n", encoding="utf-8")
+        except Exception as e:
+            self.app.show_error(f"Could not save macro: {e}")
+
+    def _run_macro(self) -> None:
+        ip   = self._ip_entry.get().strip()
+        port = self._port_entry.get().strip()
+        pw   = self._pass_entry.get()
+        if not (ip and port):
+            return self.app.show_error("IP and port are required.")
+        MACRO_DIR.mkdir(parents=True, exist_ok=True)
+        path_str = filedialog.askopenfilename(
+            parent=self.app, title="Run Macro", initialdir=str(MACRO_DIR),
+            filetypes=[("RCON script", "*.cfg *.txt"), ("All files", "*")])
+        if not path_str:
+            return
+        try:
+            commands = load_rcon_script(Path(path_str))
+        except Exception as e:
+            return self.app.show_error(f"Could not read macro: {e}")
+        if not commands:
+            return self.app.show_error("Macro contains no commands.")
+        self._history.extend(commands)
+        self._history_idx = -1
+        label = _SERVER_NAME_BAD.sub("_", self._name_entry.get().strip() or ip)
+        log_path = RCON_LOG_DIR / f"{label}_{datetime.datetime.now():%Y%m%d_%H%M%S}.log"
+        self.app.tasks.submit(f"RCON macro ({len(commands)} commands)", self._macro_worker,
+                              ip, port, pw, commands, self._macro_delay(), log_path, pool="net")
+
+    def _macro_worker(self, ip: str, port: str, pw: str, commands: list[str],
+                      delay: float, log_path: Path) -> None:
+        def _on_reply(cmd: str, text: str) -> None:
+            segs = parse_rcon_colored(text)
+            self.app.ui.call(lambda s=segs, c=cmd: self._insert_colored(s, cmd_prefix=f">>> {c}"))
+        try:
+            with RconSession(ip, int(port), pw) as session:
+                replies = run_rcon_macro(session, commands, delay, log_path, _on_reply,
+                                         cancel=current_task().token)
+            self.app.ui.call(lambda: self._insert_colored(
+                [], cmd_prefix=f"Macro finished: {len(commands)} command(s), "
+                               f"{replies} reply packet(s). Log: {log_path}"))
+        except Exception as e:
+            msg = str(e)
+            self.app.ui.call(lambda m=msg: self._insert_error(f"Macro aborted: {m}"))
 
     def _insert_colored(self, segs: list[tuple[str, str]],
                          cmd_prefix: str | None = None) -> None:
@@ -1497,38 +1591,763 @@ class CTkMonoTextbox(ctk.CTkTextbox):
         super().__init__(master, **kwargs)
         self._textbox.configure(state="disabled")
 
-class Sidebar(ctk.CTkFrame):
-    def __init__(self, parent, app: "MonolithApp"):
-        super().__init__(parent, width=220, corner_radius=0,
-                         fg_color=C["surface"])
-        self.app = app
-        self.grid_propagate(False)
-        self._build()
-
-    def _build(self) -> None:
-        self.grid_rowconfigure(12, weight=1)
+class ServerLogWindow(ctk.CTkToplevel):
+    _FILTERS = {
+        "All":      {"kill", "connect", "disconnect", "userinfo", "chat"},
+        "Kills":    {"kill"},
+        "Chat":     {"chat"},
+        "Connects": {"connect", "disconnect", "userinfo"},
+    }
 
-        ctk.CTkLabel(self, text="MONOLITH",
-                     font=ctk.CTkFont(size=22, weight="bold"),
-                     text_color=C["accent"]).grid(
-                         row=0, column=0, padx=20, pady=(24, 2))
-        ctk.CTkLabel(self, text="MOD MANAGER",
-                     font=ctk.CTkFont(size=10, weight="bold"),
-                     text_color=C["text_dim"]).grid(
-                         row=1, column=0, padx=20, pady=(0, 20))
+    def __init__(self, parent: "MonolithApp", tailer: LogTailer):
+        super().__init__(parent)
+        self.app = parent
+        self.tailer = tailer
+        self._last_seq = 0
+        self._kinds = self._FILTERS["All"]
+        self.title("Server Log")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 760, 460)
+        self.transient(parent)
 
-        ctk.CTkFrame(self, height=1, fg_color=C["border"]).grid(
-            row=2, column=0, sticky="ew", padx=16, pady=(0, 16))
+        top = ctk.CTkFrame(self, fg_color="transparent")
+        top.pack(fill="x", padx=12, pady=(12, 6))
+        ctk.CTkLabel(top, text=str(tailer.path), font=ctk.CTkFont(size=11),
+                     text_color=C["text_dim"]).pack(side="left")
+        ctk.CTkSegmentedButton(top, values=list(self._FILTERS),
+                               command=self._set_filter,
+                               selected_color=C["primary"],
+                               unselected_color=C["bg"]).pack(side="right")
 
-        section_label(self, "LAUNCH PARAMETERS").grid(
-            row=3, column=0, padx=20, sticky="w")
+        self._output = CTkMonoTextbox(self, fg_color=C["bg"], corner_radius=8,
+                                      font=ctk.CTkFont(size=13, family=FONT_MONO))
+        self._output.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+        tw = self._output._textbox
+        tw.tag_configure("kill", foreground=C["danger"])
+        tw.tag_configure("chat", foreground=C["text_bright"])
+        tw.tag_configure("connect", foreground=C["accent"])
+        tw.tag_configure("disconnect", foreground=C["text_dim"])
+        tw.tag_configure("userinfo", foreground=C["text_dim"])
+        self._poll()
+
+    def _set_filter(self, name: str) -> None:
+        self._kinds = self._FILTERS[name]
+        self._last_seq = 0
+        tw = self._output._textbox
+        tw.configure(state="normal")
+        tw.delete("1.0", "end")
+        tw.configure(state="disabled")
+        self._poll(reschedule=False)
 
-        self.devmode_var = ctk.BooleanVar(value=False)
-        ctk.CTkCheckBox(self, text="Developer Mode",
-                        variable=self.devmode_var,
-                        font=ctk.CTkFont(size=12),
-                        checkbox_height=16, checkbox_width=16,
-                        fg_color=C["primary"], hover_color=C["accent"]
+    def _poll(self, reschedule: bool = True) -> None:
+        if not self.winfo_exists():
+            return
+        events = self.tailer.events_since(self._last_seq)
+        if events:
+            self._last_seq = events[-1].seq
+            tw = self._output._textbox
+            tw.configure(state="normal")
+            for ev in events:
+                if ev.kind in self._kinds:
+                    stamp = datetime.datetime.fromtimestamp(ev.time).strftime("%H:%M:%S")
+                    tw.insert("end", f"{stamp}  {_strip_colors(ev.raw)}\n", ev.kind)
+            overflow = int(tw.index("end-1c").split(".")[0]) - LOG_EVENT_LIMIT
+            if overflow > 0:
+                tw.delete("1.0", f"{overflow + 1}.0")
+            tw.configure(state="disabled")
+            tw.see("end")
+        if reschedule:
+            self.after(500, self._poll)
+
+class ProcessMonitorWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp"):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Process Monitor")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 560, 440)
+        self.transient(parent)
+
+        self._summary = ctk.CTkLabel(self, text="", justify="left", anchor="w",
+                                     font=ctk.CTkFont(size=12, family=FONT_MONO),
+                                     text_color=C["text"])
+        self._summary.pack(fill="x", padx=14, pady=(14, 8))
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14)
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("time", "uptime", "cpu", "rss"),
+                                  show="headings", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        for col, txt, w in [("time", "Time", 90), ("uptime", "Uptime", 120),
+                            ("cpu", "CPU", 80), ("rss", "RSS", 110)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, anchor="w")
+
+        ctk.CTkButton(self, text="Export CSV", width=110,
+                      fg_color=C["primary"], hover_color="#2a68d3",
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._export).pack(anchor="e", padx=14, pady=12)
+        self._shown = 0.0
+        self._refresh()
+
+    def _refresh(self) -> None:
+        if not self.winfo_exists():
+            return
+        sup = self.app.supervisor
+        if not sup:
+            self._summary.configure(text="No game process has been launched.")
+        else:
+            samples = sup.samples()
+            last = samples[-1] if samples else None
+            state = "running" if sup.running else f"exited ({sup.last_exit})"
+            self._summary.configure(text=(
+                f"PID {sup.process.pid}  ·  {state}  ·  restarts {sup.restarts}\n"
+                f"Uptime {_fmt_duration(sup.uptime)}  ·  "
+                f"CPU {last.cpu_percent if last else 0:.1f}%  ·  "
+                f"RSS {_fmt_bytes(last.rss_bytes if last else 0)}"))
+            for smp in (x for x in samples if x.time > self._shown):
+                self._tree.insert("", 0, values=(
+                    datetime.datetime.fromtimestamp(smp.time).strftime("%H:%M:%S"),
+                    _fmt_duration(smp.uptime), f"{smp.cpu_percent:.1f}%",
+                    _fmt_bytes(smp.rss_bytes)))
+                self._shown = smp.time
+            rows = self._tree.get_children()
+            if len(rows) > PROC_HISTORY_LIMIT:
+                self._tree.delete(*rows[PROC_HISTORY_LIMIT:])
+        self.after(1000, self._refresh)
+
+    def _export(self) -> None:
+        sup = self.app.supervisor
+        if not sup:
+            return
+        dest = filedialog.asksaveasfilename(
+            parent=self, title="Export Metrics",
+            defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if not dest:
+            return
+        try:
+            count = sup.export_csv(Path(dest))
+            self.app.show_info(f"Exported {count} sample(s) to {dest}")
+        except Exception as e:
+            self.app.show_error(f"Export failed: {e}")
+
+class DiagnosticsWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp"):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Diagnostics")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 620, 440)
+        self.transient(parent)
+
+        top = ctk.CTkFrame(self, fg_color="transparent")
+        top.pack(fill="x", padx=14, pady=(14, 8))
+        self._enabled = ctk.BooleanVar(value=TELEMETRY.enabled)
+        ctk.CTkSwitch(top, text="Record metrics", variable=self._enabled,
+                      font=ctk.CTkFont(size=12), text_color=C["text"],
+                      command=self._toggle).pack(side="left")
+        ctk.CTkButton(top, text="Reset", width=80,
+                      fg_color=C["surface2"], hover_color=C["border"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=TELEMETRY.reset).pack(side="right")
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14)
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("op", "count", "p50", "p95", "max"),
+                                  show="headings", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        for col, txt, w in [("op", "Operation", 200), ("count", "Samples", 80),
+                            ("p50", "p50", 90), ("p95", "p95", 90), ("max", "Max", 90)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, anchor="w")
+
+        self._counters = ctk.CTkLabel(self, text="", justify="left", anchor="w",
+                                      font=ctk.CTkFont(size=11, family=FONT_MONO),
+                                      text_color=C["text_dim"])
+        self._counters.pack(fill="x", padx=14, pady=(8, 14))
+        self._refresh()
+
+    def _toggle(self) -> None:
+        TELEMETRY.configure(self._enabled.get())
+        self.app.config_data.telemetry = self._enabled.get()
+        self.app.config_data.save()
+
+    def _refresh(self) -> None:
+        if not self.winfo_exists():
+            return
+        summary = TELEMETRY.summary()
+        self._tree.delete(*self._tree.get_children())
+        for name, st in summary["ops"].items():
+            self._tree.insert("", "end", values=(
+                name, st["count"], f"{st['p50']:.2f}", f"{st['p95']:.2f}", f"{st['max']:.2f}"))
+        counters = summary["counters"]
+        self._counters.configure(text="  ·  ".join(
+            f"{k} {_fmt_bytes(int(v)) if k.endswith('.bytes') else int(v)}"
+            for k, v in sorted(counters.items()))
+            or ("Timings in ms." if TELEMETRY.enabled else "Metrics are off."))
+        self.after(1000, self._refresh)
+
+class TasksWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp"):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Background Tasks")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 620, 360)
+        self.transient(parent)
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14, pady=(14, 8))
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("name", "pool", "state", "progress", "elapsed"),
+                                  show="headings", selectmode="extended", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        for col, txt, w in [("name", "Task", 240), ("pool", "Pool", 60), ("state", "State", 80),
+                            ("progress", "Progress", 90), ("elapsed", "Elapsed", 80)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, anchor="w")
+
+        ctk.CTkButton(self, text="Cancel Selected", width=130,
+                      fg_color=C["danger"], hover_color="#ff3b3b",
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._cancel).pack(anchor="e", padx=14, pady=(0, 14))
+        self._refresh()
+
+    def _cancel(self) -> None:
+        for iid in self._tree.selection():
+            self.app.tasks.cancel(int(iid))
+
+    def _refresh(self) -> None:
+        if not self.winfo_exists():
+            return
+        now = time.monotonic()
+        tasks = {str(t.id): t for t in self.app.tasks.tasks()}
+        for iid in self._tree.get_children():
+            if iid not in tasks:
+                self._tree.delete(iid)
+        for iid, t in tasks.items():
+            state = "cancelling" if t.token.cancelled and t.state == "running" else t.state
+            if t.total:
+                progress = f"{t.done}/{t.total}" if t.total < 100_000 else f"{t.done / t.total:.0%}"
+            else:
+                progress = _fmt_bytes(t.done) if t.done else "—"
+            values = (t.name, t.pool, state, progress,
+                      _fmt_duration(now - t.started) if t.started else "—")
+            if self._tree.exists(iid):
+                self._tree.item(iid, values=values)
+            else:
+                self._tree.insert("", "end", iid=iid, values=values)
+        self.after(500, self._refresh)
+
+class InstancesWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp"):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Game Instances")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 760, 420)
+        self.transient(parent)
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14, pady=(14, 8))
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(
+            panel, columns=("profile", "state", "pid", "cpu", "rss", "affinity", "nice"),
+            show="headings", selectmode="extended", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        for col, txt, w in [("profile", "Profile", 160), ("state", "State", 110),
+                            ("pid", "PID", 70), ("cpu", "CPU", 70), ("rss", "RSS", 100),
+                            ("affinity", "CPUs", 90), ("nice", "Nice", 50)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, anchor="w")
+        self._tree.bind("<Double-1>", lambda _: self._edit_selected())
+
+        acts = ctk.CTkFrame(self, fg_color="transparent")
+        acts.pack(fill="x", padx=14, pady=(0, 14))
+        for text, cmd, fg, hover in [
+            ("Start",       self._start_selected, C["success"], "#6a2c70"),
+            ("Stop",        self._stop_selected,  C["danger"],  "#ff3b3b"),
+            ("Start All",   self._start_all,      C["primary"], "#2a68d3"),
+            ("Stop All",    self._stop_all,       C["warning"], "#fa714b"),
+            ("Restart All", self._restart_all,    C["bg"],      C["border"]),
+        ]:
+            ctk.CTkButton(acts, text=text, width=96, command=cmd,
+                          fg_color=fg, hover_color=hover,
+                          font=ctk.CTkFont(size=12), corner_radius=6
+                          ).pack(side="left", padx=(0, 6))
+        ctk.CTkLabel(acts, text="Double-click to set CPUs / nice",
+                     text_color=C["text_dim"], font=ctk.CTkFont(size=10)
+                     ).pack(side="right")
+        self._refresh()
+
+    def _refresh(self) -> None:
+        if not self.winfo_exists():
+            return
+        self._redraw()
+        self.after(2000, self._refresh)
+
+    def _redraw(self) -> None:
+        if not self.winfo_exists():
+            return
+        selection = self._tree.selection()
+        self._tree.delete(*self._tree.get_children())
+        profiles = self.app.config_data.profiles
+        orphans = [n for n, _ in self.app.instances.items() if n not in profiles]
+        for name in [*profiles, *orphans]:
+            profile = profiles.get(name)
+            sup = self.app.instances.get(name)
+            last = sup.history[-1] if sup and sup.history else None
+            if not sup:
+                state, pid = "stopped", "—"
+            else:
+                state = "running" if sup.running else f"exited ({sup.last_exit})"
+                pid = sup.process.pid
+            if profile:
+                label, cpus, nice = name, profile.cpu_affinity or "all", profile.nice
+            else:
+                label = f"{name} (profile removed)"
+                cpus = ",".join(map(str, sorted(sup.affinity))) if sup.affinity else "all"
+                nice = sup.nice
+            self._tree.insert("", "end", iid=name, values=(
+                label, state, pid,
+                f"{last.cpu_percent:.1f}%" if last else "—",
+                _fmt_bytes(last.rss_bytes) if last else "—",
+                cpus, nice))
+        self._tree.selection_set([i for i in selection if self._tree.exists(i)])
+
+    def _profiles(self, names) -> list[Profile]:
+        profiles = self.app.config_data.profiles
+        return [profiles[n] for n in names if n in profiles]
+
+    def _launch(self, profiles: list[Profile]) -> None:
+        def _worker():
+            errors = self.app.instances.launch_many(profiles)
+            failed = [f"{n}: {e}" for n, e in errors.items() if e]
+            if failed:
+                self.app.ui.call(lambda: self.app.notify("Launch failed:\n" + "\n".join(failed)))
+            self.app.ui.call(self._redraw)
+        self.app.tasks.submit("Launching instances", _worker)
+
+    def _start_selected(self) -> None:
+        self._launch(self._profiles(self._tree.selection()))
+
+    def _stop_selected(self) -> None:
+        names = list(self._tree.selection())
+        self.app.tasks.submit("Stopping instances", self.app.instances.stop, names,
+                              on_exit=lambda: self.app.ui.call(self._redraw))
+
+    def _start_all(self) -> None:
+        running = set(self.app.instances.running())
+        self._launch([p for n, p in self.app.config_data.profiles.items()
+                      if n not in running and p.game_exe])
+
+    def _stop_all(self) -> None:
+        self.app.tasks.submit("Stopping instances", self.app.instances.stop_all,
+                              on_exit=lambda: self.app.ui.call(self._redraw))
+
+    def _restart_all(self) -> None:
+        self._launch(self._profiles(self.app.instances.running()))
+
+    def _edit_selected(self) -> None:
+        profiles = self._profiles(self._tree.selection())
+        if not profiles:
+            return
+        first = profiles[0]
+        dlg = InputDialog(self.app, "CPU cores (e.g. 0,2-3) and nice, separated by ';':",
+                          initial=f"{first.cpu_affinity};{first.nice}")
+        self.app.wait_window(dlg)
+        if dlg.value is None:
+            return
+        cpus, _, nice = dlg.value.partition(";")
+        try:
+            _parse_cpu_list(cpus)
+            nice_val = int(nice.strip() or 0)
+        except ValueError:
+            return self.app.show_error("Invalid CPU list or nice value.")
+        for p in profiles:
+            p.cpu_affinity = cpus.strip()
+            p.nice = max(-20, min(nice_val, 19))
+        self.app.config_data.save()
+
+class LoadOrderWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp", mods: list[Mod]):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Load Order")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 560, 560)
+        self.transient(parent)
+        self._mods = {str(i): m for i, m in enumerate(mods)}
+        self._drag: str | None = None
+
+        ctk.CTkLabel(self, text="Drag mods into order. Later mods override earlier ones.",
+                     anchor="w", text_color=C["text_dim"], font=ctk.CTkFont(size=11)
+                     ).pack(fill="x", padx=14, pady=(12, 0))
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14, pady=(8, 8))
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("pos", "name"), show="headings",
+                                  selectmode="extended", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        self._tree.heading("pos",  text="#",        anchor="w")
+        self._tree.heading("name", text="Filename", anchor="w")
+        self._tree.column("pos",  width=60,  stretch=tk.NO, anchor="w")
+        self._tree.column("name", width=420, stretch=tk.YES, anchor="w")
+        for iid, m in self._mods.items():
+            self._tree.insert("", "end", iid=iid, values=(int(iid) + 1, m.name))
+        self._tree.bind("<ButtonPress-1>",   self._on_press)
+        self._tree.bind("<B1-Motion>",       self._on_drag)
+        self._tree.bind("<ButtonRelease-1>", lambda _: self._renumber())
+
+        acts = ctk.CTkFrame(self, fg_color="transparent")
+        acts.pack(fill="x", padx=14, pady=(0, 14))
+        for text, delta in [("Top", -10**9), ("Up", -1), ("Down", 1), ("Bottom", 10**9)]:
+            ctk.CTkButton(acts, text=text, width=64, command=lambda d=delta: self._shift(d),
+                          fg_color=C["bg"], hover_color=C["border"],
+                          font=ctk.CTkFont(size=12), corner_radius=6
+                          ).pack(side="left", padx=(0, 6))
+        ctk.CTkButton(acts, text="Apply", width=96, command=self._apply,
+                      fg_color=C["primary"], hover_color="#2a68d3",
+                      font=ctk.CTkFont(size=12), corner_radius=6).pack(side="right")
+
+    def _on_press(self, event) -> None:
+        self._drag = self._tree.identify_row(event.y) or None
+
+    def _on_drag(self, event) -> None:
+        target = self._tree.identify_row(event.y)
+        if not self._drag or not target or target == self._drag:
+            return
+        self._tree.move(self._drag, "", self._tree.index(target))
+
+    def _shift(self, delta: int) -> None:
+        sel = [i for i in self._tree.get_children() if i in self._tree.selection()]
+        if not sel:
+            return
+        last = len(self._tree.get_children()) - 1
+        for iid in (sel if delta < 0 else reversed(sel)):
+            self._tree.move(iid, "", max(0, min(last, self._tree.index(iid) + delta)))
+        self._tree.see(sel[0])
+        self._renumber()
+
+    def _renumber(self) -> None:
+        for n, iid in enumerate(self._tree.get_children(), 1):
+            self._tree.set(iid, "pos", n)
+
+    def _apply(self) -> None:
+        repo = self.app.repo
+        if not repo:
+            return
+        if self.app.instances.running():
+            return self.app.show_error("Close the game before changing the load order.")
+        order = [self._mods[i] for i in self._tree.get_children()]
+        plan = repo.plan_reorder(order)
+        if not plan:
+            return self.destroy()
+        dlg = YesNoDialog(self.app, f"Rename {len(plan)} of {len(order)} file(s) "
+                                    "to apply this load order?")
+        self.app.wait_window(dlg)
+        if not dlg.result:
+            return
+        self.destroy()
+        self.app.set_busy(True)
+        def _worker():
+            try:
+                delta = repo.reorder(order)
+            except BatchError as e:
+                msg = str(e)
+                self.app.ui.call(lambda: (self.app.set_busy(False),
+                                           self.app.notify(f"Reorder failed: {msg}")))
+                return
+            self.app.ui.call(self.app.finish_op,
+                             f"Load order applied: renamed {len(delta)} file(s).")
+        self.app.tasks.submit("Applying load order", _worker, on_exit=self.app.clear_busy)
+
+class ConflictsWindow(ctk.CTkToplevel):
+    ACTIONS = ("overwrite", "skip", "rename")
+
+    def __init__(self, parent: "MonolithApp", repo: ModRepository, conflicts: list[Path],
+                 on_done: Callable[[dict[Path, str]], None]):
+        super().__init__(parent)
+        self.app = parent
+        self.repo = repo
+        self.on_done = on_done
+        self.title("Files Already Installed")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 780, 460)
+        self.transient(parent)
+        self._srcs = {str(i): src for i, src in enumerate(conflicts)}
+        self._actions = {iid: "overwrite" for iid in self._srcs}
+        self._same: dict[str, bool] = {}
+
+        ctk.CTkLabel(self, text=f"{len(conflicts)} file(s) already exist in the base folder. "
+                                "Other files are being installed now.",
+                     anchor="w", text_color=C["text_dim"], font=ctk.CTkFont(size=11)
+                     ).pack(fill="x", padx=14, pady=(12, 0))
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14, pady=(8, 8))
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("name", "action", "existing", "incoming", "content"),
+                                  show="headings", selectmode="extended", yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        for col, txt, w in [("name", "Filename", 260), ("action", "Action", 90),
+                            ("existing", "Installed", 90), ("incoming", "Incoming", 90),
+                            ("content", "Content", 110)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, anchor="w")
+        self._tree.tag_configure("same", foreground=C["text_dim"])
+        self._tree.bind("<Double-1>", lambda _: self._cycle())
+        for iid, src in self._srcs.items():
+            self._tree.insert("", "end", iid=iid, values=self._row(iid))
+
+        acts = ctk.CTkFrame(self, fg_color="transparent")
+        acts.pack(fill="x", padx=14, pady=(0, 14))
+        for text, action in [("Overwrite All", "overwrite"), ("Skip All", "skip"),
+                             ("Rename All", "rename")]:
+            ctk.CTkButton(acts, text=text, width=100,
+                          fg_color=C["surface2"], hover_color=C["border"],
+                          font=ctk.CTkFont(size=12), corner_radius=6,
+                          command=lambda a=action: self._set_all(a)).pack(side="left", padx=(0, 6))
+        ctk.CTkButton(acts, text="Skip Identical", width=110,
+                      fg_color=C["surface2"], hover_color=C["border"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._skip_identical).pack(side="left")
+        ctk.CTkButton(acts, text="Apply", width=90,
+                      fg_color=C["primary"], hover_color="#2a68d3",
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._apply).pack(side="right")
+        ctk.CTkButton(acts, text="Cancel", width=90,
+                      fg_color=C["border"], hover_color=C["scrollbar"],
+                      font=ctk.CTkFont(size=12), corner_radius=6,
+                      command=self._cancel).pack(side="right", padx=(0, 6))
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+        self._compare_task = self.app.tasks.submit(
+            f"Comparing {len(conflicts)} file(s)", self._compare, dict(self._srcs))
+
+    def _row(self, iid: str) -> tuple:
+        src = self._srcs[iid]
+        dest = self.repo.folder / src.name
+        try:
+            existing = _fmt_bytes(dest.stat().st_size)
+            incoming = _fmt_bytes(src.stat().st_size)
+        except OSError:
+            existing = incoming = "—"
+        same = self._same.get(iid)
+        content = "comparing…" if same is None else "identical" if same else "differs"
+        return (src.name, self._actions[iid].capitalize(), existing, incoming, content)
+
+    def _compare(self, srcs: dict[str, Path]) -> None:
+        token = current_task().token
+        for n, (iid, src) in enumerate(srcs.items(), 1):
+            token.check()
+            dest = self.repo.folder / src.name
+            try:
+                same = (src.stat().st_size == dest.stat().st_size
+                        and _sha256(src) == HASH_CACHE.sha256(dest))
+            except OSError:
+                same = False
+            current_task().progress(n, len(srcs))
+            self.app.ui.call(self._set_same, iid, same)
+        HASH_CACHE.save()
+
+    def _set_same(self, iid: str, same: bool) -> None:
+        if not self.winfo_exists():
+            return
+        self._same[iid] = same
+        self._tree.item(iid, values=self._row(iid), tags=("same",) if same else ())
+
+    def _cycle(self) -> None:
+        for iid in self._tree.selection():
+            i = self.ACTIONS.index(self._actions[iid])
+            self._actions[iid] = self.ACTIONS[(i + 1) % len(self.ACTIONS)]
+            self._tree.item(iid, values=self._row(iid))
+
+    def _set_all(self, action: str) -> None:
+        for iid in self._srcs:
+            self._actions[iid] = action
+            self._tree.item(iid, values=self._row(iid))
+
+    def _skip_identical(self) -> None:
+        for iid, same in self._same.items():
+            if same:
+                self._actions[iid] = "skip"
+                self._tree.item(iid, values=self._row(iid))
+
+    def _apply(self) -> None:
+        self._compare_task.cancel()
+        plan = {self._srcs[iid]: action for iid, action in self._actions.items() if action != "skip"}
+        self.destroy()
+        self.on_done(plan)
+
+    def _cancel(self) -> None:
+        self._compare_task.cancel()
+        self.destroy()
+
+class DuplicatesWindow(ctk.CTkToplevel):
+    def __init__(self, parent: "MonolithApp", groups: list[DuplicateGroup]):
+        super().__init__(parent)
+        self.app = parent
+        self.title("Duplicate Mods")
+        self.configure(fg_color=C["surface"])
+        _center_on_parent(self, parent, 760, 480)
+        self.transient(parent)
+        self._groups: dict[str, DuplicateGroup] = {}
+        self._mods: dict[str, tuple[str, Mod]] = {}
+
+        reclaim = sum(g.reclaimable for g in groups)
+        ctk.CTkLabel(self, text=f"{len(groups)} group(s)  ·  up to {_fmt_bytes(reclaim)} reclaimable",
+                     anchor="w", text_color=C["text_dim"], font=ctk.CTkFont(size=11)
+                     ).pack(fill="x", padx=14, pady=(12, 0))
+
+        panel = ctk.CTkFrame(self, fg_color=C["surface2"], corner_radius=8)
+        panel.pack(fill="both", expand=True, padx=14, pady=(8, 8))
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_columnconfigure(0, weight=1)
+        sb = ttk.Scrollbar(panel, style="Monolith.Vertical.TScrollbar")
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 2), pady=2)
+        self._tree = ttk.Treeview(panel, columns=("state", "size", "modified"),
+                                  show="tree headings", selectmode="extended",
+                                  yscrollcommand=sb.set)
+        sb.config(command=self._tree.yview)
+        self._tree.grid(row=0, column=0, sticky="nsew", padx=(2, 0), pady=2)
+        self._tree.heading("#0", text="Group / Filename", anchor="w")
+        self._tree.column("#0", width=380, anchor="w")
+        for col, txt, w in [("state", "State", 90), ("size", "Size", 90),
+                            ("modified", "Modified", 140)]:
+            self._tree.heading(col, text=txt, anchor="w")
+            self._tree.column(col, width=w, stretch=tk.NO, anchor="w")
+        self._tree.tag_configure("group",    foreground=C["text_bright"])
+        self._tree.tag_configure("enabled",  foreground=C["success"])
+        self._tree.tag_configure("disabled", foreground=C["danger"])
+
+        for n, g in enumerate(groups):
+            gid = f"g{n}"
+            self._groups[gid] = g
+            label = ("Identical" if g.kind == "exact"
+                     else f"Near-identical ({g.similarity:.0%} shared content)")
+            self._tree.insert("", "end", iid=gid, open=True, tags=("group",),
+                              text=f"{label}  ·  {len(g.mods)} files",
+                              values=("", _fmt_bytes(g.reclaimable), ""))
+            for k, m in enumerate(g.mods):
+                mid = f"{gid}.{k}"
+                self._mods[mid] = (gid, m)
+                try:
+                    mtime = datetime.datetime.fromtimestamp(m.path.stat().st_mtime)
+                    modified = mtime.strftime("%Y-%m-%d %H:%M")
+                except OSError:
+                    modified = "—"
+                self._tree.insert(gid, "end", iid=mid, text=m.name,
+                                  values=(m.status.value.upper(), m.size_str, modified),
+                                  tags=("enabled" if m.is_enabled else "disabled",))
+
+        acts = ctk.CTkFrame(self, fg_color="transparent")
+        acts.pack(fill="x", padx=14, pady=(0, 14))
+        for text, cmd, fg, hover in [
+            ("Disable Others", lambda: self._resolve("disable"), C["warning"], "#fa714b"),
+            ("Delete Others",  lambda: self._resolve("delete"),  C["danger"],  "#ff3b3b"),
+        ]:
+            ctk.CTkButton(acts, text=text, width=120, command=cmd,
+                          fg_color=fg, hover_color=hover,
+                          font=ctk.CTkFont(size=12), corner_radius=6
+                          ).pack(side="left", padx=(0, 6))
+        ctk.CTkLabel(acts, text="Select the copy to keep in each group",
+                     text_color=C["text_dim"], font=ctk.CTkFont(size=10)
+                     ).pack(side="right")
+
+    def _resolve(self, action: str) -> None:
+        keep: dict[str, Mod] = {}
+        for iid in self._tree.selection():
+            if iid in self._mods:
+                gid, mod = self._mods[iid]
+                keep.setdefault(gid, mod)
+        if not keep:
+            return self.app.show_error("Select the file to keep in at least one group.")
+        others = [m for gid, kept in keep.items()
+                  for m in self._groups[gid].mods if m.path != kept.path]
+        repo = self.app.repo
+        if not others or not repo:
+            return
+        if action == "delete":
+            dlg = YesNoDialog(self.app, f"Permanently delete {len(others)} file(s)?")
+            self.app.wait_window(dlg)
+            if not dlg.result:
+                return
+        for gid in keep:
+            self._tree.delete(gid)
+        self.app.set_busy(True)
+        def _worker():
+            try:
+                if action == "delete":
+                    count = sum(1 for m in others if repo.delete(m))
+                else:
+                    count = len(repo.toggle_many(others, "disable"))
+            except BatchError as e:
+                msg = str(e)
+                self.app.ui.call(lambda: (self.app.set_busy(False),
+                                           self.app.notify(f"Could not disable: {msg}")))
+                return
+            verb = "Deleted" if action == "delete" else "Disabled"
+            self.app.ui.call(lambda: self.app.finish_op(f"{verb} {count} duplicate(s)."))
+        self.app.tasks.submit("Resolving duplicates", _worker, on_exit=self.app.clear_busy)
+
+class Sidebar(ctk.CTkFrame):
+    def __init__(self, parent, app: "MonolithApp"):
+        super().__init__(parent, width=220, corner_radius=0,
+                         fg_color=C["surface"])
+        self.app = app
+        self.grid_propagate(False)
+        self._build()
+
+    def _build(self) -> None:
+        self.grid_rowconfigure(15, weight=1)
+
+        ctk.CTkLabel(self, text="MONOLITH",
+                     font=ctk.CTkFont(size=22, weight="bold"),
+                     text_color=C["accent"]).grid(
+                         row=0, column=0, padx=20, pady=(24, 2))
+        ctk.CTkLabel(self, text="MOD MANAGER",
+                     font=ctk.CTkFont(size=10, weight="bold"),
+                     text_color=C["text_dim"]).grid(
+                         row=1, column=0, padx=20, pady=(0, 20))
+
+        ctk.CTkFrame(self, height=1, fg_color=C["border"]).grid(
+            row=2, column=0, sticky="ew", padx=16, pady=(0, 16))
+
+        section_label(self, "LAUNCH PARAMETERS").grid(
+            row=3, column=0, padx=20, sticky="w")
+
+        self.devmode_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(self, text="Developer Mode",
+                        variable=self.devmode_var,
+                        font=ctk.CTkFont(size=12),
+                        checkbox_height=16, checkbox_width=16,
+                        fg_color=C["primary"], hover_color=C["accent"]
                         ).grid(row=4, column=0, padx=20, pady=(8, 0), sticky="w")
 
         self.logfile_var = ctk.BooleanVar(value=False)
@@ -1539,24 +2358,49 @@ class Sidebar(ctk.CTkFrame):
                         fg_color=C["primary"], hover_color=C["accent"]
                         ).grid(row=5, column=0, padx=20, pady=(6, 0), sticky="w")
 
+        self.auto_restart_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(self, text="Restart on Crash",
+                        variable=self.auto_restart_var,
+                        font=ctk.CTkFont(size=12),
+                        checkbox_height=16, checkbox_width=16,
+                        fg_color=C["primary"], hover_color=C["accent"]
+                        ).grid(row=6, column=0, padx=20, pady=(6, 0), sticky="w")
+
         self.params_var = ctk.StringVar()
         ctk.CTkEntry(self, textvariable=self.params_var,
                      font=ctk.CTkFont(size=11),
                      fg_color=C["bg"], border_color=C["border"],
                      height=28, corner_radius=6
-                     ).grid(row=6, column=0, padx=20, pady=(6, 12), sticky="ew")
+                     ).grid(row=7, column=0, padx=20, pady=(6, 12), sticky="ew")
 
         self.btn_launch = ctk.CTkButton(
             self, text="▶  LAUNCH GAME", height=46,
             fg_color=C["success"], hover_color="#6a2c70",
             font=ctk.CTkFont(size=14, weight="bold"),
             corner_radius=8, command=self.app.launch_game)
-        self.btn_launch.grid(row=7, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self.btn_launch.grid(row=8, column=0, padx=20, pady=(0, 8), sticky="ew")
+
+        tools = ctk.CTkFrame(self, fg_color="transparent")
+        tools.grid(row=9, column=0, padx=20, pady=(0, 20), sticky="ew")
+        tools.grid_columnconfigure((0, 1), weight=1)
+        for i, (text, cmd) in enumerate([
+            ("Server Log", self.app.open_server_log),
+            ("Monitor",    self.app.open_process_monitor),
+            ("Instances",  self.app.open_instances),
+            ("Tasks",      self.app.open_tasks),
+        ]):
+            row, col = divmod(i, 2)
+            ctk.CTkButton(tools, text=text,
+                          fg_color=C["bg"], hover_color=C["border"],
+                          font=ctk.CTkFont(size=11), height=28, corner_radius=6,
+                          command=cmd
+                          ).grid(row=row, column=col, padx=(0, 4) if col == 0 else (4, 0),
+                                 pady=(0, 6) if row == 0 else 0, sticky="ew")
 
         ctk.CTkFrame(self, height=1, fg_color=C["border"]).grid(
-            row=8, column=0, sticky="ew", padx=16, pady=(0, 14))
+            row=10, column=0, sticky="ew", padx=16, pady=(0, 14))
 
-        section_label(self, "PROFILES").grid(row=9, column=0, padx=20, sticky="w")
+        section_label(self, "PROFILES").grid(row=11, column=0, padx=20, sticky="w")
 
         self.profile_menu = ctk.CTkOptionMenu(
             self, dynamic_resizing=False,
@@ -1565,10 +2409,10 @@ class Sidebar(ctk.CTkFrame):
             fg_color=C["bg"], button_color=C["border"],
             button_hover_color=C["primary"],
             height=30, corner_radius=6)
-        self.profile_menu.grid(row=10, column=0, padx=20, pady=(6, 8), sticky="ew")
+        self.profile_menu.grid(row=12, column=0, padx=20, pady=(6, 8), sticky="ew")
 
         pbtn = ctk.CTkFrame(self, fg_color="transparent")
-        pbtn.grid(row=11, column=0, padx=20, pady=(0, 8))
+        pbtn.grid(row=13, column=0, padx=20, pady=(0, 8))
 
         for text, cmd, fg in [
             ("+",  self.app.create_profile, C["success"]),
@@ -1580,35 +2424,41 @@ class Sidebar(ctk.CTkFrame):
                           font=ctk.CTkFont(size=12), corner_radius=6,
                           command=cmd).pack(side="left", padx=3)
 
+        self.pin_mods_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(self, text="Pin Enabled Mods",
+                        variable=self.pin_mods_var,
+                        command=self.app.pin_changed,
+                        font=ctk.CTkFont(size=12),
+                        checkbox_height=16, checkbox_width=16,
+                        fg_color=C["primary"], hover_color=C["accent"]
+                        ).grid(row=14, column=0, padx=20, pady=(0, 8), sticky="w")
+
         self.btn_updates = ctk.CTkButton(
             self, text="Check for Updates",
             fg_color=C["bg"], hover_color=C["border"],
             font=ctk.CTkFont(size=11), height=28, corner_radius=6,
             command=self.app.check_updates)
-        self.btn_updates.grid(row=13, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self.btn_updates.grid(row=16, column=0, padx=20, pady=(0, 20), sticky="ew")
 
         self.grid_columnconfigure(0, weight=1)
 
     def load_profile(self, profile: Profile) -> None:
         self.devmode_var.set(profile.devmode)
         self.logfile_var.set(profile.logfile)
+        self.auto_restart_var.set(profile.auto_restart)
         self.params_var.set(profile.custom_params)
+        self.pin_mods_var.set(profile.pin_mods)
 
     def get_launch_params(self) -> list[str]:
-        params = []
-        if self.devmode_var.get():
-            params.append("+developer 1")
-        if self.logfile_var.get():
-            params.append("+logfile 2")
-        custom = self.params_var.get().strip()
-        if custom:
-            params.extend(custom.split())
-        return params
+        return _build_launch_params(self.devmode_var.get(), self.logfile_var.get(),
+                                    self.params_var.get())
 
     def save_to_profile(self, profile: Profile) -> None:
         profile.devmode       = self.devmode_var.get()
         profile.logfile       = self.logfile_var.get()
+        profile.auto_restart  = self.auto_restart_var.get()
         profile.custom_params = self.params_var.get()
+        profile.pin_mods      = self.pin_mods_var.get()
 
     def set_profiles(self, names: list[str], active: str) -> None:
         self.profile_menu.configure(values=names)
@@ -1621,12 +2471,136 @@ class Sidebar(ctk.CTkFrame):
         state = "disabled" if busy else "normal"
         self.btn_launch.configure(state=state)
 
+def _import_bundle(repo: ModRepository, bundle: Path,
+                   cancel: CancelToken | None = None) -> dict[str, str | None]:
+    try:
+        results = repo.import_bundle(bundle, cancel=cancel)
+    except Exception as e:
+        logging.error(f"Bundle import failed for {bundle.name}: {e}")
+        return {bundle.name: str(e)}
+    return results or {bundle.name: "no PK3 files inside"}
+
+class _AppApiBackend:
+    def __init__(self, app: "MonolithApp"):
+        self.app = app
+
+    def _on_ui(self, fn: Callable, timeout: float = 10):
+        fut: Future = Future()
+        def _run():
+            try:
+                fut.set_result(fn())
+            except Exception as e:
+                fut.set_exception(e)
+        self.app.ui.call(_run)
+        return fut.result(timeout=timeout)
+
+    def _repo(self) -> ModRepository:
+        repo = self.app.repo
+        if not repo:
+            raise ApiError(409, "No base folder is set for the active profile.")
+        return repo
+
+    def status(self) -> dict:
+        repo = self.app.repo
+        return {
+            "version": APP_VERSION,
+            "profile": self.app.config_data.active_profile,
+            "folder": str(repo.folder) if repo else None,
+            "instances": {n: {"pid": sup.process.pid if sup.process else None,
+                              "running": sup.running,
+                              "restarts": sup.restarts}
+                          for n, sup in self.app.instances.items()},
+        }
+
+    def list_mods(self, search: str) -> list[dict]:
+        return [{"name": m.name, "enabled": m.is_enabled, "size": m.size_bytes,
+                 "load_order": i}
+                for i, m in enumerate(self._repo().list_mods(search), 1)]
+
+    def toggle_mods(self, names: list[str], state: str | None) -> dict:
+        repo = self._repo()
+        mods, missing = match_mods(repo.list_mods(), names)
+        try:
+            delta = repo.toggle_many(mods, state)
+        except BatchError as e:
+            raise ApiError(409, str(e))
+        changed = [new.name for _, new in delta]
+        self.app.ui.call(self.app.mod_panel.refresh)
+        if changed:
+            self.app.publish("mods.changed", {"changed": changed})
+        return {"changed": changed, "not_found": missing}
+
+    def catalog(self) -> list[dict]:
+        try:
+            return fetch_catalog()
+        except CatalogError as e:
+            raise ApiError(502, str(e))
+
+    def downloads(self) -> list[dict]:
+        return self._on_ui(lambda: self.app.download_panel.download_state())
+
+    def start_downloads(self, urls: list[str]) -> dict:
+        self._repo()
+        names = {m.get("download_url"): m.get("name", "?") for m in self.catalog()}
+        unknown = [u for u in urls if u not in names]
+        if unknown:
+            raise ApiError(400, f"Not in the mod catalog: {', '.join(unknown)}")
+        started = self._on_ui(
+            lambda: self.app.download_panel.start_downloads({u: names[u] for u in urls}))
+        return {"started": started}
+
+    def rcon(self, params: dict) -> dict:
+        ip, port, pw = params.get("ip"), params.get("port"), params.get("password")
+        if params.get("server"):
+            servers = load_rcon_servers()
+            if params["server"] not in servers:
+                raise ApiError(404, f"Unknown server '{params['server']}'.")
+            sec = servers[params["server"]]
+            ip, port = ip or sec.get("ip"), port or sec.get("port")
+            pw = pw if pw is not None else sec.get("password", "")
+        if not (ip and port):
+            raise ApiError(400, "'server' or 'ip' and 'port' are required.")
+        cmd = str(params["command"])
+        try:
+            with RconSession(ip, int(port), pw or "") as session:
+                session.send(cmd)
+                data = session.recv()
+        except OSError as e:
+            raise ApiError(502, f"RCON failed: {e}")
+        text = data.decode("utf-8", "ignore")
+        reply = "".join(t for t, _ in parse_rcon_colored(text))
+        self.app.publish("rcon.reply", {"command": cmd, "reply": reply})
+        return {"command": cmd, "reply": reply}
+
+    def launch(self, profile: str | None) -> dict:
+        name = profile or self.app.config_data.active_profile
+        p = self.app.config_data.profiles.get(name)
+        if not p:
+            raise ApiError(404, f"Unknown profile '{name}'.")
+        try:
+            sup = self.app.instances.launch(p)
+        except FileNotFoundError as e:
+            raise ApiError(400, str(e))
+        return {"profile": name, "pid": sup.process.pid}
+
+TAB_MODS     = "  Mod Manager  "
+TAB_DOWNLOAD = "  Download Mods  "
+TAB_RCON     = "  RCON Console  "
+
 class MonolithApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, config: AppConfig | None = None):
         super().__init__()
-        self.config_data = AppConfig.load()
+        self.config_data = config or AppConfig.load()
         self.repo: ModRepository | None = None
-        self.game_process: subprocess.Popen | None = None
+        self.instances = InstanceManager(on_event=self._on_instance_event)
+        self.api: ApiServer | None = None
+        self.ui = UiDispatcher(self)
+        self.tasks = TaskRunner()
+        self._closing = False
+        self._pinning = False
+        self._pins_applied = False
+        self._pending_release: dict | None = None
+        self.log_tailer: LogTailer | None = None
 
         self.title("MONOLITH MOD MANAGER")
         self.minsize(1100, 720)
@@ -1643,8 +2617,17 @@ class MonolithApp(ctk.CTk):
 
         apply_treeview_style()
         self._build_ui()
-        self._restore_active_profile()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.ui.start()
+        self._refresh_profile_menu()
+        self.after_idle(self._restore_active_profile)
+        self.bind("<Control-Shift-D>", lambda _: DiagnosticsWindow(self))
+        if self.config_data.telemetry:
+            TELEMETRY.configure(True)
+        if self.config_data.api_enabled:
+            self._start_api()
+        if self.config_data.auto_update_check:
+            self.after(int(UPDATE_CHECK_DELAY * 1000), self._schedule_update_check)
 
     def _build_ui(self) -> None:
         self.grid_columnconfigure(1, weight=1)
@@ -1667,30 +2650,72 @@ class MonolithApp(ctk.CTk):
             segmented_button_unselected_color=C["bg"],
             segmented_button_unselected_hover_color=C["surface"],
             corner_radius=10,
+            command=lambda: self._ensure_panel(self.tabs.get()),
         )
         self.tabs.pack(fill="both", expand=True)
 
-        self.mod_tab      = self.tabs.add("  Mod Manager  ")
-        self.download_tab = self.tabs.add("  Download Mods  ")
-        self.rcon_tab_frame = self.tabs.add("  RCON Console  ")
+        self.mod_tab        = self.tabs.add(TAB_MODS)
+        self.download_tab   = self.tabs.add(TAB_DOWNLOAD)
+        self.rcon_tab_frame = self.tabs.add(TAB_RCON)
 
-        self.mod_panel      = ModManagerTab(self.mod_tab,      app=self)
-        self.download_panel = DownloadTab(self.download_tab,   app=self)
-        self.rcon_panel     = RconTab(self.rcon_tab_frame,     app=self)
+        self._panels: dict[str, ctk.CTkFrame] = {}
+        self.mod_panel = self._ensure_panel(TAB_MODS)
+        self.notifier = Notifier(self)
 
-        self.mod_panel.pack(fill="both", expand=True, padx=14, pady=14)
-        self.download_panel.pack(fill="both", expand=True, padx=14, pady=14)
-        self.rcon_panel.pack(fill="both", expand=True, padx=14, pady=14)
+    def _ensure_panel(self, tab: str) -> ctk.CTkFrame:
+        panel = self._panels.get(tab)
+        if panel is None:
+            cls = {TAB_MODS: ModManagerTab, TAB_DOWNLOAD: DownloadTab, TAB_RCON: RconTab}[tab]
+            panel = cls(self.tabs.tab(tab), app=self)
+            panel.pack(fill="both", expand=True, padx=14, pady=14)
+            self._panels[tab] = panel
+        return panel
 
-        self.after(200, self.download_panel.fetch)
+    @property
+    def download_panel(self) -> DownloadTab:
+        return self._ensure_panel(TAB_DOWNLOAD)
+
+    @property
+    def rcon_panel(self) -> RconTab:
+        return self._ensure_panel(TAB_RCON)
 
     def _restore_active_profile(self) -> None:
         cfg = self.config_data
         if cfg.active_profile not in cfg.profiles:
             cfg.active_profile = next(iter(cfg.profiles), "Default")
-        self._refresh_profile_menu()
+            self._refresh_profile_menu()
         self._apply_profile(cfg.profiles[cfg.active_profile])
 
+    def _start_api(self) -> None:
+        cfg = self.config_data
+        if not cfg.api_token:
+            cfg.api_token = secrets.token_urlsafe(32)
+            cfg.save()
+            logging.info("Generated a Control API token; it is stored in config.json")
+        try:
+            self.api = ApiServer(_AppApiBackend(self), cfg.api_host, cfg.api_port,
+                                 cfg.api_token, cfg.api_hostnames).start()
+        except Exception as e:
+            logging.error(f"Control API disabled: {e}")
+            self.api = None
+
+    def publish(self, event: str, data: dict) -> None:
+        if self.api:
+            self.api.publish(event, data)
+
+    def refresh_dpi_scaling(self) -> None:
+        def _worker():
+            scaling = get_dpi_scaling()
+            if abs(scaling - self.config_data.dpi_scaling) > 0.01:
+                self.ui.call(lambda: self._apply_dpi_scaling(scaling))
+        self.tasks.submit("Detecting display scaling", _worker)
+
+    def _apply_dpi_scaling(self, scaling: float) -> None:
+        self.config_data.dpi_scaling = scaling
+        self.config_data.save()
+        ctk.set_widget_scaling(scaling)
+        ctk.set_window_scaling(scaling)
+
     def _refresh_profile_menu(self) -> None:
         names = list(self.config_data.profiles.keys())
         self.sidebar.set_profiles(names, self.config_data.active_profile)
@@ -1698,19 +2723,81 @@ class MonolithApp(ctk.CTk):
     def _apply_profile(self, profile: Profile) -> None:
         self.sidebar.load_profile(profile)
         if profile.mod_folder and Path(profile.mod_folder).exists():
-            self.set_mod_folder(Path(profile.mod_folder), save=False)
+            folder = Path(profile.mod_folder)
+            if self.repo and self.repo.folder.resolve() == folder.resolve():
+                self.mod_panel._path_var.set(str(folder))
+                self.mod_panel._update_status_bar(list(self.mod_panel._mod_index.values()))
+            else:
+                self.set_mod_folder(folder, save=False)
+            self._pins_applied = False
+            if profile.pin_mods and profile.enabled_mods is not None:
+                self._activate_pinned(profile)
         else:
             self.repo = None
             self.mod_panel._path_var.set(
                 "Folder missing, click 'Base Folder' to set one.")
             self.mod_panel.refresh()
 
+    def _store_profile(self, profile: Profile) -> None:
+        self.sidebar.save_to_profile(profile)
+        if self.repo:
+            profile.mod_folder = str(self.repo.folder)
+            # Until the pinned set is on disk, the folder still holds another profile's mods.
+            if profile.pin_mods and (self._pins_applied or profile.enabled_mods is None):
+                profile.enabled_mods = [m.name for m in self.repo.list_mods() if m.is_enabled]
+
+    def pin_changed(self) -> None:
+        profile = self.config_data.profiles.get(self.config_data.active_profile)
+        if not profile:
+            return
+        self._store_profile(profile)
+        if profile.pin_mods:
+            self._pins_applied = True
+        else:
+            profile.enabled_mods = None
+        self.config_data.save()
+
+    def _activate_pinned(self, profile: Profile) -> None:
+        repo = self.repo
+        if not repo:
+            return
+        if self.instances.running():
+            return self.notify(f"Close the game first: pinned mods for '{profile.name}' "
+                               "were not applied.")
+        enabled = set(profile.enabled_mods or [])
+        self.set_busy(True)
+        self._pinning = True
+        def _worker():
+            try:
+                delta = repo.activate(enabled)
+            except BatchError as e:
+                msg = str(e)
+                self.ui.call(lambda: (self.set_busy(False), self.mod_panel.refresh(),
+                                       self.notify(f"Could not apply pinned mods: {msg}")))
+                return
+            def _done():
+                self._pins_applied = True
+                self.mod_panel._apply_delta(delta)
+            self.ui.call(_done)
+        self.tasks.submit("Activating pinned mods", _worker,
+                          on_exit=lambda: self.ui.call(self._pinning_ended))
+
+    def _pinning_ended(self) -> None:
+        self._pinning = False
+        self.set_busy(False)
+
+    def _switch_blocked(self) -> bool:
+        if self._pinning:
+            self._refresh_profile_menu()
+            self.notify("Wait for the pinned mods to finish activating before switching profiles.")
+        return self._pinning
+
     def change_profile(self, name: str) -> None:
+        if self._switch_blocked():
+            return
         old = self.config_data.profiles.get(self.config_data.active_profile)
         if old:
-            self.sidebar.save_to_profile(old)
-            if self.repo:
-                old.mod_folder = str(self.repo.folder)
+            self._store_profile(old)
         self.config_data.active_profile = name
         self._apply_profile(self.config_data.profiles[name])
         self.config_data.save()
@@ -1723,6 +2810,8 @@ class MonolithApp(ctk.CTk):
             return
         if name in self.config_data.profiles:
             return self.show_error(f"Profile '{name}' already exists.")
+        if self._switch_blocked():
+            return
         self.config_data.profiles[name] = Profile(name=name)
         self.config_data.active_profile = name
         self._refresh_profile_menu()
@@ -1741,6 +2830,7 @@ class MonolithApp(ctk.CTk):
             return self.show_error(f"A profile named '{new_name}' already exists.")
         profile = self.config_data.profiles.pop(current)
         profile.name = new_name
+        self.instances.rename(current, new_name)
         self.config_data.profiles[new_name] = profile
         self.config_data.active_profile = new_name
         self._refresh_profile_menu()
@@ -1753,7 +2843,7 @@ class MonolithApp(ctk.CTk):
                else f"Permanently delete profile '{current}'?")
         dlg = YesNoDialog(self, msg)
         self.wait_window(dlg)
-        if not dlg.result:
+        if not dlg.result or self._switch_blocked():
             return
         del self.config_data.profiles[current]
         if not self.config_data.profiles:
@@ -1786,39 +2876,134 @@ class MonolithApp(ctk.CTk):
             profile.game_exe = str(exe)
             self.config_data.save()
         params = self.sidebar.get_launch_params()
+        auto_restart = self.sidebar.auto_restart_var.get()
         self.set_busy(True)
-        threading.Thread(target=self._launch_worker, args=(exe, params), daemon=True).start()
+        self.tasks.submit("Launching game", self._launch_worker, profile, params, auto_restart)
+
+    @property
+    def supervisor(self) -> ProcessSupervisor | None:
+        return self.instances.get(self.config_data.active_profile)
+
+    @property
+    def game_process(self) -> subprocess.Popen | None:
+        return self.supervisor.process if self.supervisor else None
 
-    def _launch_worker(self, exe: Path, params: list[str]) -> None:
+    def _on_instance_event(self, name: str, msg: str) -> None:
+        self.ui.call(lambda: self.mod_panel._status_var.set(f"[{name}] {msg}"))
+
+    def _launch_worker(self, profile: Profile, params: list[str],
+                       auto_restart: bool = False) -> None:
         try:
-            if os.name != "nt":
-                exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
-            self.game_process = subprocess.Popen([str(exe)] + params, cwd=str(exe.parent))
-            self.after(0, lambda: self.finish_op("Game launched."))
+            self.instances.launch(profile, params=params, auto_restart=auto_restart)
+            if "+logfile 2" in params and self.repo:
+                self.ui.call(lambda: self._start_log_tailer(restart=True))
+            self.ui.call(lambda: self.finish_op("Game launched."))
         except Exception as e:
-            self.after(0, lambda: self.show_error(f"Launch failed: {e}"))
-            self.after(0, lambda: self.set_busy(False))
+            msg = str(e)
+            self.ui.call(lambda: self.notify(f"Launch failed: {msg}"))
+            self.ui.call(lambda: self.set_busy(False))
+
+    def _start_log_tailer(self, restart: bool = False) -> LogTailer | None:
+        if not self.repo:
+            return None
+        path = _find_qconsole_log(self.repo.folder)
+        if self.log_tailer and (restart or self.log_tailer.path != path):
+            self.log_tailer.stop()
+            self.log_tailer = None
+        if not self.log_tailer:
+            self.log_tailer = LogTailer(path).start()
+        return self.log_tailer
+
+    def open_server_log(self) -> None:
+        tailer = self._start_log_tailer()
+        if not tailer:
+            return self.show_error("Select a base folder first.")
+        ServerLogWindow(self, tailer)
+
+    def open_process_monitor(self) -> None:
+        ProcessMonitorWindow(self)
+
+    def open_instances(self) -> None:
+        InstancesWindow(self)
+
+    def open_tasks(self) -> None:
+        TasksWindow(self)
 
     def check_updates(self) -> None:
+        if self._pending_release:
+            self._show_update_dialog(self._pending_release)
+            return
         self.sidebar.btn_updates.configure(state="disabled", text="Checking…")
-        threading.Thread(target=self._check_updates_worker, daemon=True).start()
+        self.tasks.submit("Checking for updates", self._check_updates_worker, pool="net")
+
+    @staticmethod
+    def _latest_release(version_url: str = VERSION_URL,
+                        releases_url: str = RELEASES_URL) -> dict | None:
+        import requests
+        vtxt = requests.get(version_url, timeout=6).text.strip()
+        if _version_tuple(vtxt) <= _version_tuple(APP_VERSION):
+            return None
+        return fetch_release(url=releases_url, max_age=UPDATE_CHECK_INTERVAL, expect=vtxt)
+
+    @staticmethod
+    def _asset_name() -> str:
+        return (
+            "Monolith-windows.zip"  if os.name == "nt"
+            else "Monolith-linux.tar.gz" if sys.platform.startswith("linux")
+            else "Monolith-macos.dmg"
+        )
+
+    def _update_idle(self) -> bool:
+        me = current_task()
+        return not self.instances.running() and all(t is me for t in self.tasks.tasks())
+
+    def _schedule_update_check(self) -> None:
+        if self._closing or self._pending_release:
+            return
+        if self._update_idle():
+            self.tasks.submit("Checking for updates", self._background_update_worker, pool="net")
+            delay = UPDATE_CHECK_INTERVAL
+        else:
+            delay = UPDATE_IDLE_RETRY
+        self.after(int(delay * 1000), self._schedule_update_check)
+
+    def _background_update_worker(self) -> None:
+        try:
+            release = self._latest_release()
+            if not release:
+                return
+            folder = UPDATE_DIR / release_version(release)
+            prune_updates(folder)
+            if getattr(sys, "frozen", False) and self._update_idle():
+                name = self._asset_name()
+                names = (delta_asset_name(name, APP_VERSION), name)
+                asset = next((a for n in names for a in release["assets"] if a["name"] == n), None)
+                if asset:
+                    task = current_task()
+                    fetch_asset(asset, folder, task.progress, cancel=task.token)
+        except Cancelled:
+            return
+        except Exception as e:
+            logging.warning(f"Background update check failed: {e}")
+            return
+        self.ui.call(self._mark_update_available, release)
+
+    def _mark_update_available(self, release: dict) -> None:
+        self._pending_release = release
+        self.sidebar.btn_updates.configure(state="normal", text="Update Available!",
+                                           fg_color=C["success"])
+        self.notify(f"Version {release_version(release)} is ready to install.", "info")
 
     def _check_updates_worker(self) -> None:
         try:
-            vtxt = requests.get(
-                "https://raw.githubusercontent.com/fl4te/monolith/refs/heads/main/version.txt",
-                timeout=6).text.strip()
-            if _version_tuple(vtxt) <= _version_tuple(APP_VERSION):
-                self.after(0, lambda: (
+            release = self._latest_release()
+            if not release:
+                self.ui.call(lambda: (
                     self.sidebar.btn_updates.configure(state="normal", text="Check for Updates"),
-                    self.show_info(f"You are on the latest version ({APP_VERSION})."),
+                    self.notify(f"You are on the latest version ({APP_VERSION}).", "info"),
                 ))
                 return
-            resp = requests.get(
-                "https://api.github.com/repos/fl4te/monolith/releases/latest", timeout=6)
-            resp.raise_for_status()
-            release = resp.json()
-            self.after(0, lambda r=release: (
+            self.ui.call(lambda r=release: (
                 self.sidebar.btn_updates.configure(state="normal",
                                                    text="Update Available!",
                                                    fg_color=C["success"]),
@@ -1826,55 +3011,68 @@ class MonolithApp(ctk.CTk):
             ))
         except Exception as e:
             logging.error(f"Update check failed: {e}")
-            self.after(0, lambda: (
+            msg = str(e)
+            self.ui.call(lambda: (
                 self.sidebar.btn_updates.configure(state="normal", text="Check for Updates"),
-                self.show_error(f"Update check failed: {e}"),
+                self.notify(f"Update check failed: {msg}"),
             ))
 
     def _show_update_dialog(self, release: dict) -> None:
         dlg = UpdateDialog(self, release)
         self.wait_window(dlg)
         if dlg.result:
-            threading.Thread(target=self._update_worker, args=(release,), daemon=True).start()
+            self.tasks.submit("Downloading update", self._update_worker, release, pool="net")
+
+    def _delta_update(self, release: dict, asset_name: str) -> Path | None:
+        name = delta_asset_name(asset_name, APP_VERSION)
+        asset = next((a for a in release["assets"] if a["name"] == name), None)
+        if not asset:
+            return None
+        task = current_task()
+        patch = UPDATE_DIR / release_version(release) / name
+        out_dir = CONFIG_DIR / "update_delta"
+        try:
+            fetch_asset(asset, patch.parent, task.progress, cancel=task.token)
+            out_dir.mkdir(exist_ok=True)
+            app_path = self._get_app_path()
+            new_bin = out_dir / app_path.name
+            apply_patch(app_path, patch, new_bin, cancel=task.token)
+            logging.info(f"Applied delta update {name} ({_fmt_bytes(patch.stat().st_size)})")
+            return new_bin
+        except Cancelled:
+            raise
+        except Exception as e:
+            logging.warning(f"Delta update {name} failed, downloading the full asset: {e}")
+            return None
+        finally:
+            patch.unlink(missing_ok=True)
 
     def _update_worker(self, release: dict) -> None:
-        asset_name = (
-            "Monolith-windows.zip"  if os.name == "nt"
-            else "Monolith-linux.tar.gz" if sys.platform.startswith("linux")
-            else "Monolith-macos.dmg"
-        )
-        url = next((a["browser_download_url"] for a in release["assets"]
-                    if a["name"] == asset_name), None)
-        expected_hash = next((a.get("sha256") for a in release["assets"]
-                               if a["name"] == asset_name), None)
-        if not url:
-            self.after(0, lambda: self.show_error("Release asset not found."))
+        import tarfile
+        asset_name = self._asset_name()
+        asset = next((a for a in release["assets"] if a["name"] == asset_name), None)
+        if not asset:
+            self.ui.call(lambda: self.notify("Release asset not found."))
             return
 
-        temp = CONFIG_DIR / f"update_temp_{asset_name}"
+        folder = UPDATE_DIR / release_version(release)
+        temp = folder / asset_name
+        task = current_task()
+        new_bin: Path | None = None
         try:
-            for attempt in range(3):
-                try:
-                    resp = requests.get(url, stream=True, timeout=15)
-                    resp.raise_for_status()
-                    with open(temp, "wb") as fh:
-                        for chunk in resp.iter_content(65536):
-                            fh.write(chunk)
-                    break
-                except Exception as e:
-                    if attempt == 2:
-                        raise
-                    time.sleep(2)
-            if expected_hash and _sha256(temp) != expected_hash:
-                temp.unlink(missing_ok=True)
-                self.after(0, lambda: self.show_error("Hash mismatch — update aborted."))
-                return
+            if getattr(sys, "frozen", False) and not asset_name.endswith(".dmg"):
+                new_bin = self._delta_update(release, asset_name)
+            if not new_bin:
+                fetch_asset(asset, folder, task.progress, cancel=task.token)
+        except Cancelled:
+            return
         except Exception as e:
-            self.after(0, lambda: self.show_error(f"Download failed: {e}"))
+            msg = str(e)
+            self.ui.call(lambda: self.notify(f"Download failed: {msg}"))
             return
 
         if asset_name.endswith(".dmg"):
-            self.after(0, lambda: self.show_info(f"DMG downloaded to:\n{temp}\n\nDrag it to Applications."))
+            self.ui.call(lambda: self.notify(f"DMG downloaded to:\n{temp}\n\nDrag it to Applications.", "info"))
             if sys.platform == "darwin":
                 subprocess.Popen(["open", str(temp)])
             return
@@ -1888,23 +3086,24 @@ class MonolithApp(ctk.CTk):
             if os.name != "nt":
                 backup.unlink(missing_ok=True)
                 app_path.rename(backup)
-            shutil.rmtree(extract, ignore_errors=True)
-            extract.mkdir()
 
-            if asset_name.endswith(".tar.gz"):
-                with tarfile.open(temp, "r:gz") as tar:
-                    _safe_extract_tar(tar, extract)
-            else:
-                with zipfile.ZipFile(temp, "r") as zf:
-                    _safe_extract_zip(zf, extract)
-
-            files = list(extract.rglob("*"))
-            candidates = [f for f in files if f.is_file() and not f.name.startswith(".")]
-            new_bin = (
-                next((f for f in candidates if f.name == app_path.name), None)
-                or next((f for f in candidates if os.access(f, os.X_OK)), None)
-                or next(iter(candidates), None)
-            )
+            if not new_bin:
+                shutil.rmtree(extract, ignore_errors=True)
+                extract.mkdir()
+                if asset_name.endswith(".tar.gz"):
+                    with tarfile.open(temp, "r:gz") as tar:
+                        _safe_extract_tar(tar, extract)
+                else:
+                    with zipfile.ZipFile(temp, "r") as zf:
+                        _safe_extract_zip(zf, extract)
+
+                files = list(extract.rglob("*"))
+                candidates = [f for f in files if f.is_file() and not f.name.startswith(".")]
+                new_bin = (
+                    next((f for f in candidates if f.name == app_path.name), None)
+                    or next((f for f in candidates if os.access(f, os.X_OK)), None)
+                    or next(iter(candidates), None)
+                )
             if not new_bin:
                 raise FileNotFoundError("Executable not found in update package.")
 
@@ -1921,20 +3120,22 @@ class MonolithApp(ctk.CTk):
                     encoding="utf-8",
                 )
                 lock.unlink(missing_ok=True)
+                shutil.rmtree(UPDATE_DIR, ignore_errors=True)
                 subprocess.Popen(
                     ["cmd", "/c", str(bat)],
                     creationflags=subprocess.CREATE_NO_WINDOW,
                 )
-                self.after(0, lambda: self.show_info("Update ready. The app will restart automatically."))
-                self.after(1500, self.destroy)
+                self.ui.call(lambda: self.notify("Update ready. The app will restart automatically.", "info"))
+                self.ui.call(lambda: self.after(1500, self.destroy))
             else:
                 shutil.move(str(new_bin), str(app_path))
                 app_path.chmod(0o755)
                 lock.unlink(missing_ok=True)
-                self.after(0, lambda: self.show_info("Update installed. Restarting…"))
-                self.after(1500, self._restart)
+                shutil.rmtree(UPDATE_DIR, ignore_errors=True)
+                self.ui.call(lambda: self.notify("Update installed. Restarting…", "info"))
+                self.ui.call(lambda: self.after(1500, self._restart))
         except PermissionError:
-            self.after(0, lambda: self.show_error(
+            self.ui.call(lambda: self.notify(
                 "Permission denied. Try running as administrator."))
             if os.name != "nt" and backup.exists():
                 backup.rename(app_path)
@@ -1944,7 +3145,8 @@ class MonolithApp(ctk.CTk):
             if os.name != "nt" and backup.exists():
                 backup.rename(app_path)
             lock.unlink(missing_ok=True)
-            self.after(0, lambda: self.show_error(f"Update failed: {e}"))
+            msg = str(e)
+            self.ui.call(lambda: self.notify(f"Update failed: {msg}"))
 
     @staticmethod
     def _get_app_path() -> Path:
@@ -1975,11 +3177,17 @@ class MonolithApp(ctk.CTk):
     def set_busy(self, busy: bool) -> None:
         self.sidebar.set_busy(busy)
 
+    def clear_busy(self) -> None:
+        self.ui.call(self.set_busy, False)
+
     def finish_op(self, msg: str) -> None:
         self.set_busy(False)
         self.mod_panel._status_var.set(msg)
         self.mod_panel.refresh()
 
+    def notify(self, message: str, level: str = "error") -> None:
+        self.notifier.push(message, level)
+
     def show_info(self, message: str) -> None:
         dlg = InfoDialog(self, message)
         self.wait_window(dlg)
@@ -1989,52 +3197,47 @@ class MonolithApp(ctk.CTk):
         self.wait_window(dlg)
 
     def _on_close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
         profile = self.config_data.profiles.get(self.config_data.active_profile)
         if profile:
-            self.sidebar.save_to_profile(profile)
-            if self.repo:
-                profile.mod_folder = str(self.repo.folder)
+            self._store_profile(profile)
         self.config_data.geometry = self.geometry()
         self.config_data.save()
-
-        if self.game_process and self.game_process.poll() is None:
-            try:
-                if os.name == "nt":
-                    subprocess.call(["taskkill", "/F", "/T", "/PID", str(self.game_process.pid)])
-                else:
-                    self.game_process.terminate()
-                    try:
-                        self.game_process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        self.game_process.kill()
-            except Exception as e:
-                logging.error(f"Could not kill game process: {e}")
+        if self.log_tailer:
+            self.log_tailer.stop()
+        self.tasks.cancel_all()
+        if self.tasks.tasks():
+            self.title("MONOLITH MOD MANAGER — finishing background tasks…")
+        self._finish_close(time.monotonic() + TASK_SHUTDOWN_TIMEOUT)
+
+    def _finish_close(self, deadline: float) -> None:
+        if self.tasks.tasks() and time.monotonic() < deadline:
+            self.after(100, lambda: self._finish_close(deadline))
+            return
+        self.tasks.shutdown(timeout=0)
+        self.instances.stop_all()
+        if self.api:
+            self.api.stop()
+        flush_settings()
+        self.ui.stop()
         self.destroy()
 
-def _safe_extract_tar(tar: tarfile.TarFile, dest: Path) -> None:
-    dest_r = dest.resolve()
-    for m in tar.getmembers():
-        if not (dest_r / m.name).resolve().is_relative_to(dest_r):
-            raise ValueError(f"Unsafe path in archive: {m.name}")
-    tar.extractall(dest, filter="data")
-
-def _safe_extract_zip(zf: zipfile.ZipFile, dest: Path) -> None:
-    dest_r = dest.resolve()
-    for m in zf.infolist():
-        if not (dest_r / m.filename).resolve().is_relative_to(dest_r):
-            raise ValueError(f"Unsafe path in archive: {m.filename}")
-    zf.extractall(dest)
-
-
 if __name__ == "__main__":
     ctk.set_appearance_mode("Dark")
     ctk.set_default_color_theme("dark-blue")
 
+    config = AppConfig.load()
     if os.name != "nt":
-        scaling = get_dpi_scaling()
+        scaling = _env_dpi_scaling() or config.dpi_scaling or get_dpi_scaling()
         ctk.set_widget_scaling(scaling)
         ctk.set_window_scaling(scaling)
+        if not config.dpi_scaling:
+            config.dpi_scaling = scaling
 
-    app = MonolithApp()
+    app = MonolithApp(config)
     app.check_incomplete_update()
+    if os.name != "nt" and _env_dpi_scaling() is None:
+        app.after(1000, app.refresh_dpi_scaling)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import logging
+import socket
+import threading
+from typing import Iterable, Protocol
+from urllib.parse import parse_qs, urlsplit
+
+API_MAX_HEADER = 65536
+API_MAX_BODY   = 1_048_576
+API_EVENT_QUEUE = 256
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiBackend(Protocol):
+    def status(self) -> dict: ...
+    def list_mods(self, search: str) -> list[dict]: ...
+    def toggle_mods(self, names: list[str], state: str | None) -> dict: ...
+    def catalog(self) -> list[dict]: ...
+    def downloads(self) -> list[dict]: ...
+    def start_downloads(self, urls: list[str]) -> dict: ...
+    def rcon(self, params: dict) -> dict: ...
+    def launch(self, profile: str | None) -> dict: ...
+
+
+_REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized",
+            403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+            413: "Payload Too Large", 415: "Unsupported Media Type",
+            500: "Internal Server Error", 502: "Bad Gateway"}
+
+
+class ApiServer:
+    def __init__(self, backend: ApiBackend, host: str = "127.0.0.1", port: int = 8765,
+                 token: str = "", hostnames: Iterable[str] = ()):
+        self.backend = backend
+        self.host = host
+        self.port = port
+        self.token = token
+        self.hostnames = [h.strip() for h in hostnames if h.strip()]
+        self._hosts: set[str] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._subscribers: set[asyncio.Queue] = set()
+        self._ready = threading.Event()
+        self._routes = {
+            ("GET",  "/status"):       self._status,
+            ("GET",  "/mods"):         self._mods,
+            ("POST", "/mods/toggle"):  self._toggle,
+            ("GET",  "/catalog"):      self._catalog,
+            ("GET",  "/downloads"):    self._downloads,
+            ("POST", "/downloads"):    self._start_downloads,
+            ("POST", "/rcon"):         self._rcon,
+            ("POST", "/launch"):       self._launch,
+        }
+
+    def start(self) -> "ApiServer":
+        if not self.token:
+            raise ValueError("Refusing to start the API without a token.")
+        threading.Thread(target=self._run, daemon=True, name="monolith-api").start()
+        self._ready.wait(5)
+        return self
+
+    def stop(self) -> None:
+        if self._loop and self._server:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def publish(self, event: str, data: dict) -> None:
+        if self._loop and self._subscribers:
+            self._loop.call_soon_threadsafe(self._fan_out, event, data)
+
+    def _fan_out(self, event: str, data: dict) -> None:
+        for q in self._subscribers:
+            if q.full():
+                q.get_nowait()
+            q.put_nowait((event, data))
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port,
+                                     limit=API_MAX_HEADER))
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._hosts = self._allowed_hosts()
+            logging.info(f"Control API listening on {self.host}:{self.port}")
+        except OSError as e:
+            logging.error(f"Control API failed to start: {e}")
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, query, headers, body = await self._read_request(reader)
+            self._check_origin(headers, writer.get_extra_info("sockname"))
+            self._check_auth(headers)
+            if (method, path) == ("GET", "/events"):
+                await self._stream_events(writer)
+                return
+            route = self._routes.get((method, path))
+            if not route:
+                known = any(p == path for _, p in self._routes)
+                raise ApiError(405 if known else 404, f"No route for {method} {path}")
+            ctype = headers.get("content-type", "").split(";")[0].strip().lower()
+            if (method == "POST" or body) and ctype != "application/json":
+                raise ApiError(415, "Content-Type must be application/json.")
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ApiError(400, "Request body must be a JSON object.")
+            status, result = await route(query, payload)
+            await self._respond(writer, status, result)
+        except ApiError as e:
+            await self._respond(writer, e.status, {"error": str(e)})
+        except json.JSONDecodeError as e:
+            await self._respond(writer, 400, {"error": f"Invalid JSON: {e}"})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except Exception as e:
+            logging.error(f"Control API request failed: {e}")
+            await self._respond(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise ApiError(400, "Malformed request line.")
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            raise ApiError(400, "Invalid Content-Length.")
+        if length < 0:
+            raise ApiError(400, "Invalid Content-Length.")
+        if length > API_MAX_BODY:
+            raise ApiError(413, "Request body too large.")
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        return method.upper(), url.path.rstrip("/") or "/", query, headers, body
+
+    def _allowed_hosts(self) -> set[str]:
+        names = {self.host, *self.hostnames}
+        if _is_loopback(self.host):
+            names |= {"localhost", "127.0.0.1", "::1"}
+        else:
+            # Wildcard and DNS-name binds are reached through this machine's own names.
+            names |= _local_names(self.host)
+        return {_host_header(n, self.port) for n in names if n}
+
+    def _check_origin(self, headers: dict, local: tuple | None = None) -> None:
+        if "origin" in headers:
+            raise ApiError(403, "Cross-origin requests are not allowed.")
+        allowed = self._hosts or self._allowed_hosts()
+        if local:
+            allowed = allowed | {_host_header(local[0], self.port)}
+        if headers.get("host", "").lower() not in allowed:
+            raise ApiError(403, "Unexpected Host header.")
+
+    def _check_auth(self, headers: dict) -> None:
+        supplied = headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied.encode(), self.token.encode()):
+            raise ApiError(401, "Missing or invalid token.")
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        q: asyncio.Queue = asyncio.Queue(maxsize=API_EVENT_QUEUE)
+        self._subscribers.add(q)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+            await writer.drain()
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(q.get(), timeout=15)
+                    writer.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+                except asyncio.TimeoutError:
+                    writer.write(b": keep-alive\n\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._subscribers.discard(q)
+
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def _status(self, query: dict, payload: dict):
+        return 200, await self._call(self.backend.status)
+
+    async def _mods(self, query: dict, payload: dict):
+        return 200, await self._call(self.backend.list_mods, query.get("search", ""))
+
+    async def _toggle(self, query: dict, payload: dict):
+        names = payload.get("names")
+        state = payload.get("state")
+        if not isinstance(names, list) or not names:
+            raise ApiError(400, "'names' must be a non-empty list.")
+        if state not in (None, "enable", "disable"):
+            raise ApiError(400, "'state' must be 'enable', 'disable' or null.")
+        return 200, await self._call(self.backend.toggle_mods, names, state)
+
+    async def _catalog(self, query: dict, payload: dict):
+        return 200, await self._call(self.backend.catalog)
+
+    async def _downloads(self, query: dict, payload: dict):
+        return 200, await self._call(self.backend.downloads)
+
+    async def _start_downloads(self, query: dict, payload: dict):
+        urls = payload.get("urls")
+        if not isinstance(urls, list) or not urls:
+            raise ApiError(400, "'urls' must be a non-empty list.")
+        return 202, await self._call(self.backend.start_downloads, urls)
+
+    async def _rcon(self, query: dict, payload: dict):
+        if not payload.get("command"):
+            raise ApiError(400, "'command' is required.")
+        return 200, await self._call(self.backend.rcon, payload)
+
+    async def _launch(self, query: dict, payload: dict):
+        return 202, await self._call(self.backend.launch, payload.get("profile"))
+
+
+def _host_header(name: str, port: int) -> str:
+    name = name.split("%")[0]
+    try:
+        addr = ipaddress.ip_address(name)
+    except ValueError:
+        return f"{name}:{port}".lower()
+    if addr.version == 6 and addr.ipv4_mapped:
+        addr = addr.ipv4_mapped
+    return f"[{addr}]:{port}" if addr.version == 6 else f"{addr}:{port}"
+
+def _local_names(host: str) -> set[str]:
+    hostname = socket.gethostname()
+    names = {"localhost", "127.0.0.1", "::1", hostname, socket.getfqdn()}
+    for name in {host, hostname} - {"", "0.0.0.0", "::"}:
+        try:
+            names |= {str(info[4][0]) for info in socket.getaddrinfo(name, None)}
+        except OSError:
+            pass
+    return names
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
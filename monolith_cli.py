@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from monolith_core import (
+    APP_VERSION, BAKE_NAME, NEAR_DUP_THRESHOLD, PATCH_BLOCK, REPACK_LEVEL, AppConfig, BatchError,
+    CatalogError, Mod, ModRepository, Profile, RconSession, fetch_catalog, is_bundle,
+    load_rcon_servers, make_patch, match_mods, parse_rcon_colored, _fmt_bytes,
+)
+
+
+class CliError(Exception):
+    pass
+
+
+def _emit(args: argparse.Namespace, payload, lines: list[str]) -> None:
+    if args.json:
+        print(json.dumps(payload, indent=None if args.compact else 2))
+    else:
+        for line in lines:
+            print(line)
+
+
+def _mod_dict(mod: Mod, order: int | None = None) -> dict:
+    d = {"name": mod.name, "enabled": mod.is_enabled, "size": mod.size_bytes,
+         "path": str(mod.path)}
+    if order is not None:
+        d["load_order"] = order
+    return d
+
+
+def _profile(config: AppConfig, name: str | None) -> Profile:
+    name = name or config.active_profile
+    if name not in config.profiles:
+        raise CliError(f"Unknown profile '{name}'.")
+    return config.profiles[name]
+
+
+def _repo(args: argparse.Namespace) -> ModRepository:
+    folder = args.folder
+    if not folder:
+        profile = _profile(AppConfig.load(), args.profile)
+        if not profile.mod_folder:
+            raise CliError(f"Profile '{profile.name}' has no base folder set.")
+        folder = profile.mod_folder
+    path = Path(folder)
+    if not path.is_dir():
+        raise CliError(f"Base folder not found: {path}")
+    return ModRepository(path)
+
+
+def cmd_profiles(args: argparse.Namespace) -> int:
+    config = AppConfig.load()
+    payload = [{"name": p.name, "active": p.name == config.active_profile,
+                "mod_folder": p.mod_folder, "game_exe": p.game_exe}
+               for p in config.profiles.values()]
+    _emit(args, payload, [f"{'*' if d['active'] else ' '} {d['name']}\t{d['mod_folder']}"
+                          for d in payload])
+    return 0
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    mods = _repo(args).list_mods(args.search)
+    if args.enabled:
+        mods = [m for m in mods if m.is_enabled]
+    elif args.disabled:
+        mods = [m for m in mods if not m.is_enabled]
+    payload = [_mod_dict(m, i) for i, m in enumerate(mods, 1)]
+    _emit(args, payload, [f"{m.status.value} {m.size_str:>10}  {m.name}" for m in mods])
+    return 0
+
+
+def cmd_toggle(args: argparse.Namespace) -> int:
+    repo = _repo(args)
+    mods, missing = match_mods(repo.list_mods(), args.names)
+    force = {"enable": "enable", "disable": "disable"}.get(args.command)
+    try:
+        delta = repo.toggle_many(mods, force)
+    except BatchError as e:
+        raise CliError(str(e))
+    changed = [old.name for old, _ in delta]
+    unchanged = [m.name for m in mods if m.name not in changed]
+    payload = {"changed": changed, "unchanged": unchanged, "not_found": missing}
+    _emit(args, payload, [f"{args.command}d: {n}" for n in changed]
+                         + [f"not found: {n}" for n in missing])
+    return 1 if missing else 0
+
+
+def cmd_activate(args: argparse.Namespace) -> int:
+    profile = _profile(AppConfig.load(), args.profile)
+    if not profile.pin_mods or profile.enabled_mods is None:
+        raise CliError(f"Profile '{profile.name}' has no pinned mod set.")
+    try:
+        delta = _repo(args).activate(set(profile.enabled_mods))
+    except BatchError as e:
+        raise CliError(str(e))
+    payload = {"enabled": [new.name for _, new in delta if new.is_enabled],
+               "disabled": [new.name for _, new in delta if not new.is_enabled]}
+    _emit(args, payload, [f"enabled: {n}" for n in payload["enabled"]]
+                         + [f"disabled: {n}" for n in payload["disabled"]])
+    return 0
+
+
+def cmd_install(args: argparse.Namespace) -> int:
+    repo = _repo(args)
+    srcs, bundles, failed = [], [], {}
+    for src in (Path(f) for f in args.files):
+        if src.is_file() and is_bundle(src):
+            bundles.append(src)
+        elif not src.is_file() or src.suffix.lower() != ".pk3":
+            failed[str(src)] = "not a PK3 file or mod package"
+        else:
+            srcs.append(src)
+    results = repo.install_many(srcs, overwrite=args.overwrite)
+    for bundle in bundles:
+        try:
+            found = repo.import_bundle(bundle, overwrite=args.overwrite)
+        except Exception as e:
+            found = {bundle.name: str(e)}
+        results.update(found or {bundle.name: "no PK3 files inside"})
+    installed = [n for n, err in results.items() if err is None]
+    skipped = [n for n, err in results.items() if err == "already exists"]
+    failed.update((n, err) for n, err in results.items() if err and n not in skipped)
+    payload = {"installed": installed, "skipped": skipped, "failed": failed}
+    _emit(args, payload, [f"installed: {n}" for n in installed]
+                         + [f"skipped (exists): {n}" for n in skipped]
+                         + [f"failed: {n}: {e}" for n, e in failed.items()])
+    return 1 if failed else 0
+
+
+def cmd_delete(args: argparse.Namespace) -> int:
+    repo = _repo(args)
+    mods, missing = match_mods(repo.list_mods(), args.names)
+    if not args.yes:
+        raise CliError(f"Refusing to delete {len(mods)} file(s) without --yes.")
+    deleted = [m.name for m in mods if repo.delete(m)]
+    failed = [m.name for m in mods if m.name not in deleted]
+    payload = {"deleted": deleted, "failed": failed, "not_found": missing}
+    _emit(args, payload, [f"deleted: {n}" for n in deleted]
+                         + [f"failed: {n}" for n in failed]
+                         + [f"not found: {n}" for n in missing])
+    return 1 if failed or missing else 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    count = _repo(args).export_manifest(Path(args.dest))
+    _emit(args, {"exported": count, "path": args.dest},
+          [f"Exported {count} mods to {args.dest}"])
+    return 0
+
+
+def cmd_duplicates(args: argparse.Namespace) -> int:
+    groups = _repo(args).find_duplicates(args.threshold)
+    payload = [{"kind": g.kind, "similarity": round(g.similarity, 3),
+                "reclaimable": g.reclaimable, "mods": [_mod_dict(m) for m in g.mods]}
+               for g in groups]
+    lines = []
+    for g in groups:
+        lines.append(f"{g.kind} ({g.similarity:.0%}), {len(g.mods)} files")
+        lines.extend(f"  {m.status.value} {m.size_str:>10}  {m.name}" for m in g.mods)
+    _emit(args, payload, lines)
+    return 0
+
+
+def cmd_repack(args: argparse.Namespace) -> int:
+    repo = _repo(args)
+    mods, missing = match_mods(repo.list_mods(), args.names) if args.names else (repo.list_mods(), [])
+    results = repo.repack_many(mods, args.level, args.rle_tga)
+    payload = {"results": [{"name": r.name, "before": r.before, "after": r.after,
+                            "dropped": r.dropped, "converted": r.converted, "error": r.error}
+                           for r in results],
+               "saved": sum(r.saved for r in results if not r.error), "not_found": missing}
+    _emit(args, payload, [f"failed: {r.name}: {r.error}" if r.error else
+                          f"{r.name}: {_fmt_bytes(r.before)} -> {_fmt_bytes(r.after)}"
+                          for r in results]
+                         + [f"not found: {n}" for n in missing]
+                         + [f"saved {_fmt_bytes(payload['saved'])}"])
+    return 1 if missing or any(r.error for r in results) else 0
+
+
+def cmd_bake(args: argparse.Namespace) -> int:
+    repo = _repo(args)
+    if args.command == "unbake":
+        try:
+            count = repo.unbake()
+        except BatchError as e:
+            raise CliError(str(e))
+        _emit(args, {"restored": count}, [f"restored {count} mod(s)"])
+        return 0
+    try:
+        rebuilt, count, skipped = repo.bake()
+    except BatchError as e:
+        raise CliError(str(e))
+    _emit(args, {"rebuilt": rebuilt, "sources": count, "bake": BAKE_NAME, "skipped": skipped},
+          [f"skipped unreadable: {n}" for n in skipped]
+          + [f"baked {count} mod(s) into {BAKE_NAME}" if rebuilt else "bake is up to date"])
+    return 1 if skipped else 0
+
+
+def cmd_catalog(args: argparse.Namespace) -> int:
+    try:
+        mods = fetch_catalog()
+    except CatalogError as e:
+        raise CliError(str(e))
+    term = args.search.lower()
+    if term:
+        mods = [m for m in mods
+                if any(term in str(m.get(k, "")).lower()
+                       for k in ("name", "category", "author", "uploader"))]
+    _emit(args, mods, [f"{m.get('name', '?')}\t{m.get('author', '—')}\t"
+                       f"{m.get('size', '—')}\t{m.get('download_url', '')}" for m in mods])
+    return 0
+
+
+def cmd_rcon(args: argparse.Namespace) -> int:
+    ip, port, pw = args.ip, args.port, args.password
+    if args.server:
+        servers = load_rcon_servers()
+        if args.server not in servers:
+            raise CliError(f"Unknown server '{args.server}'.")
+        sec = servers[args.server]
+        ip = ip or sec.get("ip", "")
+        port = port or sec.get("port", "")
+        pw = pw if pw is not None else sec.get("password", "")
+    if not (ip and port):
+        raise CliError("RCON needs --server or --ip and --port.")
+    cmd = " ".join(args.rcon_command)
+    with RconSession(ip, int(port), pw or "", timeout=args.timeout) as session:
+        session.send(cmd)
+        data = session.recv()
+    text = "".join(t for t, _ in parse_rcon_colored(data.decode("utf-8", "ignore")))
+    _emit(args, {"command": cmd, "reply": text}, [text])
+    return 0
+
+
+def cmd_make_patch(args: argparse.Namespace) -> int:
+    old, new = Path(args.old), Path(args.new)
+    for path in (old, new):
+        if not path.is_file():
+            raise CliError(f"File not found: {path}")
+    stats = make_patch(old, new, Path(args.output), args.block_size)
+    _emit(args, {"output": args.output, **stats},
+          [f"{args.output}: {_fmt_bytes(stats['size'])} "
+           f"(copied {_fmt_bytes(stats['copied'])}, literal {_fmt_bytes(stats['literal'])})"])
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="monolith",
+                                 description="Headless Monolith mod manager.")
+    ap.add_argument("--version", action="version", version=APP_VERSION)
+    ap.add_argument("-v", "--verbose", action="store_true",
+                    help="show tracebacks for unexpected errors")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", help="profile name (default: active profile)")
+    common.add_argument("--folder", help="base folder, overrides the profile")
+    common.add_argument("--json", action="store_true", help="print JSON")
+    common.add_argument("--compact", action="store_true", help="single-line JSON")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("profiles", parents=[common], help="list profiles")
+    p.set_defaults(func=cmd_profiles)
+
+    p = sub.add_parser("list", parents=[common], help="list mods in load order")
+    p.add_argument("--search", default="")
+    state = p.add_mutually_exclusive_group()
+    state.add_argument("--enabled", action="store_true")
+    state.add_argument("--disabled", action="store_true")
+    p.set_defaults(func=cmd_list)
+
+    for name in ("enable", "disable", "toggle"):
+        p = sub.add_parser(name, parents=[common], help=f"{name} mods (glob patterns allowed)")
+        p.add_argument("names", nargs="+")
+        p.set_defaults(func=cmd_toggle)
+
+    p = sub.add_parser("activate", parents=[common],
+                       help="apply the profile's pinned set of enabled mods")
+    p.set_defaults(func=cmd_activate)
+
+    p = sub.add_parser("install", parents=[common], help="install PK3 files or zip/tar mod packages")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--overwrite", action="store_true")
+    p.set_defaults(func=cmd_install)
+
+    p = sub.add_parser("delete", parents=[common], help="delete mods (glob patterns allowed)")
+    p.add_argument("names", nargs="+")
+    p.add_argument("--yes", action="store_true", help="confirm deletion")
+    p.set_defaults(func=cmd_delete)
+
+    p = sub.add_parser("export", parents=[common], help="write the JSON mod manifest")
+    p.add_argument("dest")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("duplicates", parents=[common], help="find identical and near-identical mods")
+    p.add_argument("--threshold", type=float, default=NEAR_DUP_THRESHOLD,
+                   help="shared-content ratio for near-duplicates (default: %(default)s)")
+    p.set_defaults(func=cmd_duplicates)
+
+    p = sub.add_parser("repack", parents=[common],
+                       help="recompress mods and strip junk files (default: all mods)")
+    p.add_argument("names", nargs="*")
+    p.add_argument("--level", type=int, choices=range(1, 10), default=REPACK_LEVEL)
+    p.add_argument("--rle-tga", action="store_true", help="RLE-compress uncompressed TGAs")
+    p.set_defaults(func=cmd_repack)
+
+    p = sub.add_parser("bake", parents=[common],
+                       help="merge enabled mods into one PK3 (rebuilds when they change)")
+    p.set_defaults(func=cmd_bake)
+
+    p = sub.add_parser("unbake", parents=[common], help="restore the mods merged by bake")
+    p.set_defaults(func=cmd_bake)
+
+    p = sub.add_parser("catalog", parents=[common], help="query the online mod database")
+    p.add_argument("--search", default="")
+    p.set_defaults(func=cmd_catalog)
+
+    p = sub.add_parser("rcon", parents=[common], help="send one RCON command")
+    p.add_argument("--server", help="saved server name from servers.ini")
+    p.add_argument("--ip")
+    p.add_argument("--port")
+    p.add_argument("--password")
+    p.add_argument("--timeout", type=float, default=5.0)
+    p.add_argument("rcon_command", nargs="+")
+    p.set_defaults(func=cmd_rcon)
+
+    p = sub.add_parser("make-patch", parents=[common],
+                       help="build a delta update asset from two release binaries")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("--block-size", type=int, default=PATCH_BLOCK)
+    p.set_defaults(func=cmd_make_patch)
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except CliError as e:
+        print(f"monolith: {e}", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"monolith: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        if args.verbose or os.environ.get("MONOLITH_DEBUG"):
+            raise
+        print(f"monolith: {e or type(e).__name__}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
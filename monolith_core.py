@@ -0,0 +1,2613 @@
+from __future__ import annotations
+
+import atexit
+import configparser
+import csv
+import ctypes
+import datetime
+import errno
+import fnmatch
+import io
+import itertools
+import json
+import logging
+import os
+import re
+import select
+import shutil
+import socket
+import stat
+import subprocess
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, asdict
+from enum import Enum
+from typing import TYPE_CHECKING, Callable
+import zipfile
+from pathlib import Path
+
+if TYPE_CHECKING:
+    import tarfile
+    from PIL import Image
+
+
+try:
+    from _version import __version__ as APP_VERSION
+except ImportError:
+    _version_file = Path(__file__).parent / "version.txt"
+    APP_VERSION = _version_file.read_text().strip() if _version_file.exists() else "0.0.0"
+
+
+def _load_pil():
+    import pil_config  # registers the bundled JPEG/PNG/TGA plugins
+    from PIL import Image
+    return Image
+
+
+def _platform_config_dir(app_name: str) -> Path:
+    if sys.platform.startswith("linux"):
+        base = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+        return base / app_name
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / app_name
+    elif os.name == "nt":
+        appdata = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
+        return Path(appdata) / app_name
+    return Path.home() / f".{app_name.lower()}"
+
+def _get_config_dir() -> Path:
+    old = _platform_config_dir("JK2ModManager")
+    new = _platform_config_dir("monolith")
+    if old.exists() and old.is_dir():
+        new.mkdir(parents=True, exist_ok=True)
+        for fname in ["config.json", "servers.ini", "error.log"]:
+            src = old / fname
+            if src.exists():
+                shutil.copy2(src, new / fname)
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        new.mkdir(parents=True, exist_ok=True)
+    return new
+
+CONFIG_DIR      = _get_config_dir()
+CONFIG_FILE     = CONFIG_DIR / "config.json"
+RCON_CONFIG_FILE = CONFIG_DIR / "servers.ini"
+LOG_FILE        = CONFIG_DIR / "error.log"
+MACRO_DIR       = CONFIG_DIR / "macros"
+RCON_LOG_DIR    = CONFIG_DIR / "rcon_logs"
+HASH_CACHE_FILE = CONFIG_DIR / "hash_cache.json"
+METRICS_FILE    = CONFIG_DIR / "metrics.jsonl"
+RELEASE_CACHE_FILE = CONFIG_DIR / "release.json"
+UPDATE_DIR      = CONFIG_DIR / "updates"
+
+logging.basicConfig(
+    filename=LOG_FILE,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+CONFIG_SAVE_DELAY = 0.5
+CONFIG_BACKUPS    = 3
+METRICS_MAX_BYTES = 1_048_576
+METRICS_BACKUPS   = 2
+METRICS_WINDOW    = 512
+
+TASK_POOLS: dict[str, int] = {"io": 4, "cpu": os.cpu_count() or 2, "net": 6}
+TASK_SHUTDOWN_TIMEOUT = 10.0
+
+DISABLED_DIR_NAME = "_disabled"
+JOURNAL_NAME      = ".monolith-journal.json"
+BAKE_NAME         = "zzzz_monolith_bake.pk3"
+BAKE_MANIFEST     = ".monolith-bake.json"
+
+PROTECTED_ASSETS: frozenset[str] = frozenset(
+    {f"assets{i}.pk3" for i in range(7)}
+    | {"assetsmv.pk3", "assetsmv2.pk3"}
+    | {"jk2pro-assets.pk3", "jk2pro-bins.pk3"}
+    | {"nwh-assets.pk3", "nwh-bins.pk3"}
+)
+
+JK2_COLORS: dict[str, str] = {
+    "0": "#383838", "1": "#ff4444", "2": "#44ff44", "3": "#ffff44",
+    "4": "#4488ff", "5": "#44ffff", "6": "#ff44ff", "7": "#ffffff",
+    "8": "#383838",
+}
+RCON_DEFAULT_COLOR = "#ffffff"
+RCON_CMD_COLOR     = "#00d4ff"
+RCON_MACRO_DELAY   = 0.5
+RCON_MACRO_SETTLE  = 1.5
+
+BUNDLE_SUFFIXES    = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz", ".7z")
+ASSET_CLASSES: dict[str, tuple[str, ...]] = {
+    "textures": (".tga", ".jpg", ".jpeg", ".png"),
+    "models":   (".glm", ".gla", ".md3", ".mdr", ".skin"),
+    "maps":     (".bsp", ".aas", ".arena"),
+    "sounds":   (".wav", ".mp3", ".ogg"),
+    "shaders":  (".shader",),
+}
+FOOTPRINT_WORKERS  = 8
+
+JUNK_FILES         = frozenset({"thumbs.db", ".ds_store", "desktop.ini"})
+STORED_EXTS        = frozenset({".jpg", ".jpeg", ".png", ".ogg", ".mp3", ".roq", ".pk3", ".zip"})
+REPACK_LEVEL       = 9
+REPACK_WORKERS     = 4
+
+NEAR_DUP_THRESHOLD = 0.8
+NEAR_DUP_MAX_POSTING = 64
+INSTALL_WORKERS    = 4
+COPY_CHUNK         = 8 * 1_048_576
+PART_STALE_AGE     = 24 * 3600
+
+LOG_EVENT_LIMIT    = 2000
+LOG_LINE_LIMIT     = 65536
+
+PROC_SAMPLE_INTERVAL = 5.0
+PROC_HISTORY_LIMIT   = 720
+RESTART_BACKOFF_BASE = 2.0
+RESTART_BACKOFF_MAX  = 300.0
+RESTART_STABLE_AFTER = 120.0
+
+CATALOG_URL = "https://jk2t.ddns.net/modmanager/api.php"
+VERSION_URL  = "https://raw.githubusercontent.com/fl4te/monolith/refs/heads/main/version.txt"
+RELEASES_URL = "https://api.github.com/repos/fl4te/monolith/releases/latest"
+DOWNLOAD_CHUNK = 65536
+UPDATE_CHECK_INTERVAL = 6 * 3600
+UPDATE_CHECK_DELAY    = 30.0
+UPDATE_IDLE_RETRY     = 120.0
+
+class ModStatus(Enum):
+    ENABLED  = "✔"
+    DISABLED = "✘"
+
+@dataclass
+class Mod:
+    path: Path
+    status: ModStatus
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def size_bytes(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    @property
+    def size_str(self) -> str:
+        return _fmt_bytes(self.size_bytes)
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.status == ModStatus.ENABLED
+
+@dataclass
+class Profile:
+    name:          str
+    mod_folder:    str = ""
+    game_exe:      str = ""
+    devmode:       bool = False
+    logfile:       bool = False
+    custom_params: str = ""
+    auto_restart:  bool = False
+    cpu_affinity:  str = ""
+    nice:          int = 0
+    pin_mods:      bool = False
+    enabled_mods:  list[str] | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def launch_params(self) -> list[str]:
+        return _build_launch_params(self.devmode, self.logfile, self.custom_params)
+
+    @staticmethod
+    def from_dict(name: str, d: dict) -> "Profile":
+        return Profile(
+            name=name,
+            mod_folder=d.get("mod_folder", ""),
+            game_exe=d.get("game_exe", ""),
+            devmode=d.get("devmode", False),
+            logfile=d.get("logfile", False),
+            custom_params=d.get("custom_params", ""),
+            auto_restart=d.get("auto_restart", False),
+            cpu_affinity=d.get("cpu_affinity", ""),
+            nice=d.get("nice", 0),
+            pin_mods=d.get("pin_mods", False),
+            enabled_mods=d.get("enabled_mods"),
+        )
+
+def _build_launch_params(devmode: bool, logfile: bool, custom: str) -> list[str]:
+    params = []
+    if devmode:
+        params.append("+developer 1")
+    if logfile:
+        params.append("+logfile 2")
+    custom = custom.strip()
+    if custom:
+        params.extend(custom.split())
+    return params
+
+def _atomic_write(path: Path, data: str, backups: int = CONFIG_BACKUPS) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if backups and path.exists():
+            for i in range(backups - 1, 0, -1):
+                older = path.with_name(f"{path.name}.{i}")
+                if older.exists():
+                    os.replace(older, path.with_name(f"{path.name}.{i + 1}"))
+            shutil.copy2(path, path.with_name(f"{path.name}.1"))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    if os.name != "nt":
+        fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def _read_with_backups(path: Path, parse: Callable[[str], object],
+                       backups: int = CONFIG_BACKUPS):
+    for candidate in [path] + [path.with_name(f"{path.name}.{i}") for i in range(1, backups + 1)]:
+        if not candidate.exists():
+            continue
+        try:
+            result = parse(candidate.read_text(encoding="utf-8"))
+        except Exception as e:
+            logging.error(f"Could not read {candidate.name}: {e}")
+            continue
+        if candidate != path:
+            logging.warning(f"{path.name} was unreadable; restored from {candidate.name}")
+        return result
+    return None
+
+class _DebouncedWriter:
+    def __init__(self, delay: float = CONFIG_SAVE_DELAY):
+        self.delay = delay
+        self._pending: dict[Path, str] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def schedule(self, path: Path, data: str) -> None:
+        with self._lock:
+            self._pending[path] = data
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                if self._timer:
+                    self._timer.cancel()
+                    self._timer = None
+            for path, data in pending.items():
+                try:
+                    _atomic_write(path, data)
+                except OSError as e:
+                    logging.error(f"Saving {path.name} failed: {e}")
+
+_PERSIST = _DebouncedWriter()
+atexit.register(_PERSIST.flush)
+
+def flush_settings() -> None:
+    _PERSIST.flush()
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("telemetry", "name", "fields", "start")
+
+    def __init__(self, telemetry: "Telemetry", name: str, fields: dict):
+        self.telemetry = telemetry
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.telemetry.record(self.name, (time.perf_counter() - self.start) * 1000, **self.fields)
+
+class Telemetry:
+    def __init__(self, enabled: bool = False, path: Path = METRICS_FILE):
+        self.enabled = enabled
+        self.path = path
+        self._samples: dict[str, deque] = {}
+        self._counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._log: logging.Logger | None = None
+
+    def configure(self, enabled: bool) -> None:
+        self.enabled = enabled
+        with self._lock:
+            if not enabled and self._log:
+                for h in self._log.handlers:
+                    h.close()
+                self._log.handlers.clear()
+                self._log = None
+
+    def span(self, name: str, **fields):
+        return _Span(self, name, fields) if self.enabled else _NULL_SPAN
+
+    def timed(self, name: str):
+        def deco(fn):
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Span(self, name, {}):
+                    return fn(*args, **kwargs)
+            wrapper.__name__ = fn.__name__
+            wrapper.__wrapped__ = fn
+            return wrapper
+        return deco
+
+    def record(self, name: str, value: float, **fields) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            q = self._samples.get(name)
+            if q is None:
+                q = self._samples[name] = deque(maxlen=METRICS_WINDOW)
+            q.append(value)
+        self._emit({"t": round(time.time(), 3), "op": name, "v": round(value, 3), **fields})
+
+    def count(self, name: str, n: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def summary(self) -> dict:
+        with self._lock:
+            samples = {k: sorted(q) for k, q in self._samples.items()}
+            counters = dict(self._counters)
+        ops = {}
+        for name, vals in sorted(samples.items()):
+            ops[name] = {
+                "count": len(vals),
+                "p50": vals[len(vals) // 2],
+                "p95": vals[min(len(vals) - 1, int(len(vals) * 0.95))],
+                "max": vals[-1],
+            }
+        return {"ops": ops, "counters": counters}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counters.clear()
+
+    def _logger(self) -> logging.Logger | None:
+        with self._lock:
+            if self._log is None:
+                import logging.handlers
+                log = logging.getLogger("monolith.metrics")
+                log.propagate = False
+                log.setLevel(logging.INFO)
+                if not log.handlers:
+                    try:
+                        handler = logging.handlers.RotatingFileHandler(
+                            self.path, maxBytes=METRICS_MAX_BYTES, backupCount=METRICS_BACKUPS,
+                            encoding="utf-8")
+                    except OSError as e:
+                        logging.error(f"Metrics log unavailable: {e}")
+                        self.enabled = False
+                        return None
+                    handler.setFormatter(logging.Formatter("%(message)s"))
+                    log.addHandler(handler)
+                self._log = log
+            return self._log
+
+    def _emit(self, entry: dict) -> None:
+        log = self._log or self._logger()
+        if log:
+            log.info(json.dumps(entry, separators=(",", ":")))
+
+TELEMETRY = Telemetry(enabled=os.environ.get("MONOLITH_TELEMETRY") == "1")
+
+class Cancelled(Exception):
+    pass
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise Cancelled("Cancelled.")
+
+    def wait(self, timeout: float) -> bool:
+        return self._event.wait(timeout)
+
+@dataclass
+class Task:
+    id:      int
+    name:    str
+    pool:    str
+    token:   CancelToken = field(default_factory=CancelToken)
+    state:   str = "queued"
+    done:    int = 0
+    total:   int = 0
+    detail:  str = ""
+    started: float = 0.0
+    future:  Future | None = None
+    on_exit: Callable[[], None] | None = None
+
+    def progress(self, done: int, total: int = 0, detail: str = "") -> None:
+        self.done, self.total = done, total or self.total
+        if detail:
+            self.detail = detail
+
+    def cancel(self) -> None:
+        self.token.cancel()
+        if self.future and self.future.cancel():
+            self.state = "cancelled"
+
+_task_local = threading.local()
+
+def current_task() -> Task | None:
+    return getattr(_task_local, "task", None)
+
+class TaskRunner:
+    def __init__(self, pools: dict[str, int] = TASK_POOLS):
+        self._pools = {name: ThreadPoolExecutor(max_workers=n, thread_name_prefix=f"monolith-{name}")
+                       for name, n in pools.items()}
+        self._tasks: dict[int, Task] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, name: str, fn: Callable, *args, pool: str = "io",
+               on_exit: Callable[[], None] | None = None, **kwargs) -> Task:
+        task = Task(next(self._ids), name, pool, on_exit=on_exit)
+        if self._closed:
+            task.state = "cancelled"
+            self._finish(task)
+            return task
+        with self._lock:
+            self._tasks[task.id] = task
+        task.future = self._pools[pool].submit(self._run, task, fn, args, kwargs)
+        task.future.add_done_callback(lambda _: self._finish(task))
+        return task
+
+    def _run(self, task: Task, fn: Callable, args: tuple, kwargs: dict):
+        if task.token.cancelled:
+            task.state = "cancelled"
+            return None
+        task.state, task.started = "running", time.monotonic()
+        _task_local.task = task
+        try:
+            result = fn(*args, **kwargs)
+            task.state = "done"
+            return result
+        except Cancelled:
+            task.state = "cancelled"
+        except Exception as e:
+            task.state, task.detail = "failed", str(e)
+            logging.exception(f"Task '{task.name}' failed")
+        finally:
+            _task_local.task = None
+        return None
+
+    def _finish(self, task: Task) -> None:
+        with self._lock:
+            self._tasks.pop(task.id, None)
+        if task.future and task.future.cancelled():
+            task.state = "cancelled"
+        if task.on_exit:
+            try:
+                task.on_exit()
+            except Exception:
+                logging.exception(f"Cleanup for task '{task.name}' failed")
+
+    def tasks(self) -> list[Task]:
+        with self._lock:
+            return list(self._tasks.values())
+
+    def cancel(self, task_id: int) -> None:
+        with self._lock:
+            task = self._tasks.get(task_id)
+        if task:
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        self._closed = True
+        for task in self.tasks():
+            task.cancel()
+
+    def shutdown(self, timeout: float = TASK_SHUTDOWN_TIMEOUT) -> bool:
+        self.cancel_all()
+        pending = [t.future for t in self.tasks() if t.future]
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _, not_done = wait(pending, timeout)
+        return not not_done
+
+@dataclass
+class AppConfig:
+    profiles:       dict[str, Profile] = field(default_factory=dict)
+    active_profile: str = "Default"
+    geometry:       str = "1100x720"
+    dpi_scaling:    float = 0.0
+    api_enabled:    bool = False
+    api_host:       str = "127.0.0.1"
+    api_port:       int = 8765
+    api_token:      str = ""
+    api_hostnames:  list[str] = field(default_factory=list)
+    telemetry:      bool = False
+    auto_update_check: bool = True
+
+    def to_dict(self) -> dict:
+        return {
+            "profiles": {n: p.to_dict() for n, p in self.profiles.items()},
+            "active_profile": self.active_profile,
+            "geometry": self.geometry,
+            "dpi_scaling": self.dpi_scaling,
+            "api_enabled": self.api_enabled,
+            "api_host": self.api_host,
+            "api_port": self.api_port,
+            "api_token": self.api_token,
+            "api_hostnames": self.api_hostnames,
+            "telemetry": self.telemetry,
+            "auto_update_check": self.auto_update_check,
+        }
+
+    @staticmethod
+    def load() -> "AppConfig":
+        try:
+            raw = _read_with_backups(CONFIG_FILE, json.loads)
+            if isinstance(raw, dict):
+                profiles = {
+                    n: Profile.from_dict(n, d)
+                    for n, d in raw.get("profiles", {}).items()
+                }
+                if not profiles:
+                    profiles = {"Default": Profile(name="Default")}
+                return AppConfig(
+                    profiles=profiles,
+                    active_profile=raw.get("active_profile", "Default"),
+                    geometry=raw.get("geometry", "1100x720"),
+                    dpi_scaling=raw.get("dpi_scaling", 0.0),
+                    api_enabled=raw.get("api_enabled", False),
+                    api_host=raw.get("api_host", "127.0.0.1"),
+                    api_port=raw.get("api_port", 8765),
+                    api_token=raw.get("api_token", ""),
+                    api_hostnames=list(raw.get("api_hostnames", [])),
+                    telemetry=raw.get("telemetry", False),
+                    auto_update_check=raw.get("auto_update_check", True),
+                )
+        except Exception as e:
+            logging.error(f"Config load failed: {e}")
+        return AppConfig(profiles={"Default": Profile(name="Default")})
+
+    def save(self) -> None:
+        try:
+            _PERSIST.schedule(CONFIG_FILE, json.dumps(self.to_dict(), separators=(",", ":")))
+        except Exception as e:
+            logging.error(f"Config save failed: {e}")
+
+class BatchError(Exception):
+    pass
+
+
+class ModRepository:
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self._disabled_dir = folder / DISABLED_DIR_NAME
+        self._disabled_dir.mkdir(parents=True, exist_ok=True)
+        self._journal = folder / JOURNAL_NAME
+        self.recover_journal()
+        _sweep_parts(folder)
+
+    @TELEMETRY.timed("list_mods")
+    def list_mods(self, search: str = "") -> list[Mod]:
+        mods: list[Mod] = []
+        s = search.lower()
+
+        def _scan(base: Path, status: ModStatus) -> None:
+            if not base.exists():
+                return
+            try:
+                for f in base.iterdir():
+                    if not f.is_file():
+                        continue
+                    if f.suffix.lower() != ".pk3":
+                        continue
+                    if f.name in PROTECTED_ASSETS:
+                        continue
+                    if s and s not in f.name.lower():
+                        continue
+                    mods.append(Mod(path=f, status=status))
+            except Exception as e:
+                logging.error(f"Scan error in {base}: {e}")
+
+        _scan(self.folder, ModStatus.ENABLED)
+        _scan(self._disabled_dir, ModStatus.DISABLED)
+        mods.sort(key=lambda m: m.name.lower())
+        return mods
+
+    def toggle(self, mod: Mod, force: str | None = None) -> bool:
+        if force == "enable" and mod.is_enabled:
+            return False
+        if force == "disable" and not mod.is_enabled:
+            return False
+        target = self.folder if not mod.is_enabled else self._disabled_dir
+        dest = target / mod.name
+        try:
+            target.mkdir(parents=True, exist_ok=True)
+            if os.name != "nt":
+                mod.path.chmod(mod.path.stat().st_mode | stat.S_IWUSR)
+            mod.path.rename(dest)
+            return True
+        except Exception as e:
+            logging.error(f"Toggle failed for {mod.name}: {e}")
+            return False
+
+    def plan_toggle(self, mods: list[Mod], force: str | None = None) -> list[tuple[Mod, Mod]]:
+        plan: list[tuple[Mod, Mod]] = []
+        for mod in mods:
+            if (force == "enable" and mod.is_enabled) or (force == "disable" and not mod.is_enabled):
+                continue
+            if mod.is_enabled:
+                new = Mod(path=self._disabled_dir / mod.name, status=ModStatus.DISABLED)
+            else:
+                new = Mod(path=self.folder / mod.name, status=ModStatus.ENABLED)
+            plan.append((mod, new))
+        return plan
+
+    def toggle_many(self, mods: list[Mod], force: str | None = None) -> list[tuple[Mod, Mod]]:
+        plan = self.plan_toggle(mods, force)
+        self._apply_moves([(old.path, new.path) for old, new in plan])
+        return plan
+
+    def activate(self, enabled: set[str]) -> list[tuple[Mod, Mod]]:
+        flip = [m for m in self.list_mods() if m.is_enabled != (m.name in enabled)]
+        return self.toggle_many(flip)
+
+    def _apply_moves(self, moves: list[tuple[Path, Path]]) -> None:
+        if not moves:
+            return
+        targets = [dst for _, dst in moves]
+        if len(set(targets)) != len(targets):
+            raise BatchError("Two moves target the same file.")
+        sources = {src for src, _ in moves}
+        clash = [dst.name for dst in targets if dst.exists() and dst not in sources]
+        if clash:
+            raise BatchError(f"Already exists: {', '.join(clash[:5])}"
+                             + (f" (+{len(clash) - 5} more)" if len(clash) > 5 else ""))
+        try:
+            self._write_journal(moves)
+        except OSError as e:
+            self._journal.with_suffix(".tmp").unlink(missing_ok=True)
+            raise BatchError(f"Could not write the move journal: {e.strerror or e}. "
+                             "No changes were made.")
+        done: list[tuple[Path, Path]] = []
+        try:
+            for src, dst in moves:
+                if os.name != "nt":
+                    src.chmod(src.stat().st_mode | stat.S_IWUSR)
+                src.rename(dst)
+                done.append((src, dst))
+        except OSError as e:
+            logging.error(f"Batch move failed at {src.name}: {e}; rolling back {len(done)} move(s)")
+            failed = self._undo_moves(done)
+            if not failed:
+                self._journal.unlink(missing_ok=True)
+            raise BatchError(f"{src.name}: {e.strerror or e}. "
+                             + (f"{failed} move(s) could not be rolled back."
+                                if failed else "No changes were made."))
+        self._journal.unlink(missing_ok=True)
+
+    def _write_journal(self, moves: list[tuple[Path, Path]]) -> None:
+        tmp = self._journal.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([[str(src), str(dst)] for src, dst in moves], f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._journal)
+
+    def _undo_moves(self, moves: list[tuple[Path, Path]]) -> int:
+        failed = 0
+        for src, dst in reversed(moves):
+            if src.exists() or not dst.exists():
+                continue
+            try:
+                dst.rename(src)
+            except OSError as e:
+                logging.error(f"Rollback failed for {dst.name}: {e}")
+                failed += 1
+        return failed
+
+    def recover_journal(self) -> int:
+        if not self._journal.exists():
+            return 0
+        try:
+            moves = [(Path(a), Path(b))
+                     for a, b in json.loads(self._journal.read_text(encoding="utf-8"))]
+        except (OSError, ValueError) as e:
+            logging.error(f"Unreadable journal {self._journal}: {e}")
+            return 0
+        pending = [(a, b) for a, b in moves if b.exists() and not a.exists()]
+        if self._undo_moves(pending) == 0:
+            self._journal.unlink(missing_ok=True)
+        if pending:
+            logging.warning(f"Rolled back {len(pending)} move(s) from an interrupted batch")
+        return len(pending)
+
+    def install(self, src: Path, overwrite: bool = False) -> bool:
+        try:
+            return self._install(src, overwrite)
+        except Exception as e:
+            logging.error(f"Install failed for {src.name}: {e}")
+            return False
+
+    def _install(self, src: Path, overwrite: bool, name: str | None = None) -> bool:
+        dest = self.folder / (name or src.name)
+        if dest.exists() and not overwrite:
+            return False
+        _validate_pk3(src)
+        tmp = _part_path(dest)
+        try:
+            _copy_file(src, tmp)
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dest)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return True
+
+    def _install_stream(self, fsrc: io.BufferedIOBase, name: str, overwrite: bool) -> str | None:
+        if name in PROTECTED_ASSETS:
+            return "protected base asset"
+        dest = _safe_member_path(self.folder, name)
+        if dest.exists() and not overwrite:
+            return "already exists"
+        tmp = _part_path(dest)
+        try:
+            with open(tmp, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+                fdst.flush()
+                os.fsync(fdst.fileno())
+            _validate_pk3(tmp)
+            os.replace(tmp, dest)
+        except zipfile.BadZipFile as e:
+            return f"not a valid PK3 ({e})"
+        finally:
+            tmp.unlink(missing_ok=True)
+        return None
+
+    def import_bundle(self, bundle: Path, overwrite: bool = False,
+                      cancel: CancelToken | None = None) -> dict[str, str | None]:
+        results: dict[str, str | None] = {}
+        for name, fsrc in _iter_bundle_pk3s(bundle):
+            if cancel and cancel.cancelled:
+                fsrc.close()
+                break
+            with fsrc:
+                results[name] = self._install_stream(fsrc, name, overwrite)
+            if results[name]:
+                logging.error(f"Bundle member {name} from {bundle.name}: {results[name]}")
+        return results
+
+    def install_many(self, srcs: list[Path], overwrite: bool = False,
+                     on_progress: Callable[[int, int], None] | None = None,
+                     workers: int = INSTALL_WORKERS,
+                     cancel: CancelToken | None = None,
+                     dest_names: dict[Path, str] | None = None) -> dict[str, str | None]:
+        results: dict[str, str | None] = {}
+        if not srcs:
+            return results
+        unique: list[Path] = []
+        seen: set[str] = set()
+        for src in srcs:
+            name = (dest_names or {}).get(src, src.name)
+            if name.lower() in seen:
+                results[str(src)] = f"another file in this install is also named {name}"
+                logging.error(f"Install skipped for {src}: duplicate name {name}")
+                continue
+            seen.add(name.lower())
+            unique.append(src)
+        lock = threading.Lock()
+
+        def _one(src: Path) -> None:
+            name = (dest_names or {}).get(src, src.name)
+            try:
+                if cancel:
+                    cancel.check()
+                err = None if self._install(src, overwrite, name) else "already exists"
+            except Cancelled:
+                err = "cancelled"
+            except zipfile.BadZipFile as e:
+                err = f"not a valid PK3 ({e})"
+            except Exception as e:
+                err = str(e)
+            if err:
+                logging.error(f"Install failed for {name}: {err}")
+            with lock:
+                results[name] = err
+                done = len(results)
+            if on_progress:
+                on_progress(done, len(srcs))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+            list(pool.map(_one, unique))
+        return results
+
+    def free_name(self, name: str, taken: set[str] | frozenset[str] = frozenset()) -> str:
+        stem, suffix = os.path.splitext(name)
+        for n in itertools.count(2):
+            candidate = f"{stem}_{n}{suffix}"
+            if (candidate.lower() not in taken and not (self.folder / candidate).exists()
+                    and not (self._disabled_dir / candidate).exists()):
+                return candidate
+
+    def delete(self, mod: Mod) -> bool:
+        try:
+            mod.path.unlink()
+            return True
+        except Exception as e:
+            logging.error(f"Delete failed for {mod.name}: {e}")
+            return False
+
+    def rename(self, mod: Mod, new_name: str) -> bool:
+        try:
+            mod.path.rename(mod.path.parent / new_name)
+            return True
+        except Exception as e:
+            logging.error(f"Rename failed: {e}")
+            return False
+
+    def export_manifest(self, dest_path: Path, cancel: CancelToken | None = None) -> int:
+        mods = self.list_mods()
+        records = []
+        for i, mod in enumerate(mods, 1):
+            if cancel:
+                cancel.check()
+            try:
+                st = mod.path.stat()
+                records.append({
+                    "name":          mod.name,
+                    "status":        mod.status.value,
+                    "load_order":    i,
+                    "size_mb":       round(st.st_size / 1_048_576, 4),
+                    "path":          str(mod.path),
+                    "sha256":        HASH_CACHE.sha256(mod.path),
+                    "last_modified": datetime.datetime.fromtimestamp(st.st_mtime)
+                                     .strftime("%Y-%m-%d %H:%M:%S"),
+                })
+            except Exception as e:
+                logging.error(f"Manifest error for {mod.name}: {e}")
+        HASH_CACHE.save()
+        dest_path.write_text(json.dumps(records, indent=4), encoding="utf-8")
+        return len(records)
+
+    def footprints(self, mods: list[Mod],
+                   cancel: CancelToken | None = None) -> dict[Path, Footprint]:
+        if not mods:
+            return {}
+        def _one(path: Path) -> Footprint:
+            if cancel:
+                cancel.check()
+            return footprint(path)
+        with ThreadPoolExecutor(max_workers=min(FOOTPRINT_WORKERS, len(mods))) as pool:
+            return dict(zip((m.path for m in mods), pool.map(_one, (m.path for m in mods))))
+
+    def repack(self, mod: Mod, level: int = REPACK_LEVEL, rle_tga: bool = False,
+               cancel: CancelToken | None = None) -> RepackResult:
+        return repack_pk3(mod.path, level, rle_tga, cancel=cancel)
+
+    def repack_many(self, mods: list[Mod], level: int = REPACK_LEVEL, rle_tga: bool = False,
+                    on_progress: Callable[[int, int], None] | None = None,
+                    cancel: CancelToken | None = None) -> list[RepackResult]:
+        results: list[RepackResult] = []
+        if not mods:
+            return results
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 2, len(mods))) as pool:
+            futures = [pool.submit(repack_pk3, m.path, level, rle_tga, 1) for m in mods]
+            for mod, fut in zip(mods, futures):
+                try:
+                    if cancel and cancel.cancelled and fut.cancel():
+                        raise Cancelled("cancelled")
+                    results.append(fut.result())
+                except Cancelled as e:
+                    results.append(RepackResult(mod.name, mod.size_bytes, mod.size_bytes, error=str(e)))
+                except Exception as e:
+                    logging.error(f"Repack failed for {mod.name}: {e}")
+                    results.append(RepackResult(mod.name, mod.size_bytes, mod.size_bytes, error=str(e)))
+                if on_progress:
+                    on_progress(len(results), len(mods))
+        return results
+
+    def _asset_floor(self) -> str:
+        return max((n.lower() for n in PROTECTED_ASSETS if (self.folder / n).exists()),
+                   default="")
+
+    def plan_reorder(self, order: list[Mod]) -> list[tuple[Mod, str]]:
+        # Renamed mods must still sort after the base assets, or those override them.
+        floor = self._asset_floor()
+        keys = [m.name.lower() for m in order]
+        kept = sorted(_longest_increasing(keys)) + [len(order)]
+        anchors, segments = [-1], []
+        k = 0
+        while k < len(kept):
+            a, j = anchors[-1], kept[k]
+            gap = order[a + 1:j]
+            names = _names_between(max(keys[a], floor) if a >= 0 else floor,
+                                   keys[j] if j < len(order) else None,
+                                   [_ORDER_PREFIX_RE.sub("", m.name) for m in gap])
+            if names is not None:
+                segments.append(list(zip(gap, names)))
+                anchors.append(j)
+                k += 1
+            elif j < len(order):
+                # No [0-9a-z] key fits below this neighbour: rename it as well.
+                k += 1
+            else:
+                anchors.pop()
+                segments.pop()
+        return [move for seg in segments for move in seg]
+
+    def reorder(self, order: list[Mod]) -> list[tuple[Mod, Mod]]:
+        plan = self.plan_reorder(order)
+        floor = self._asset_floor()
+        low = [new for _, new in plan if new.lower() <= floor]
+        if low:
+            raise BatchError(f"Refusing to rename {', '.join(low)} ahead of the base assets.")
+        tag = f".reorder-{os.getpid()}"
+        staged = [(m.path, m.path.with_name(f".{m.name}{tag}"), m.path.with_name(new))
+                  for m, new in plan]
+        self._apply_moves([(src, tmp) for src, tmp, _ in staged]
+                          + [(tmp, dst) for _, tmp, dst in staged])
+        return [(m, Mod(path=m.path.with_name(new), status=m.status)) for m, new in plan]
+
+    def bake_manifest(self) -> dict | None:
+        try:
+            return json.loads((self.folder / BAKE_MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def bake_sources(self) -> list[Mod]:
+        # Mods that sort before a base asset stay loose so they keep losing to it.
+        floor = self._asset_floor()
+        baked = {src["name"] for src in (self.bake_manifest() or {}).get("sources", [])}
+        return [m for m in self.list_mods()
+                if m.name != BAKE_NAME and m.name.lower() > floor
+                and (m.is_enabled or m.name in baked)]
+
+    def bake(self) -> tuple[bool, int, list[str]]:
+        sources, skipped = [], []
+        for m in self.bake_sources():
+            (sources if _mergeable_pk3(m.path) else skipped).append(m)
+        skipped_names = [m.name for m in skipped]
+        if skipped_names:
+            logging.warning(f"Bake left unreadable mods loose: {', '.join(skipped_names)}")
+        target = self.folder / BAKE_NAME
+        manifest = self.bake_manifest()
+        stamp = [_file_stamp(m) for m in sources]
+        if manifest and manifest.get("sources") == stamp and target.exists():
+            return False, len(sources), skipped_names
+        if not sources:
+            return False, 0, skipped_names
+        inputs = [m.path for m in sources]
+        old = (manifest or {}).get("sources", [])
+        if old and target.exists() and stamp[:len(old)] == old:
+            # Only mods after the last baked one changed: the old bake stands in for the prefix.
+            inputs = [target] + inputs[len(old):]
+        tmp = self.folder / f".{BAKE_NAME}.{os.getpid()}.part"
+        try:
+            _merge_pk3s(inputs, tmp)
+            _validate_pk3(tmp)
+            self._apply_moves([(m.path, self._disabled_dir / m.name)
+                               for m in sources if m.is_enabled])
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+        (self.folder / BAKE_MANIFEST).write_text(
+            json.dumps({"bake": BAKE_NAME, "sources": stamp}, separators=(",", ":")),
+            encoding="utf-8")
+        return True, len(sources), skipped_names
+
+    def unbake(self) -> int:
+        manifest = self.bake_manifest()
+        if not manifest:
+            return 0
+        moves = [(self._disabled_dir / s["name"], self.folder / s["name"])
+                 for s in manifest.get("sources", [])
+                 if (self._disabled_dir / s["name"]).exists()]
+        self._apply_moves(moves)
+        (self.folder / BAKE_NAME).unlink(missing_ok=True)
+        (self.folder / BAKE_MANIFEST).unlink(missing_ok=True)
+        return len(moves)
+
+    def find_duplicates(self, threshold: float = NEAR_DUP_THRESHOLD,
+                        cancel: CancelToken | None = None) -> list[DuplicateGroup]:
+        try:
+            return find_duplicates(self.list_mods(), threshold, cancel)
+        finally:
+            HASH_CACHE.save()
+
+    def get_preview_image(self, mod: Mod) -> Image.Image | None:
+        try:
+            with zipfile.ZipFile(mod.path, "r") as z:
+                return _pick_preview(z)
+        except Exception as e:
+            logging.debug(f"Preview extraction failed for {mod.name}: {e}")
+            return None
+
+def match_mods(mods: list[Mod], patterns: list[str]) -> tuple[list[Mod], list[str]]:
+    matched: dict[str, Mod] = {}
+    missing: list[str] = []
+    for pat in patterns:
+        hits = [m for m in mods if fnmatch.fnmatch(m.name.lower(), pat.lower())]
+        if not hits:
+            missing.append(pat)
+        for m in hits:
+            matched[m.name] = m
+    return list(matched.values()), missing
+
+def _validate_pk3(path: Path) -> None:
+    with open(path, "rb") as f, zipfile.ZipFile(f) as z:
+        limit = getattr(z, "start_dir", None) or os.fstat(f.fileno()).st_size
+        for info in z.infolist():
+            if info.header_offset < 0:
+                raise zipfile.BadZipFile(f"member {info.filename} is truncated")
+            f.seek(info.header_offset)
+            hdr = f.read(30)
+            if len(hdr) < 30 or hdr[:4] != b"PK\x03\x04":
+                raise zipfile.BadZipFile(f"bad local header for {info.filename}")
+            name_len = int.from_bytes(hdr[26:28], "little")
+            extra_len = int.from_bytes(hdr[28:30], "little")
+            if info.header_offset + 30 + name_len + extra_len + info.compress_size > limit:
+                raise zipfile.BadZipFile(f"member {info.filename} is truncated")
+
+_PART_PID_RE = re.compile(r"\.(\d+)\.(?:[^.]+\.)?part$")
+
+_PART_IDS = itertools.count(1)
+
+def _part_path(dest: Path) -> Path:
+    return dest.with_name(f".{dest.name}.{os.getpid()}.{next(_PART_IDS)}.part")
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        try:
+            code = ctypes.c_ulong()
+            return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(code))) and code.value == 259
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _sweep_parts(folder: Path) -> None:
+    now = time.time()
+    for part in folder.glob(".*.part"):
+        m = _PART_PID_RE.search(part.name)
+        try:
+            if m:
+                stale = not _pid_alive(int(m.group(1)))
+            else:
+                stale = now - part.stat().st_mtime > PART_STALE_AGE
+            if stale:
+                part.unlink()
+        except OSError as e:
+            logging.debug(f"Could not sweep {part.name}: {e}")
+
+def _copy_file(src: Path, dest: Path) -> None:
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(infd).st_size
+        try:
+            while remaining > 0:
+                step = min(COPY_CHUNK, remaining)
+                if hasattr(os, "copy_file_range"):
+                    n = os.copy_file_range(infd, outfd, step)
+                elif sys.platform == "linux":
+                    n = os.sendfile(outfd, infd, None, step)
+                else:
+                    break
+                if n == 0:
+                    break
+                remaining -= n
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+        shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+        fdst.flush()
+        os.fsync(outfd)
+
+@dataclass
+class Footprint:
+    files: int = 0
+    uncompressed: int = 0
+    compressed: int = 0
+    classes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ratio(self) -> float:
+        return self.compressed / self.uncompressed if self.uncompressed else 1.0
+
+    def summary(self) -> str:
+        parts = [f"{k} {_fmt_bytes(v)}" for k, v in
+                 sorted(self.classes.items(), key=lambda kv: -kv[1]) if v]
+        return (f"{self.files} files  ·  {_fmt_bytes(self.uncompressed)} unpacked  ·  "
+                f"{self.ratio:.0%} packed\n" + "\n".join(parts))
+
+_EXT_CLASS = {ext: cls for cls, exts in ASSET_CLASSES.items() for ext in exts}
+_FOOTPRINT_CACHE: dict[tuple[str, int, int], Footprint] = {}
+
+def footprint(path: Path) -> Footprint:
+    try:
+        st = path.stat()
+    except OSError:
+        return Footprint()
+    key = (path.name, st.st_size, st.st_mtime_ns)
+    cached = _FOOTPRINT_CACHE.get(key)
+    if cached:
+        return cached
+    fp = Footprint(classes=dict.fromkeys([*ASSET_CLASSES, "other"], 0))
+    try:
+        with zipfile.ZipFile(path) as z:
+            for info in z.infolist():
+                if info.is_dir():
+                    continue
+                fp.files += 1
+                fp.uncompressed += info.file_size
+                fp.compressed += info.compress_size
+                ext = os.path.splitext(info.filename)[1].lower()
+                fp.classes[_EXT_CLASS.get(ext, "other")] += info.file_size
+    except Exception as e:
+        logging.debug(f"Footprint failed for {path.name}: {e}")
+        return fp
+    _FOOTPRINT_CACHE[key] = fp
+    return fp
+
+class HashCache:
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, list] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def _load(self) -> dict[str, list]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, path: Path, st: os.stat_result | None = None) -> str | None:
+        st = st or path.stat()
+        with self._lock:
+            entry = self._load().get(str(path))
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def put(self, path: Path, digest: str, st: os.stat_result | None = None) -> None:
+        st = st or path.stat()
+        with self._lock:
+            self._load()[str(path)] = [st.st_size, st.st_mtime_ns, digest]
+            self._dirty = True
+
+    def sha256(self, path: Path) -> str:
+        try:
+            st = path.stat()
+        except OSError as e:
+            logging.error(f"SHA256 failed for {path}: {e}")
+            return "ERROR"
+        digest = self.get(path, st)
+        if digest is None:
+            digest = _sha256(path)
+            if digest != "ERROR":
+                self.put(path, digest, st)
+        return digest
+
+    def save(self) -> None:
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty or self._entries is None:
+                    return
+                live = {k: v for k, v in self._entries.items() if os.path.exists(k)}
+                self._dirty = False
+            try:
+                _atomic_write(self.path, json.dumps(live, separators=(",", ":")), backups=0)
+            except OSError as e:
+                logging.error(f"Could not save hash cache: {e}")
+                with self._lock:
+                    self._dirty = True
+
+HASH_CACHE = HashCache(HASH_CACHE_FILE)
+
+@dataclass
+class DuplicateGroup:
+    kind: str
+    mods: list[Mod]
+    similarity: float = 1.0
+
+    @property
+    def reclaimable(self) -> int:
+        sizes = sorted(m.size_bytes for m in self.mods)
+        return sum(sizes[:-1])
+
+def _crc_set(path: Path) -> frozenset[tuple[int, int]]:
+    try:
+        with zipfile.ZipFile(path) as z:
+            return frozenset((i.CRC, i.file_size) for i in z.infolist() if not i.is_dir())
+    except Exception as e:
+        logging.debug(f"Cannot fingerprint {path.name}: {e}")
+        return frozenset()
+
+def find_duplicates(mods: list[Mod], threshold: float = NEAR_DUP_THRESHOLD,
+                    cancel: CancelToken | None = None) -> list[DuplicateGroup]:
+    check = cancel.check if cancel else lambda: None
+    groups: list[DuplicateGroup] = []
+    by_size: dict[int, list[Mod]] = {}
+    for m in mods:
+        by_size.setdefault(m.size_bytes, []).append(m)
+    exact_members: set[Path] = set()
+    for same in by_size.values():
+        if len(same) < 2:
+            continue
+        by_hash: dict[str, list[Mod]] = {}
+        for m in same:
+            check()
+            by_hash.setdefault(HASH_CACHE.sha256(m.path), []).append(m)
+        for digest, hits in by_hash.items():
+            if digest != "ERROR" and len(hits) > 1:
+                groups.append(DuplicateGroup("exact", hits))
+                exact_members.update(m.path for m in hits[1:])
+
+    candidates = [m for m in mods if m.path not in exact_members]
+    fingerprints = []
+    for m in candidates:
+        check()
+        fingerprints.append(_crc_set(m.path))
+    index: dict[tuple[int, int], list[int]] = {}
+    for i, fp in enumerate(fingerprints):
+        for key in fp:
+            index.setdefault(key, []).append(i)
+    parent = list(range(len(candidates)))
+    def _root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    best: dict[int, float] = {}
+    for i, fp in enumerate(fingerprints):
+        check()
+        overlap: dict[int, int] = {}
+        for key in fp:
+            posting = index[key]
+            if len(posting) > NEAR_DUP_MAX_POSTING:
+                continue
+            for j in posting:
+                if j > i:
+                    overlap[j] = overlap.get(j, 0) + 1
+        for j, inter in overlap.items():
+            sim = inter / (len(fp) + len(fingerprints[j]) - inter)
+            if sim >= threshold:
+                ri, rj = _root(i), _root(j)
+                if ri != rj:
+                    parent[rj] = ri
+                best[i] = max(best.get(i, 0.0), sim)
+                best[j] = max(best.get(j, 0.0), sim)
+    clusters: dict[int, list[int]] = {}
+    for i in best:
+        clusters.setdefault(_root(i), []).append(i)
+    for members in clusters.values():
+        if len(members) > 1:
+            groups.append(DuplicateGroup("near", [candidates[i] for i in sorted(members)],
+                                         min(best[i] for i in members)))
+    groups.sort(key=lambda g: (g.kind != "exact", -g.reclaimable))
+    return groups
+
+@dataclass
+class RepackResult:
+    name: str
+    before: int
+    after: int
+    dropped: list[str] = field(default_factory=list)
+    converted: int = 0
+    error: str | None = None
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+def _is_junk(name: str) -> bool:
+    lo = name.lower()
+    base = lo.rsplit("/", 1)[-1]
+    return "__macosx/" in lo or base in JUNK_FILES or base.startswith("._")
+
+def _rle_tga(data: bytes) -> bytes | None:
+    if len(data) < 18 or data[2] not in (2, 3):
+        return None
+    try:
+        Image = _load_pil()
+        with Image.open(io.BytesIO(data)) as img:
+            out = io.BytesIO()
+            img.save(out, format="TGA", compression="tga_rle")
+    except Exception as e:
+        logging.debug(f"TGA RLE failed: {e}")
+        return None
+    packed = out.getvalue()
+    return packed if len(packed) < len(data) else None
+
+def _pack_member(z: zipfile.ZipFile, info: zipfile.ZipInfo, level: int, rle_tga: bool):
+    data = z.read(info)
+    converted = False
+    ext = os.path.splitext(info.filename)[1].lower()
+    if rle_tga and ext == ".tga":
+        packed = _rle_tga(data)
+        if packed is not None:
+            data, converted = packed, True
+    crc = zlib.crc32(data)
+    method, payload = zipfile.ZIP_STORED, data
+    if ext not in STORED_EXTS and data:
+        co = zlib.compressobj(level, zlib.DEFLATED, -15)
+        deflated = co.compress(data) + co.flush()
+        if len(deflated) < len(data):
+            method, payload = zipfile.ZIP_DEFLATED, deflated
+    return info, method, crc, len(data), payload, converted
+
+def _dos_time(date_time: tuple) -> tuple[int, int]:
+    y, mo, d, h, mi, sec = date_time
+    return (h << 11) | (mi << 5) | (sec // 2), (max(y, 1980) - 1980) << 9 | (mo << 5) | d
+
+class _RawZipWriter:
+    def __init__(self, fh):
+        self.fh = fh
+        self._central = bytearray()
+        self._count = 0
+
+    def add(self, info: zipfile.ZipInfo, method: int, crc: int, size: int, payload: bytes) -> None:
+        name = info.filename.encode("utf-8")
+        flags = 0 if info.filename.isascii() else 0x800
+        offset = self.fh.tell()
+        if size > 0xFFFFFFFF or offset + len(payload) > 0xFFFFFFFF:
+            raise ValueError("Archives over 4 GB are not supported.")
+        t, d = _dos_time(info.date_time)
+        self.fh.write(struct.pack("<IHHHHHIIIHH", 0x04034B50, 20, flags, method, t, d,
+                                  crc, len(payload), size, len(name), 0))
+        self.fh.write(name)
+        self.fh.write(payload)
+        self._central += struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, 20, 20, flags, method,
+                                     t, d, crc, len(payload), size, len(name), 0, 0, 0, 0,
+                                     info.external_attr & 0xFFFFFFFF, offset)
+        self._central += name
+        self._count += 1
+
+    def close(self) -> None:
+        cd_offset = self.fh.tell()
+        self.fh.write(self._central)
+        self.fh.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, self._count, self._count,
+                                  len(self._central), cd_offset, 0))
+
+def repack_pk3(path: Path, level: int = REPACK_LEVEL, rle_tga: bool = False,
+               workers: int = REPACK_WORKERS, cancel: CancelToken | None = None) -> RepackResult:
+    check = cancel.check if cancel else lambda: None
+    before = path.stat().st_size
+    result = RepackResult(path.name, before, before)
+    tmp = path.parent / f".{path.name}.{os.getpid()}.part"
+    try:
+        with zipfile.ZipFile(path) as z:
+            keep = []
+            for info in z.infolist():
+                if info.is_dir():
+                    continue
+                if _is_junk(info.filename):
+                    result.dropped.append(info.filename)
+                else:
+                    keep.append(info)
+            def _pack(info: zipfile.ZipInfo):
+                check()
+                return _pack_member(z, info, level, rle_tga)
+            workers = max(1, workers)
+            with ThreadPoolExecutor(max_workers=workers) as pool, open(tmp, "wb") as fh:
+                writer = _RawZipWriter(fh)
+                # Keep only a small window of packed members in flight so large
+                # PK3s are never held in memory all at once.
+                members, pending = iter(keep), deque()
+                while True:
+                    for info in itertools.islice(members, 2 * workers - len(pending)):
+                        pending.append(pool.submit(_pack, info))
+                    if not pending:
+                        break
+                    info, method, crc, size, payload, converted = pending.popleft().result()
+                    check()
+                    writer.add(info, method, crc, size, payload)
+                    result.converted += converted
+                writer.close()
+                fh.flush()
+                os.fsync(fh.fileno())
+        after = tmp.stat().st_size
+        if after < before:
+            _validate_pk3(tmp)
+            shutil.copystat(path, tmp)
+            os.replace(tmp, path)
+            result.after = after
+    finally:
+        tmp.unlink(missing_ok=True)
+    return result
+
+_ORDER_PREFIX_RE = re.compile(r"^[0-9a-z]+--", re.IGNORECASE)
+_KEY_CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _longest_increasing(keys: list[str]) -> list[int]:
+    import bisect
+    tails: list[str] = []
+    tail_idx: list[int] = []
+    prev = [-1] * len(keys)
+    for i, k in enumerate(keys):
+        pos = bisect.bisect_left(tails, k)
+        if pos == len(tails):
+            tails.append(k)
+            tail_idx.append(i)
+        else:
+            tails[pos] = k
+            tail_idx[pos] = i
+        prev[i] = tail_idx[pos - 1] if pos else -1
+    out = []
+    i = tail_idx[-1] if tail_idx else -1
+    while i != -1:
+        out.append(i)
+        i = prev[i]
+    return out[::-1]
+
+def _key_between(lo: str, hi: str | None) -> str | None:
+    key = ""
+    for i in itertools.count():
+        c_lo = lo[i] if i < len(lo) else None
+        c_hi = hi[i] if hi is not None and i < len(hi) else None
+        fits = [c for c in _KEY_CHARS
+                if (c_lo is None or c > c_lo) and (c_hi is None or c < c_hi)]
+        if fits:
+            return key + fits[len(fits) // 2]
+        # Nothing fits: follow lo (or hi, once lo is exhausted) one more char.
+        c = c_hi if c_lo is None else c_lo
+        if c not in _KEY_CHARS:
+            return None
+        key += c
+        if c_hi is not None and c < c_hi:
+            hi = None
+
+def _names_between(lo: str, hi: str | None, bases: list[str]) -> list[str] | None:
+    if not bases:
+        return []
+    mid = len(bases) // 2
+    key = _key_between(lo, hi)
+    if key is None:
+        return None
+    name = key + "--" + bases[mid]
+    if not (lo < name.lower() and (hi is None or name.lower() < hi)):
+        return None
+    left = _names_between(lo, name.lower(), bases[:mid])
+    right = _names_between(name.lower(), hi, bases[mid + 1:])
+    if left is None or right is None:
+        return None
+    return left + [name] + right
+
+def _file_stamp(mod: Mod) -> dict:
+    st = mod.path.stat()
+    return {"name": mod.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _raw_member(fh, info: zipfile.ZipInfo) -> bytes:
+    fh.seek(info.header_offset)
+    hdr = fh.read(30)
+    if hdr[:4] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"bad local header for {info.filename}")
+    skip = int.from_bytes(hdr[26:28], "little") + int.from_bytes(hdr[28:30], "little")
+    fh.seek(skip, os.SEEK_CUR)
+    return fh.read(info.compress_size)
+
+def _mergeable_pk3(path: Path) -> bool:
+    try:
+        with zipfile.ZipFile(path) as z:
+            return all(info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+                       for info in z.infolist())
+    except (OSError, zipfile.BadZipFile) as e:
+        logging.debug(f"Cannot merge {path.name}: {e}")
+        return False
+
+def _merge_pk3s(sources: list[Path], dest: Path) -> int:
+    winners: dict[str, tuple[int, zipfile.ZipInfo]] = {}
+    for i, src in enumerate(sources):
+        with zipfile.ZipFile(src) as z:
+            for info in z.infolist():
+                if not info.is_dir() and not _is_junk(info.filename):
+                    winners[info.filename.lower()] = (i, info)
+    by_source: dict[int, list[zipfile.ZipInfo]] = {}
+    for i, info in winners.values():
+        by_source.setdefault(i, []).append(info)
+    with open(dest, "wb") as out:
+        writer = _RawZipWriter(out)
+        for i, infos in sorted(by_source.items()):
+            with open(sources[i], "rb") as fh:
+                for info in sorted(infos, key=lambda x: x.header_offset):
+                    if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                        raise ValueError(f"{sources[i].name}: unsupported compression "
+                                         f"for {info.filename}")
+                    writer.add(info, info.compress_type, info.CRC, info.file_size,
+                               _raw_member(fh, info))
+        writer.close()
+        out.flush()
+        os.fsync(out.fileno())
+    return len(winners)
+
+@TELEMETRY.timed("sha256")
+def _sha256(path: Path) -> str:
+    import hashlib
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(65536):
+                h.update(chunk)
+            TELEMETRY.count("sha256.bytes", f.tell())
+        return h.hexdigest()
+    except Exception as e:
+        logging.error(f"SHA256 failed for {path}: {e}")
+        return "ERROR"
+
+PATCH_MAGIC  = b"MPATCH1\n"
+PATCH_BLOCK  = 4096
+PATCH_SUFFIX = ".mpatch"
+PATCH_CHUNK  = 1_048_576
+_PATCH_HEADER = struct.Struct("<8sIQ32sQ32s")
+_PATCH_COPY   = struct.Struct("<QI")
+_PATCH_DATA   = struct.Struct("<I")
+_OP_END, _OP_COPY, _OP_DATA = 0, 1, 2
+_ADLER_MOD = 65521
+
+class PatchError(Exception):
+    pass
+
+def delta_asset_name(asset_name: str, from_version: str) -> str:
+    stem = next((asset_name[:-len(ext)] for ext in (".tar.gz", ".zip", ".dmg")
+                 if asset_name.endswith(ext)), asset_name)
+    return f"{stem}-from-{from_version}{PATCH_SUFFIX}"
+
+def make_patch(old: Path, new: Path, dest: Path, block: int = PATCH_BLOCK) -> dict:
+    import hashlib
+    old_b, new_b = old.read_bytes(), new.read_bytes()
+    old_mv, new_mv = memoryview(old_b), memoryview(new_b)
+    index: dict[int, list[int]] = {}
+    for off in range(0, len(old_b) - block + 1, block):
+        index.setdefault(zlib.adler32(old_mv[off:off + block]), []).append(off)
+
+    comp = zlib.compressobj(9)
+    stats = {"copied": 0, "literal": 0}
+    with open(dest, "wb") as out:
+        out.write(_PATCH_HEADER.pack(PATCH_MAGIC, block,
+                                     len(old_b), hashlib.sha256(old_b).digest(),
+                                     len(new_b), hashlib.sha256(new_b).digest()))
+        pending: list[int] = []
+
+        def _flush_copy() -> None:
+            if pending:
+                out.write(comp.compress(bytes([_OP_COPY]) + _PATCH_COPY.pack(*pending)))
+                stats["copied"] += pending[1]
+                pending.clear()
+
+        def _literal(start: int, end: int) -> None:
+            if end > start:
+                _flush_copy()
+                out.write(comp.compress(bytes([_OP_DATA]) + _PATCH_DATA.pack(end - start)))
+                out.write(comp.compress(new_mv[start:end]))
+                stats["literal"] += end - start
+
+        n, p, lit = len(new_b), 0, 0
+        a = b = 0
+        if n >= block:
+            h = zlib.adler32(new_mv[:block])
+            a, b = h & 0xFFFF, h >> 16
+        while p + block <= n:
+            match = None
+            for off in index.get((b << 16) | a, ()):
+                if old_mv[off:off + block] == new_mv[p:p + block]:
+                    match = off
+                    break
+            if match is None:
+                if p + block < n:
+                    out_byte, in_byte = new_b[p], new_b[p + block]
+                    a = (a - out_byte + in_byte) % _ADLER_MOD
+                    b = (b - block * out_byte + a - 1) % _ADLER_MOD
+                p += 1
+                continue
+            _literal(lit, p)
+            length = block
+            while (p + length + block <= n and match + length + block <= len(old_b)
+                   and old_mv[match + length:match + length + block]
+                   == new_mv[p + length:p + length + block]):
+                length += block
+            if pending and pending[0] + pending[1] == match and lit == p:
+                pending[1] += length
+            else:
+                _flush_copy()
+                pending[:] = [match, length]
+            p += length
+            lit = p
+            if p + block <= n:
+                h = zlib.adler32(new_mv[p:p + block])
+                a, b = h & 0xFFFF, h >> 16
+        _literal(lit, n)
+        _flush_copy()
+        out.write(comp.compress(bytes([_OP_END])))
+        out.write(comp.flush())
+        stats["size"] = out.tell()
+    return stats
+
+def apply_patch(source: Path, patch: Path, dest: Path,
+                cancel: CancelToken | None = None) -> str:
+    import hashlib
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.part")
+    with open(patch, "rb") as pf:
+        header = pf.read(_PATCH_HEADER.size)
+        if len(header) < _PATCH_HEADER.size:
+            raise PatchError("patch is truncated")
+        magic, _, src_size, src_sha, dst_size, dst_sha = _PATCH_HEADER.unpack(header)
+        if magic != PATCH_MAGIC:
+            raise PatchError("not a Monolith patch")
+        if source.stat().st_size != src_size or _sha256(source) != src_sha.hex():
+            raise PatchError(f"patch does not apply to {source.name}")
+
+        d = zlib.decompressobj()
+        buf = bytearray()
+
+        def _need(k: int) -> None:
+            while len(buf) < k:
+                data = d.unconsumed_tail or pf.read(PATCH_CHUNK)
+                chunk = d.decompress(data, PATCH_CHUNK) if data else d.flush()
+                if not chunk and not data:
+                    raise PatchError("patch is truncated")
+                buf.extend(chunk)
+
+        def _take(k: int) -> bytes:
+            _need(k)
+            out = bytes(buf[:k])
+            del buf[:k]
+            return out
+
+        h = hashlib.sha256()
+        try:
+            with open(source, "rb") as src, open(tmp, "wb") as out:
+                while True:
+                    if cancel:
+                        cancel.check()
+                    op = _take(1)[0]
+                    if op == _OP_END:
+                        break
+                    if op == _OP_COPY:
+                        off, length = _PATCH_COPY.unpack(_take(_PATCH_COPY.size))
+                        if off + length > src_size:
+                            raise PatchError("copy outside the source file")
+                        src.seek(off)
+                        while length:
+                            chunk = src.read(min(length, PATCH_CHUNK))
+                            out.write(chunk)
+                            h.update(chunk)
+                            length -= len(chunk)
+                    elif op == _OP_DATA:
+                        (length,) = _PATCH_DATA.unpack(_take(_PATCH_DATA.size))
+                        while length:
+                            chunk = _take(min(length, PATCH_CHUNK))
+                            out.write(chunk)
+                            h.update(chunk)
+                            length -= len(chunk)
+                    else:
+                        raise PatchError(f"unknown patch opcode {op}")
+                if out.tell() != dst_size or h.digest() != dst_sha:
+                    raise PatchError("patched file does not match the expected hash")
+                out.flush()
+                os.fsync(out.fileno())
+            shutil.copymode(source, tmp)
+            os.replace(tmp, dest)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return h.hexdigest()
+
+def _version_tuple(v: str) -> tuple[int, int, int]:
+    try:
+        parts = v.replace("v", "").split(".")
+        while len(parts) < 3:
+            parts.append("0")
+        return tuple(map(int, parts[:3]))
+    except ValueError:
+        return (0, 0, 0)
+
+def _fmt_bytes(b: int) -> str:
+    if b >= 1_048_576:
+        return f"{b / 1_048_576:.2f} MB"
+    if b >= 1024:
+        return f"{b / 1024:.1f} KB"
+    return f"{b} B"
+
+def _fmt_duration(seconds: float) -> str:
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    d, h = divmod(h, 24)
+    return f"{d}d {h:02}:{m:02}:{s:02}" if d else f"{h:02}:{m:02}:{s:02}"
+
+@TELEMETRY.timed("pick_preview")
+def _pick_preview(z: zipfile.ZipFile) -> Image.Image | None:
+    IMG_EXT = {".jpg", ".jpeg", ".png", ".tga"}
+    FOLDER_SCORES = {
+        "levelshots/": 10000, "models/players/": 400,
+        "models/weapons2/": 300, "gfx/menus/": 100, "gfx/ui/": 50,
+    }
+    TRASH_KW = {"eye", "mouth", "face", "hand", "torso", "arm", "leg",
+                "hips", "cap", "_glow", "_spec", "_norm", "_reflect"}
+
+    best_name, best_score = None, -99999
+    for name in z.namelist():
+        lo = name.lower()
+        if name.endswith("/") or "__macosx" in lo or "thumbs.db" in lo:
+            continue
+        stem, ext = os.path.splitext(os.path.basename(lo))
+        if ext not in IMG_EXT:
+            continue
+        score = 1
+        for folder, w in FOLDER_SCORES.items():
+            if folder in lo:
+                score += w
+                break
+        if stem == "preview":           score += 1600
+        elif stem == "icon_default":    score += 1500
+        elif stem == "levelshot":       score += 1000
+        elif stem.startswith("map_"):   score += 400
+        if any(k in lo for k in ("icon_blue", "icon_red", "_blue", "_red", "/team/")):
+            score -= 800
+        if any(k in stem for k in TRASH_KW):
+            score -= 15000
+        if ext in (".jpg", ".jpeg", ".png", ".tga"):
+            score += 10
+        if score > best_score:
+            best_score, best_name = score, name
+
+    if not best_name:
+        return None
+    Image = _load_pil()
+    with z.open(best_name) as fh:
+        data = io.BytesIO(fh.read())
+        img = Image.open(data)
+        img.load()
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.mode else "RGB")
+        return img
+
+def parse_rcon_colored(raw: str) -> list[tuple[str, str]]:
+    raw = _strip_rcon_header(raw)
+    lines = [ln.rstrip() for ln in raw.split("\n") if ln.strip()]
+    joined = "\n".join(lines)
+    if not joined:
+        return []
+    segments: list[tuple[str, str]] = []
+    color = RCON_DEFAULT_COLOR
+    buf = ""
+    i = 0
+    while i < len(joined):
+        ch = joined[i]
+        if ch == "^" and i + 1 < len(joined) and joined[i + 1] in JK2_COLORS:
+            if buf:
+                segments.append((buf, color))
+                buf = ""
+            color = JK2_COLORS[joined[i + 1]]
+            i += 2
+        else:
+            buf += ch
+            i += 1
+    if buf:
+        segments.append((buf, color))
+    return segments
+
+def _strip_rcon_header(raw: str) -> str:
+    if raw.startswith("\xff\xff\xff\xff"):
+        raw = raw[4:]
+    if raw.startswith("print\n"):
+        raw = raw[6:]
+    return raw
+
+def _strip_colors(text: str) -> str:
+    return re.sub(r"\^[0-9]", "", text)
+
+class RconSession:
+    def __init__(self, ip: str, port: int, password: str, timeout: float = 5.0):
+        self.address = (ip, port)
+        self.password = password
+        self.timeout = timeout
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._sock.settimeout(timeout)
+            self._sock.connect(self.address)
+        except OSError:
+            self._sock.close()
+            raise
+        self._sent_at: float | None = None
+
+    def __enter__(self) -> "RconSession":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def send(self, cmd: str) -> None:
+        self._sock.send(
+            b"\xff\xff\xff\xffrcon %s %s\n" % (self.password.encode(), cmd.encode()))
+        if TELEMETRY.enabled:
+            self._sent_at = time.perf_counter()
+
+    def _replied(self) -> None:
+        if self._sent_at is not None:
+            TELEMETRY.record("rcon.rtt", (time.perf_counter() - self._sent_at) * 1000)
+            self._sent_at = None
+
+    def recv(self) -> bytes:
+        self._sock.settimeout(self.timeout)
+        data = self._sock.recv(65535)
+        self._replied()
+        return data
+
+    def drain(self, window: float) -> list[bytes]:
+        packets: list[bytes] = []
+        deadline = time.monotonic() + window
+        while (left := deadline - time.monotonic()) > 0:
+            self._sock.settimeout(left)
+            try:
+                packets.append(self._sock.recv(65535))
+            except socket.timeout:
+                break
+            self._replied()
+        return packets
+
+    def close(self) -> None:
+        self._sock.close()
+
+def load_rcon_script(path: Path) -> list[str]:
+    commands: list[str] = []
+    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", "//")):
+            continue
+        commands.append(line)
+    return commands
+
+def run_rcon_macro(session: RconSession, commands: list[str], delay: float,
+                   log_path: Path,
+                   on_reply: Callable[[str, str], None] | None = None,
+                   settle: float = RCON_MACRO_SETTLE,
+                   cancel: CancelToken | None = None) -> int:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    replies = 0
+    with open(log_path, "a", encoding="utf-8") as log:
+        log.write(f"# {datetime.datetime.now():%Y-%m-%d %H:%M:%S} "
+                  f"{session.address[0]}:{session.address[1]} "
+                  f"{len(commands)} command(s), {delay:.2f}s apart\n")
+        for i, cmd in enumerate(commands):
+            if cancel and cancel.cancelled:
+                log.write(f"# cancelled before command {i + 1}\n")
+                break
+            session.send(cmd)
+            log.write(f">>> {cmd}\n")
+            last = i == len(commands) - 1
+            for packet in session.drain(settle if last else delay):
+                text = _strip_rcon_header(packet.decode("utf-8", "ignore"))
+                log.write(_strip_colors(text).rstrip("\n") + "\n")
+                replies += 1
+                if on_reply:
+                    on_reply(cmd, text)
+            log.flush()
+    return replies
+
+def load_rcon_servers() -> configparser.ConfigParser:
+    def _parse(text: str) -> configparser.ConfigParser:
+        cfg = configparser.ConfigParser()
+        cfg.read_string(text)
+        return cfg
+    return _read_with_backups(RCON_CONFIG_FILE, _parse) or configparser.ConfigParser()
+
+def save_rcon_servers(cfg: configparser.ConfigParser) -> None:
+    buf = io.StringIO()
+    cfg.write(buf)
+    _PERSIST.schedule(RCON_CONFIG_FILE, buf.getvalue())
+
+class CatalogError(Exception):
+    pass
+
+def fetch_catalog(timeout: float = 8, url: str = CATALOG_URL) -> list[dict]:
+    import requests
+    headers = {"User-Agent": f"Monolith-App-Client/{APP_VERSION}"}
+    try:
+        with TELEMETRY.span("catalog.fetch"):
+            resp = requests.get(url, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        with TELEMETRY.span("catalog.parse", bytes=len(resp.content)):
+            return resp.json()
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code
+        if status == 503:
+            try:
+                msg = e.response.json().get("message", "Server maintenance.")
+            except Exception:
+                msg = "Server is temporarily unavailable for maintenance."
+        elif status == 426:
+            try:
+                msg = e.response.json().get("message", "Update available.")
+            except Exception:
+                msg = "Your app version is outdated. Please update."
+        else:
+            msg = f"Server Error ({status})"
+        raise CatalogError(msg) from e
+    except Exception as e:
+        raise CatalogError(f"Fetch failed: {e}") from e
+
+_CATALOG_DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y")
+
+def _catalog_date(m: dict) -> datetime.datetime:
+    raw = m.get("date", "")
+    for fmt in _CATALOG_DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+    return datetime.datetime.min
+
+def filter_catalog(mods: list[dict], search: str = "") -> list[dict]:
+    term = search.lower()
+    if not term:
+        return sorted(mods, key=_catalog_date, reverse=True)
+
+    def score(m: dict) -> int:
+        s = 0
+        if term in m.get("name",     "").lower(): s += 4
+        if term in m.get("category", "").lower(): s += 3
+        if term in m.get("author",   "").lower(): s += 2
+        if term in m.get("uploader", "").lower(): s += 1
+        return s
+    hits = [(sc, m) for m in mods if (sc := score(m)) > 0]
+    hits.sort(key=lambda t: (-t[0], t[1].get("name", "").lower()))
+    return [m for _, m in hits]
+
+class IntegrityError(Exception):
+    pass
+
+def download_file(url: str, dest: Path,
+                  on_progress: Callable[[int, int], None] | None = None,
+                  timeout: float = 15, cancel: CancelToken | None = None,
+                  resume: bool = False, sha256: str | None = None) -> str:
+    import hashlib
+    import requests
+    started = time.perf_counter()
+    tmp = dest.with_name(f".{dest.name}.part") if resume else _part_path(dest)
+    offset = tmp.stat().st_size if resume and tmp.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    h = hashlib.sha256()
+    finished = False
+    try:
+        with requests.get(url, stream=True, timeout=timeout, headers=headers) as resp:
+            if resp.status_code == 416:
+                tmp.unlink(missing_ok=True)
+            resp.raise_for_status()
+            if resp.status_code != 206:
+                offset = 0
+            total = int(resp.headers.get("content-length", 0))
+            total = total + offset if total else 0
+            done = offset
+            if offset:
+                with open(tmp, "rb") as fh:
+                    while chunk := fh.read(DOWNLOAD_CHUNK):
+                        h.update(chunk)
+            with open(tmp, "ab" if offset else "wb") as fh:
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK):
+                    if cancel:
+                        cancel.check()
+                    fh.write(chunk)
+                    h.update(chunk)
+                    done += len(chunk)
+                    if on_progress:
+                        on_progress(done, total)
+        digest = h.hexdigest()
+        if sha256 and digest != sha256.lower():
+            tmp.unlink(missing_ok=True)
+            raise IntegrityError(f"Hash mismatch for {dest.name}.")
+        os.replace(tmp, dest)
+        finished = True
+    finally:
+        if finished or not resume:
+            tmp.unlink(missing_ok=True)
+    elapsed = time.perf_counter() - started
+    fetched = done - offset
+    TELEMETRY.record("download.kib_per_s", fetched / 1024 / max(elapsed, 1e-6),
+                     bytes=fetched, seconds=round(elapsed, 3))
+    TELEMETRY.count("download.bytes", fetched)
+    return digest
+
+class UpdateError(Exception):
+    pass
+
+def release_version(release: dict) -> str:
+    return str(release.get("tag_name", "")).lstrip("v").split("-")[0]
+
+def fetch_release(timeout: float = 6, url: str = RELEASES_URL, max_age: float = 0,
+                  expect: str = "") -> dict:
+    import requests
+    cache = _read_with_backups(RELEASE_CACHE_FILE, json.loads, backups=0)
+    if not isinstance(cache, dict) or cache.get("url") != url:
+        cache = {}
+    cached = cache.get("release")
+    if (cached and max_age and time.time() - cache.get("checked", 0) < max_age
+            and _version_tuple(release_version(cached)) >= _version_tuple(expect)):
+        return cached
+
+    headers = {"Accept": "application/vnd.github+json",
+               "User-Agent": f"Monolith-App-Client/{APP_VERSION}"}
+    if cached and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    try:
+        resp = requests.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and cached:
+            release, etag = cached, cache["etag"]
+        else:
+            resp.raise_for_status()
+            release, etag = resp.json(), resp.headers.get("ETag", "")
+    except (requests.RequestException, ValueError) as e:
+        if not cached:
+            raise UpdateError(f"Release check failed: {e}") from e
+        logging.warning(f"Release check failed, using the cached release: {e}")
+        return cached
+    _atomic_write(RELEASE_CACHE_FILE, json.dumps(
+        {"url": url, "etag": etag, "checked": time.time(), "release": release}), backups=0)
+    return release
+
+_ASSET_LOCKS: dict[Path, threading.Lock] = {}
+_ASSET_LOCKS_GUARD = threading.Lock()
+
+def fetch_asset(asset: dict, folder: Path,
+                on_progress: Callable[[int, int], None] | None = None,
+                cancel: CancelToken | None = None, retries: int = 3) -> Path:
+    path = folder / asset["name"]
+    with _ASSET_LOCKS_GUARD:
+        lock = _ASSET_LOCKS.setdefault(path, threading.Lock())
+    # A background pre-download may already be writing this asset's resume file:
+    # wait for it, then reuse what it fetched.
+    while not lock.acquire(timeout=0.2):
+        if cancel:
+            cancel.check()
+    try:
+        return _fetch_asset(asset, path, on_progress, cancel, retries)
+    finally:
+        lock.release()
+
+def _fetch_asset(asset: dict, path: Path, on_progress: Callable[[int, int], None] | None,
+                 cancel: CancelToken | None, retries: int) -> Path:
+    folder = path.parent
+    expected = asset.get("sha256")
+    if path.exists():
+        if expected and HASH_CACHE.sha256(path) == expected:
+            return path
+        if not expected and path.stat().st_size == asset.get("size"):
+            return path
+    folder.mkdir(parents=True, exist_ok=True)
+    for attempt in range(retries):
+        try:
+            digest = download_file(asset["browser_download_url"], path, on_progress,
+                                   cancel=cancel, resume=True, sha256=expected)
+            break
+        except (Cancelled, IntegrityError):
+            raise
+        except Exception:
+            if attempt == retries - 1:
+                raise
+            if cancel:
+                cancel.wait(2)
+                cancel.check()
+            else:
+                time.sleep(2)
+    HASH_CACHE.put(path, digest)
+    HASH_CACHE.save()
+    return path
+
+def prune_updates(keep: Path) -> None:
+    if not UPDATE_DIR.is_dir():
+        return
+    for entry in UPDATE_DIR.iterdir():
+        if entry == keep:
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+@dataclass
+class LogEvent:
+    seq:  int
+    kind: str
+    time: float
+    data: dict
+    raw:  str
+
+_LOG_TIME_RE = re.compile(r"^\s*\d+:\d{2}\s+")
+_LOG_PATTERNS: list[tuple[str, re.Pattern]] = [
+    ("kill",       re.compile(r"^Kill: (?P<killer_id>\d+) (?P<victim_id>\d+) \d+: "
+                              r"(?P<killer>.*) killed (?P<victim>.*) by (?P<weapon>\w+)$")),
+    ("connect",    re.compile(r"^ClientConnect: (?P<client>\d+)")),
+    ("disconnect", re.compile(r"^ClientDisconnect: (?P<client>\d+)")),
+    ("userinfo",   re.compile(r"^ClientUserinfoChanged: (?P<client>\d+) n\\(?P<name>[^\\]*)")),
+    ("chat",       re.compile(r"^(?P<channel>say|sayteam|tell): (?P<name>.*?): (?P<message>.*)$")),
+    ("connect",    re.compile(r"^(?P<name>.+?)\^7 connected$")),
+    ("disconnect", re.compile(r"^(?P<name>.+?)\^7 disconnected$")),
+]
+
+def parse_log_line(line: str) -> tuple[str, dict] | None:
+    line = _LOG_TIME_RE.sub("", line.rstrip("\r\n"))
+    for kind, pattern in _LOG_PATTERNS:
+        m = pattern.match(line)
+        if m:
+            return kind, {k: _strip_colors(v) for k, v in m.groupdict().items()}
+    return None
+
+def _find_qconsole_log(base_folder: Path) -> Path:
+    candidates = [base_folder / "qconsole.log"]
+    if os.name != "nt":
+        candidates.append(Path.home() / ".jk2mv" / base_folder.name / "qconsole.log")
+    return next((c for c in candidates if c.exists()), candidates[0])
+
+class _Inotify:
+    IN_MODIFY, IN_MOVED_FROM, IN_MOVED_TO = 0x002, 0x040, 0x080
+    IN_CREATE, IN_DELETE = 0x100, 0x200
+    IN_NONBLOCK, IN_CLOEXEC = 0o4000, 0o2000000
+
+    def __init__(self, folder: Path):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = (self.IN_MODIFY | self.IN_MOVED_FROM | self.IN_MOVED_TO
+                | self.IN_CREATE | self.IN_DELETE)
+        if libc.inotify_add_watch(self.fd, str(folder).encode(), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+class LogTailer:
+    def __init__(self, path: Path, maxlen: int = LOG_EVENT_LIMIT,
+                 poll_interval: float = 0.5, from_start: bool = False):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.events: deque[LogEvent] = deque(maxlen=maxlen)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._inode: int | None = None
+        self._offset = 0
+        self._partial = b""
+        self._from_start = from_start
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "LogTailer":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def events_since(self, seq: int) -> list[LogEvent]:
+        with self._lock:
+            return [e for e in self.events if e.seq > seq]
+
+    def _run(self) -> None:
+        watcher = None
+        if sys.platform.startswith("linux"):
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                watcher = _Inotify(self.path.parent)
+            except Exception as e:
+                logging.debug(f"inotify unavailable, polling {self.path}: {e}")
+        try:
+            if not self._from_start:
+                self._seek_to_end()
+            while not self._stop.is_set():
+                try:
+                    self._read_new()
+                except Exception as e:
+                    logging.debug(f"Log tail read failed for {self.path}: {e}")
+                if watcher:
+                    watcher.wait(self.poll_interval)
+                else:
+                    self._stop.wait(self.poll_interval)
+        finally:
+            if watcher:
+                watcher.close()
+
+    def _seek_to_end(self) -> None:
+        try:
+            st = self.path.stat()
+            self._inode, self._offset = st.st_ino, st.st_size
+        except OSError:
+            pass
+
+    def _read_new(self) -> None:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._inode, self._offset, self._partial = st.st_ino, 0, b""
+        if st.st_size == self._offset:
+            return
+        with open(self.path, "rb") as fh:
+            fh.seek(self._offset)
+            while chunk := fh.read(65536):
+                self._offset += len(chunk)
+                *lines, self._partial = (self._partial + chunk).split(b"\n")
+                if len(self._partial) > LOG_LINE_LIMIT:
+                    self._partial = b""
+                for line in lines:
+                    self._handle_line(line.decode("utf-8", "replace"))
+
+    def _handle_line(self, line: str) -> None:
+        parsed = parse_log_line(line)
+        if not parsed:
+            return
+        kind, data = parsed
+        with self._lock:
+            self._seq += 1
+            self.events.append(LogEvent(self._seq, kind, time.time(), data, line.rstrip("\r")))
+
+@dataclass
+class ProcessSample:
+    time:        float
+    pid:         int
+    uptime:      float
+    cpu_percent: float
+    rss_bytes:   int
+
+_CLK_TCK   = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def _read_proc_stat(pid: int) -> tuple[int, int] | None:
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as fh:
+            raw = fh.read()
+    except OSError:
+        return None
+    fields = raw[raw.rfind(b")") + 2:].split()
+    return int(fields[11]) + int(fields[12]), int(fields[21]) * _PAGE_SIZE
+
+def _parse_cpu_list(spec: str) -> set[int]:
+    cpus: set[int] = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+def _priority_creationflags(nice: int) -> int:
+    if os.name != "nt" or not nice:
+        return 0
+    if nice >= 10:
+        return subprocess.IDLE_PRIORITY_CLASS
+    if nice > 0:
+        return subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    if nice <= -10:
+        return subprocess.HIGH_PRIORITY_CLASS
+    return subprocess.ABOVE_NORMAL_PRIORITY_CLASS
+
+def _terminate_process(proc: subprocess.Popen, timeout: float = 5) -> None:
+    if proc.poll() is not None:
+        return
+    if os.name == "nt":
+        subprocess.call(["taskkill", "/F", "/T", "/PID", str(proc.pid)])
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+class ProcessSupervisor:
+    def __init__(self, exe: Path, params: list[str], auto_restart: bool = False,
+                 interval: float = PROC_SAMPLE_INTERVAL,
+                 on_event: Callable[[str], None] | None = None,
+                 affinity: set[int] | None = None, nice: int = 0):
+        self.exe = exe
+        self.params = params
+        self.auto_restart = auto_restart
+        self.affinity = affinity
+        self.nice = nice
+        self.interval = interval
+        self.on_event = on_event
+        self.process: subprocess.Popen | None = None
+        self.history: deque[ProcessSample] = deque(maxlen=PROC_HISTORY_LIMIT)
+        self.restarts = 0
+        self.last_exit: int | None = None
+        self._started = 0.0
+        self._cpu_prev: tuple[float, int] | None = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._spawn_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return bool(self.process and self.process.poll() is None)
+
+    @property
+    def uptime(self) -> float:
+        return time.monotonic() - self._started if self.running else 0.0
+
+    def start(self) -> subprocess.Popen:
+        self._spawn()
+        threading.Thread(target=self._run, daemon=True).start()
+        return self.process
+
+    def stop(self) -> None:
+        with self._spawn_lock:
+            self._stopping.set()
+            proc = self.process
+        if proc:
+            try:
+                _terminate_process(proc)
+            except Exception as e:
+                logging.error(f"Could not kill game process: {e}")
+
+    def samples(self) -> list[ProcessSample]:
+        with self._lock:
+            return list(self.history)
+
+    def export_csv(self, dest: Path) -> int:
+        rows = self.samples()
+        with open(dest, "w", newline="", encoding="utf-8") as fh:
+            w = csv.writer(fh)
+            w.writerow(["timestamp", "pid", "uptime_s", "cpu_percent", "rss_bytes"])
+            for smp in rows:
+                w.writerow([
+                    datetime.datetime.fromtimestamp(smp.time).strftime("%Y-%m-%d %H:%M:%S"),
+                    smp.pid, round(smp.uptime, 1), round(smp.cpu_percent, 1), smp.rss_bytes,
+                ])
+        return len(rows)
+
+    def _spawn(self) -> None:
+        self.process = subprocess.Popen([str(self.exe)] + self.params,
+                                        cwd=str(self.exe.parent),
+                                        creationflags=_priority_creationflags(self.nice))
+        self._started = time.monotonic()
+        self._cpu_prev = None
+        pid = self.process.pid
+        if self.affinity and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(pid, self.affinity)
+            except OSError as e:
+                logging.warning(f"Could not pin PID {pid} to CPUs {sorted(self.affinity)}: {e}")
+        if self.nice and hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, self.nice)
+            except OSError as e:
+                logging.warning(f"Could not set nice {self.nice} for PID {pid}: {e}")
+
+    def _emit(self, msg: str) -> None:
+        logging.info(msg)
+        if self.on_event:
+            self.on_event(msg)
+
+    def _sample(self) -> None:
+        proc = self.process
+        now = time.monotonic()
+        cpu, rss = 0.0, 0
+        stat_ = _read_proc_stat(proc.pid)
+        if stat_:
+            ticks, rss = stat_
+            if self._cpu_prev:
+                prev_t, prev_ticks = self._cpu_prev
+                if now > prev_t:
+                    cpu = (ticks - prev_ticks) / _CLK_TCK / (now - prev_t) * 100
+            self._cpu_prev = (now, ticks)
+        with self._lock:
+            self.history.append(ProcessSample(time.time(), proc.pid,
+                                              now - self._started, cpu, rss))
+
+    def _run(self) -> None:
+        backoff = RESTART_BACKOFF_BASE
+        while not self._stopping.is_set():
+            code = self.process.poll()
+            if code is None:
+                self._sample()
+                self._stopping.wait(self.interval)
+                continue
+            if self._stopping.is_set():
+                break
+            self.last_exit = code
+            uptime = time.monotonic() - self._started
+            if code == 0:
+                self._emit(f"Game exited normally after {uptime:.0f}s.")
+                break
+            if not self.auto_restart:
+                self._emit(f"Game crashed (exit code {code}) after {uptime:.0f}s.")
+                break
+            if uptime >= RESTART_STABLE_AFTER:
+                backoff = RESTART_BACKOFF_BASE
+            self._emit(f"Game crashed (exit code {code}) after {uptime:.0f}s, "
+                       f"restarting in {backoff:.0f}s.")
+            if self._stopping.wait(backoff):
+                break
+            backoff = min(backoff * 2, RESTART_BACKOFF_MAX)
+            try:
+                with self._spawn_lock:
+                    if self._stopping.is_set():
+                        break
+                    self._spawn()
+                self.restarts += 1
+            except Exception as e:
+                self._emit(f"Restart failed: {e}")
+                break
+
+class InstanceManager:
+    def __init__(self, on_event: Callable[[str, str], None] | None = None):
+        self.on_event = on_event
+        self._instances: dict[str, ProcessSupervisor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ProcessSupervisor | None:
+        with self._lock:
+            return self._instances.get(name)
+
+    def items(self) -> list[tuple[str, ProcessSupervisor]]:
+        with self._lock:
+            return list(self._instances.items())
+
+    def running(self) -> list[str]:
+        return [n for n, sup in self.items() if sup.running]
+
+    def launch(self, profile: Profile, params: list[str] | None = None,
+               auto_restart: bool | None = None) -> ProcessSupervisor:
+        exe = Path(profile.game_exe) if profile.game_exe else None
+        if not exe or not exe.exists():
+            raise FileNotFoundError(f"Profile '{profile.name}' has no valid game executable.")
+        if os.name != "nt":
+            exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+        self.stop([profile.name])
+        on_event = None
+        if self.on_event:
+            on_event = lambda msg, n=profile.name: self.on_event(n, msg)
+        sup = ProcessSupervisor(
+            exe, profile.launch_params() if params is None else params,
+            auto_restart=profile.auto_restart if auto_restart is None else auto_restart,
+            on_event=on_event,
+            affinity=_parse_cpu_list(profile.cpu_affinity) or None,
+            nice=profile.nice)
+        sup.start()
+        with self._lock:
+            self._instances[profile.name] = sup
+        return sup
+
+    def launch_many(self, profiles: list[Profile]) -> dict[str, Exception | None]:
+        if not profiles:
+            return {}
+        results: dict[str, Exception | None] = {}
+        with ThreadPoolExecutor(max_workers=min(len(profiles), 8)) as pool:
+            futures = {pool.submit(self.launch, p): p.name for p in profiles}
+            for fut, name in futures.items():
+                exc = fut.exception()
+                results[name] = exc
+                if exc:
+                    logging.error(f"Launch failed for profile '{name}': {exc}")
+        return results
+
+    def stop(self, names: list[str]) -> None:
+        with self._lock:
+            sups = [self._instances.pop(n) for n in names if n in self._instances]
+        if len(sups) == 1:
+            sups[0].stop()
+        elif sups:
+            with ThreadPoolExecutor(max_workers=min(len(sups), 8)) as pool:
+                list(pool.map(ProcessSupervisor.stop, sups))
+
+    def stop_all(self) -> None:
+        self.stop([n for n, _ in self.items()])
+
+    def rename(self, old: str, new: str) -> None:
+        with self._lock:
+            if old in self._instances:
+                self._instances[new] = self._instances.pop(old)
+
+def is_bundle(path: Path) -> bool:
+    return path.name.lower().endswith(BUNDLE_SUFFIXES)
+
+def _bundle_pk3_name(member: str) -> str | None:
+    name = member.replace("\\", "/").rsplit("/", 1)[-1]
+    if not name.lower().endswith(".pk3") or name.startswith("."):
+        return None
+    return name
+
+def _iter_bundle_pk3s(bundle: Path):
+    lower = bundle.name.lower()
+    if lower.endswith(".zip"):
+        with zipfile.ZipFile(bundle) as zf:
+            for info in zf.infolist():
+                name = None if info.is_dir() else _bundle_pk3_name(info.filename)
+                if name:
+                    yield name, zf.open(info)
+    elif lower.endswith(".7z"):
+        try:
+            import py7zr
+        except ImportError:
+            raise ValueError("7z bundles need the optional 'py7zr' package.")
+        with py7zr.SevenZipFile(bundle) as sz:
+            targets = [n for n in sz.getnames() if _bundle_pk3_name(n)]
+            for member, data in sz.read(targets).items():
+                yield _bundle_pk3_name(member), data
+    else:
+        import tarfile
+        with tarfile.open(bundle, "r|*") as tar:
+            for m in tar:
+                name = _bundle_pk3_name(m.name) if m.isfile() else None
+                if name:
+                    yield name, tar.extractfile(m)
+
+def _safe_member_path(dest: Path, name: str) -> Path:
+    dest_r = dest.resolve()
+    target = (dest_r / name).resolve()
+    if not target.is_relative_to(dest_r):
+        raise ValueError(f"Unsafe path in archive: {name}")
+    return target
+
+def _safe_extract_tar(tar: tarfile.TarFile, dest: Path) -> None:
+    for m in tar.getmembers():
+        _safe_member_path(dest, m.name)
+    tar.extractall(dest, filter="data")
+
+def _safe_extract_zip(zf: zipfile.ZipFile, dest: Path) -> None:
+    for m in zf.infolist():
+        _safe_member_path(dest, m.filename)
+    zf.extractall(dest)